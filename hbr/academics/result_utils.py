@@ -1,356 +1,220 @@
-import pdfkit
+import re
+from django.core.cache import cache
 from django.db.models import Sum
+from django.template.loader import render_to_string
+from base.pdf_render_utils import render_merged_pdf, render_pdf, submit_pdf
 from .models import ExamResult
 from decouple import config
 
-
-def generate_marksheet_html(student, exam, results):
-    """Generate HTML content for marksheet certificate PDF"""
-    # Calculate totals
+MARKSHEET_PDF_OPTIONS = {
+    "page-size": "A4",
+    "margin-top": "0.5in",
+    "margin-right": "0.5in",
+    "margin-bottom": "0.5in",
+    "margin-left": "0.5in",
+}
+
+PASS_PERCENTAGE = 33
+GRADE_THRESHOLDS = (
+    (91, "A+"),
+    (81, "A"),
+    (71, "B+"),
+    (61, "B"),
+    (51, "C+"),
+    (41, "C"),
+    (33, "D"),
+)
+
+# Batch progress lives in the cache so the page can poll it while the
+# download streams; keep it long enough for the largest classes
+BATCH_PROGRESS_TIMEOUT = 60 * 30
+BATCH_TOKEN_RE = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+
+def get_overall_grade(percentage):
+    """Letter grade for an overall percentage"""
+    for threshold, grade in GRADE_THRESHOLDS:
+        if percentage >= threshold:
+            return grade
+    return "F"
+
+
+def summarize_results(results):
+    """Total, obtained and percentage over a student's subject results"""
     total_marks = sum(float(r.total_marks) for r in results)
     obtained_marks = sum(float(r.marks_obtained or 0) for r in results)
-    percentage = (obtained_marks / total_marks * 100) if total_marks > 0 else 0
+    return {
+        "total_marks": total_marks,
+        "obtained_marks": obtained_marks,
+        "percentage": (obtained_marks / total_marks * 100) if total_marks > 0 else 0,
+    }
 
-    # Determine grade
-    if percentage >= 91:
-        grade = "A+"
-    elif percentage >= 81:
-        grade = "A"
-    elif percentage >= 71:
-        grade = "B+"
-    elif percentage >= 61:
-        grade = "B"
-    elif percentage >= 51:
-        grade = "C+"
-    elif percentage >= 41:
-        grade = "C"
-    elif percentage >= 33:
-        grade = "D"
-    else:
-        grade = "F"
-
-    result_status = "Pass" if percentage >= 33 else "Fail"
-
-    html = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="utf-8">
-        <title>Marksheet - {student.user.get_full_name()}</title>
-        <style>
-            body {{
-                font-family: Arial, sans-serif;
-                margin: 0;
-                padding: 20px;
-                line-height: 1.6;
-            }}
-            .header {{
-                text-align: center;
-                border: 3px solid #333;
-                padding: 20px;
-                margin-bottom: 30px;
-            }}
-            .school-name {{
-                font-size: 28px;
-                font-weight: bold;
-                margin-bottom: 10px;
-            }}
-            .certificate-title {{
-                font-size: 24px;
-                font-weight: bold;
-                margin-bottom: 10px;
-            }}
-            .session-info {{
-                font-size: 16px;
-                margin-bottom: 10px;
-            }}
-            .student-details {{
-                margin-bottom: 30px;
-                display: grid;
-                grid-template-columns: 1fr 1fr;
-                gap: 10px;
-            }}
-            .detail-row {{
-                display: flex;
-            }}
-            .detail-label {{
-                font-weight: bold;
-                width: 150px;
-            }}
-            table {{
-                width: 100%;
-                border-collapse: collapse;
-                margin-bottom: 30px;
-            }}
-            th, td {{
-                border: 1px solid #333;
-                padding: 8px;
-                text-align: center;
-            }}
-            th {{
-                background-color: #f0f0f0;
-                font-weight: bold;
-            }}
-            .summary {{
-                background: #f9f9f9;
-                padding: 15px;
-                border-radius: 5px;
-                margin-bottom: 30px;
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-                gap: 15px;
-            }}
-            .footer {{
-                margin-top: 50px;
-                display: flex;
-                justify-content: space-between;
-            }}
-            .signature {{
-                width: 200px;
-                text-align: center;
-                border-top: 1px solid #333;
-                padding-top: 10px;
-            }}
-        </style>
-    </head>
-    <body>
-        <div class="header">
-            <div class="school-name">{config('SCHOOL_NAME', default='SCHOOL')}</div>
-            <div class="certificate-title">MARKSHEET</div>
-            <div class="session-info">Academic Session: {exam.term.academic_session.year}</div>
-        </div>
-
-        <div class="student-details">
-            <div class="detail-row">
-                <span class="detail-label">Student Name:</span>
-                <span>{student.user.get_full_name()}</span>
-            </div>
-            <div class="detail-row">
-                <span class="detail-label">Roll No:</span>
-                <span>{student.roll_no}</span>
-            </div>
-            <div class="detail-row">
-                <span class="detail-label">Admission No:</span>
-                <span>{student.admission_no}</span>
-            </div>
-            <div class="detail-row">
-                <span class="detail-label">Class:</span>
-                <span>{student.classroom}</span>
-            </div>
-            <div class="detail-row">
-                <span class="detail-label">Father's Name:</span>
-                <span>{student.father_name}</span>
-            </div>
-            <div class="detail-row">
-                <span class="detail-label">Mother's Name:</span>
-                <span>{student.mother_name}</span>
-            </div>
-            <div class="detail-row">
-                <span class="detail-label">Date of Birth:</span>
-                <span>{student.dob.strftime('%d/%m/%Y') if student.dob else 'N/A'}</span>
-            </div>
-        </div>
-
-        <table>
-            <thead>
-                <tr>
-                    <th>S.No.</th>
-                    <th>Subject</th>
-                    <th>Max Marks</th>
-                    <th>Min Marks</th>
-                    <th>Marks Obtained</th>
-                    <th>Grade</th>
-                </tr>
-            </thead>
-            <tbody>
-    """
 
-    for i, result in enumerate(results, 1):
-        html += f"""
-                <tr>
-                    <td>{i}</td>
-                    <td>{result.subject}</td>
-                    <td>{result.total_marks}</td>
-                    <td>34</td>
-                    <td>{result.marks_obtained or 'N/A'}</td>
-                    <td>{result.grade or 'N/A'}</td>
-                </tr>
-        """
-
-    html += f"""
-            </tbody>
-        </table>
-
-        <div class="summary">
-            <div><strong>Total Marks:</strong> {total_marks:.0f}</div>
-            <div><strong>Obtained Marks:</strong> {obtained_marks:.0f}</div>
-            <div><strong>Percentage:</strong> {percentage:.2f}%</div>
-            <div><strong>Grade:</strong> {grade}</div>
-            <div><strong>Result:</strong> {result_status}</div>
-        </div>
-
-        <div class="footer">
-            <div class="signature">
-                <div>Checked By</div>
-            </div>
-            <div class="signature">
-                <div>Controller of Exam</div>
-            </div>
-            <div class="signature">
-                <div>Principal</div>
-            </div>
-        </div>
-    </body>
-    </html>
-    """
+def subject_rows(results):
+    """Display values of each subject result, for the document templates"""
+    return [
+        {
+            "subject": result.subject,
+            "total_marks": result.total_marks,
+            "marks_obtained": result.marks_obtained or "N/A",
+            "grade": result.grade or "N/A",
+        }
+        for result in results
+    ]
+
 
-    return html
+def generate_marksheet_html(student, exam, results, summary=None):
+    """Generate HTML content for marksheet certificate PDF"""
+    # Calculate totals, unless the caller already aggregated them
+    summary = summary or summarize_results(results)
+    percentage = summary["percentage"]
+
+    return render_to_string(
+        "academics/documents/marksheet.html",
+        {
+            "school_name": config("SCHOOL_NAME", default="SCHOOL"),
+            "session": exam.term.academic_session.year,
+            "student_name": student.user.get_full_name(),
+            "details": [
+                ("Student Name", student.user.get_full_name()),
+                ("Roll No", student.roll_no),
+                ("Admission No", student.admission_no),
+                ("Class", student.classroom),
+                ("Father's Name", student.father_name),
+                ("Mother's Name", student.mother_name),
+                (
+                    "Date of Birth",
+                    student.dob.strftime("%d/%m/%Y") if student.dob else "N/A",
+                ),
+            ],
+            "rows": subject_rows(results),
+            "total_marks": f"{summary['total_marks']:.0f}",
+            "obtained_marks": f"{summary['obtained_marks']:.0f}",
+            "percentage": f"{percentage:.2f}",
+            "grade": get_overall_grade(percentage),
+            "result_status": "Pass" if percentage >= PASS_PERCENTAGE else "Fail",
+            "signatories": ("Checked By", "Controller of Exam", "Principal"),
+        },
+    )
 
 
 def generate_annual_result_sheet_html(classroom, exam, results_by_student):
     """Generate HTML content for annual result sheet PDF"""
-    html = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="utf-8">
-        <title>Annual Result Sheet - {classroom}</title>
-        <style>
-            body {{
-                font-family: Arial, sans-serif;
-                margin: 0;
-                padding: 20px;
-                line-height: 1.6;
-            }}
-            .header {{
-                text-align: center;
-                border: 3px solid #333;
-                padding: 20px;
-                margin-bottom: 30px;
-            }}
-            .school-name {{
-                font-size: 28px;
-                font-weight: bold;
-                margin-bottom: 10px;
-            }}
-            .title {{
-                font-size: 24px;
-                font-weight: bold;
-                margin-bottom: 10px;
-            }}
-            .session-info {{
-                font-size: 16px;
-                margin-bottom: 10px;
-            }}
-            table {{
-                width: 100%;
-                border-collapse: collapse;
-                margin-bottom: 30px;
-            }}
-            th, td {{
-                border: 1px solid #333;
-                padding: 6px;
-                text-align: center;
-                font-size: 12px;
-            }}
-            th {{
-                background-color: #f0f0f0;
-                font-weight: bold;
-            }}
-            .footer {{
-                margin-top: 50px;
-                display: flex;
-                justify-content: space-between;
-            }}
-            .signature {{
-                width: 200px;
-                text-align: center;
-                border-top: 1px solid #333;
-                padding-top: 10px;
-            }}
-        </style>
-    </head>
-    <body>
-        <div class="header">
-            <div class="school-name">{config('SCHOOL_NAME', default='SCHOOL')}</div>
-            <div class="title">ANNUAL RESULT SHEET</div>
-            <div class="session-info">Class: {classroom} | Academic Session: {exam.term.academic_session.year}</div>
-        </div>
-
-        <table>
-            <thead>
-                <tr>
-                    <th>S.No.</th>
-                    <th>Admission / Roll No.</th>
-                    <th>Student Name</th>
-                    <th>Total Marks</th>
-                    <th>Obtained Marks</th>
-                    <th>Result</th>
-                    <th>Percentage</th>
-                    <th>Rank</th>
-                    <th>Signature of Parents</th>
-                </tr>
-            </thead>
-            <tbody>
-    """
-
     # Sort students by total marks (descending) for ranking
     sorted_students = sorted(
         results_by_student.items(), key=lambda x: x[1]["obtained_marks"], reverse=True
     )
 
-    for rank, (student, data) in enumerate(sorted_students, 1):
-        result_status = "Pass" if data["percentage"] >= 33 else "Fail"
-        html += f"""
-                <tr>
-                    <td>{rank}</td>
-                    <td>{student.roll_no}</td>
-                    <td>{student.user.get_full_name()}</td>
-                    <td>{data['total_marks']:.0f}</td>
-                    <td>{data['obtained_marks']:.0f}</td>
-                    <td>{result_status}</td>
-                    <td>{data['percentage']:.1f}%</td>
-                    <td>{rank}</td>
-                    <td></td>
-                </tr>
-        """
-
-    html += """
-            </tbody>
-        </table>
-
-        <div class="footer">
-            <div class="signature">
-                <div>Checked By</div>
-            </div>
-            <div class="signature">
-                <div>Controller of Exam</div>
-            </div>
-            <div class="signature">
-                <div>Principal</div>
-            </div>
-        </div>
-    </body>
-    </html>
-    """
+    return render_to_string(
+        "academics/documents/annual_result_sheet.html",
+        {
+            "school_name": config("SCHOOL_NAME", default="SCHOOL"),
+            "classroom": classroom,
+            "session": exam.term.academic_session.year,
+            "rows": [
+                {
+                    "roll_no": student.roll_no,
+                    "name": student.user.get_full_name(),
+                    "total_marks": f"{data['total_marks']:.0f}",
+                    "obtained_marks": f"{data['obtained_marks']:.0f}",
+                    "result": (
+                        "Pass" if data["percentage"] >= PASS_PERCENTAGE else "Fail"
+                    ),
+                    "percentage": f"{data['percentage']:.1f}",
+                }
+                for student, data in sorted_students
+            ],
+            "signatories": ("Checked By", "Controller of Exam", "Principal"),
+        },
+    )
 
-    return html
+
+def generate_result_declaration_html(exam, classroom, results):
+    """Generate HTML content for result declaration PDF"""
+    # Group results by student
+    students_data = {}
+    for result in results:
+        students_data.setdefault(result.student.id, []).append(result)
+
+    rows = []
+    for student_results in students_data.values():
+        student = student_results[0].student
+        summary = summarize_results(student_results)
+        if summary["total_marks"] > 0:
+            result_status = (
+                "Pass" if summary["percentage"] >= PASS_PERCENTAGE else "Fail"
+            )
+        else:
+            result_status = "N/A"
+        rows.append(
+            {
+                "roll_no": student.roll_no,
+                "name": student.user.get_full_name(),
+                "total_marks": f"{summary['total_marks']:.0f}",
+                "obtained_marks": f"{summary['obtained_marks']:.0f}",
+                "percentage": f"{summary['percentage']:.2f}",
+                "result": result_status,
+                "result_class": "pass" if result_status == "Pass" else "fail",
+            }
+        )
+
+    # Sort by roll number
+    rows.sort(key=lambda row: row["roll_no"])
+
+    return render_to_string(
+        "academics/documents/result_declaration.html",
+        {
+            "school_name": config("SCHOOL_NAME", default="SCHOOL"),
+            "exam_name": exam.name,
+            "classroom": f"{classroom.grade} {classroom.section or ''}",
+            "session": exam.term.academic_session.year,
+            "rows": rows,
+            "signatories": ("Checked By", "Controller of Exam", "Principal"),
+        },
+    )
+
+
+def generate_individual_result_html(student, exam, results=None):
+    """Generate HTML content for individual student result PDF"""
+    # Get student's results for this exam
+    if results is None:
+        results = ExamResult.objects.filter(
+            student=student, exam=exam, status=ExamResult.Status.PUBLISHED
+        ).order_by("subject")
+    summary = summarize_results(results)
+
+    return render_to_string(
+        "academics/documents/individual_result.html",
+        {
+            "school_name": config("SCHOOL_NAME", default="SCHOOL"),
+            "exam_name": exam.name,
+            "term": exam.term.name,
+            "session": exam.term.academic_session.year,
+            "student_name": student.user.get_full_name(),
+            "details": [
+                ("Student Name", student.user.get_full_name()),
+                ("Roll No", student.roll_no),
+                ("Admission No", student.admission_no),
+                ("Class", student.classroom),
+                ("Father's Name", student.father_name),
+                ("Mother's Name", student.mother_name),
+            ],
+            "rows": subject_rows(results),
+            "total_marks": f"{summary['total_marks']:.0f}",
+            "obtained_marks": f"{summary['obtained_marks']:.0f}",
+            "percentage": f"{summary['percentage']:.2f}",
+            "result_status": (
+                "Pass" if summary["percentage"] >= PASS_PERCENTAGE else "Fail"
+            ),
+            "signatories": ("Class Teacher", "Principal"),
+        },
+    )
 
 
 def generate_marksheet_pdf(student, exam, results):
     """Generate marksheet PDF for a student"""
     html_content = generate_marksheet_html(student, exam, results)
-    pdf_buffer = pdfkit.from_string(
-        html_content,
-        False,
-        options={
-            "page-size": "A4",
-            "margin-top": "0.5in",
-            "margin-right": "0.5in",
-            "margin-bottom": "0.5in",
-            "margin-left": "0.5in",
-        },
-    )
+    pdf_buffer = render_pdf(html_content, options=MARKSHEET_PDF_OPTIONS)
     return pdf_buffer
 
 
@@ -359,9 +223,8 @@ def generate_annual_result_sheet_pdf(classroom, exam, results_by_student):
     html_content = generate_annual_result_sheet_html(
         classroom, exam, results_by_student
     )
-    pdf_buffer = pdfkit.from_string(
+    pdf_buffer = render_pdf(
         html_content,
-        False,
         options={
             "page-size": "A4",
             "margin-top": "0.5in",
@@ -398,13 +261,99 @@ def calculate_student_results(student, exam):
 
 
 def get_class_results_summary(classroom, exam):
-    """Get results summary for all students in a class for an exam"""
-    students = classroom.student.all()
+    """Get results summary for all students in a class for an exam.
+
+    Totals come from one aggregate query and the subject rows from one more,
+    instead of a pair of queries per student. Students are ordered by roll
+    number and their results by subject.
+    """
+    published = ExamResult.objects.filter(
+        student__classroom=classroom,
+        exam=exam,
+        status=ExamResult.Status.PUBLISHED,
+    )
+    totals = {
+        row["student"]: row
+        for row in published.values("student").annotate(
+            total=Sum("total_marks"), obtained=Sum("marks_obtained")
+        )
+    }
+
     results_by_student = {}
+    rows = published.select_related("student__user", "student__classroom").order_by(
+        "student__roll_no", "student_id", "subject"
+    )
+    for result in rows:
+        student = result.student
+        if student.id not in results_by_student:
+            row = totals[student.id]
+            total_marks = float(row["total"] or 0)
+            obtained_marks = float(row["obtained"] or 0)
+            results_by_student[student.id] = {
+                "student": student,
+                "total_marks": total_marks,
+                "obtained_marks": obtained_marks,
+                "percentage": (
+                    (obtained_marks / total_marks * 100) if total_marks > 0 else 0
+                ),
+                "results": [],
+            }
+        results_by_student[student.id]["results"].append(result)
+
+    return {data.pop("student"): data for data in results_by_student.values()}
+
+
+def batch_progress_key(user_id, token):
+    return f"batch-progress:{user_id}:{token}"
+
 
-    for student in students:
-        student_results = calculate_student_results(student, exam)
-        if student_results:
-            results_by_student[student] = student_results
+def set_batch_progress(user_id, token, done, total):
+    if token:
+        cache.set(
+            batch_progress_key(user_id, token),
+            {"done": done, "total": total},
+            BATCH_PROGRESS_TIMEOUT,
+        )
 
-    return results_by_student
+
+def get_batch_progress(user_id, token):
+    return cache.get(batch_progress_key(user_id, token))
+
+
+def iter_class_marksheet_pdfs(exam, results_by_student, progress=None):
+    """Yield (student, PDF bytes) in order, rendering on the renderer pool.
+
+    Every marksheet is queued up front so the pool's workers stay busy while
+    earlier ones are sent; ``progress`` is called with the number finished.
+    """
+    jobs = [
+        (
+            student,
+            submit_pdf(
+                generate_marksheet_html(student, exam, data["results"], data),
+                MARKSHEET_PDF_OPTIONS,
+            ),
+        )
+        for student, data in results_by_student.items()
+    ]
+    try:
+        for done, (student, future) in enumerate(jobs, 1):
+            pdf = future.result()
+            if progress:
+                progress(done)
+            yield student, pdf
+    finally:
+        # Stop queued renders if the client goes away mid-download
+        for _, future in jobs:
+            future.cancel()
+
+
+def generate_class_marksheets_pdf(exam, results_by_student):
+    """All of a class's marksheets back to back in one PDF"""
+    return render_merged_pdf(
+        [
+            generate_marksheet_html(student, exam, data["results"], data)
+            for student, data in results_by_student.items()
+        ],
+        MARKSHEET_PDF_OPTIONS,
+    )
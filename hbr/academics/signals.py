@@ -0,0 +1,18 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from base.pdf_cache_utils import invalidate_pdf_cache
+from .models import Exam, ExamSchedule
+
+
+@receiver(post_save, sender=Exam)
+@receiver(post_delete, sender=Exam)
+def purge_exam_pdfs(sender, instance, **kwargs):
+    """Drop cached admit cards and timetables for a changed exam"""
+    invalidate_pdf_cache(Exam, instance.pk)
+
+
+@receiver(post_save, sender=ExamSchedule)
+@receiver(post_delete, sender=ExamSchedule)
+def purge_schedule_pdfs(sender, instance, **kwargs):
+    """Drop cached timetables when an exam's schedule changes"""
+    invalidate_pdf_cache(Exam, instance.exam_id)
@@ -61,6 +61,11 @@ urlpatterns = [
         views.admin_exam_management,
         name="admin_exam_management",
     ),
+    path(
+        "admin/class-admit-cards/<int:exam_id>/",
+        views.admin_class_admit_cards,
+        name="admin_class_admit_cards",
+    ),
     path("admin/create-exam/", views.admin_create_exam, name="admin_create_exam"),
     path(
         "admin/edit-exam/<int:exam_id>/", views.admin_edit_exam, name="admin_edit_exam"
@@ -149,6 +154,16 @@ urlpatterns = [
         views.student_marksheets,
         name="student_marksheets",
     ),
+    path(
+        "generate-class-marksheets/<int:classroom_id>/",
+        views.generate_class_marksheets,
+        name="generate_class_marksheets",
+    ),
+    path(
+        "batch-progress/<str:token>/",
+        views.batch_progress,
+        name="batch_progress",
+    ),
     path(
         "get-students-for-marksheet/<int:classroom_id>/",
         views.get_students_for_marksheet,
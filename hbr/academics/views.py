@@ -1,16 +1,29 @@
 from decimal import Decimal
-from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.http import (
+    FileResponse,
+    HttpRequest,
+    HttpResponse,
+    JsonResponse,
+    StreamingHttpResponse,
+)
 from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.contrib.contenttypes.models import ContentType
 from django.utils import timezone
+from django.utils.http import content_disposition_header
 from django.db.models import Q
 import csv
 import io
 import json
 import pandas as pd
 from datetime import date
+from base.file_utils import stream_zip
+from base.pdf_cache_utils import (
+    get_or_render_pdf,
+    model_fingerprint,
+    user_fingerprint,
+)
 from base.views import get_user_role
 from .models import (
     AcademicSession,
@@ -23,19 +36,30 @@ from .models import (
 from students.models import Student, Classroom
 from teachers.models import Teacher
 from notices.models import Notice
-from dashboard.pdf_utils import (
+from dashboard.models import ActivityEvent
+from dashboard.activity_utils import record_activities
+from base.pdf import (
+    generate_admit_card_pdf,
+    generate_admit_cards_pdf,
     generate_exam_timetable_pdf,
-    generate_admit_card_pdf as dashboard_generate_admit_card_pdf,
 )
+from base.pdf.documents import get_admit_card_schedule
 from .result_utils import (
+    BATCH_TOKEN_RE,
     generate_annual_result_sheet_html,
+    generate_class_marksheets_pdf,
+    generate_individual_result_html,
     generate_marksheet_html,
     generate_marksheet_pdf,
+    generate_result_declaration_html,
+    get_batch_progress,
+    get_class_results_summary,
+    iter_class_marksheet_pdfs,
+    set_batch_progress,
 
 )
 
-import pdfkit
-from decouple import config
+from base.pdf_render_utils import render_pdf, submit_pdf
 
 
 def get_current_session(request=None):
@@ -218,10 +242,24 @@ def download_exam_timetable(request: HttpRequest, exam_id: int):
         ]
 
         # Get student info
-        student = Student.objects.get(user=request.user)
+        student = Student.objects.select_related("user", "classroom").get(
+            user=request.user
+        )
 
-        # Generate PDF
-        buffer = generate_exam_timetable_pdf(exam, schedule_data, student)
+        # Generate PDF, or reuse the cached copy for unchanged inputs
+        buffer = get_or_render_pdf(
+            "exam_timetable",
+            [
+                model_fingerprint(exam),
+                schedule_data,
+                model_fingerprint(student),
+                user_fingerprint(student.user),
+                model_fingerprint(student.classroom),
+                date.today(),  # printed as the generation date
+            ],
+            [exam, student],
+            lambda: generate_exam_timetable_pdf(exam, schedule_data, student),
+        )
 
         # Return PDF response
         response = HttpResponse(buffer, content_type="application/pdf")
@@ -240,13 +278,33 @@ def download_admit_card(request: HttpRequest, exam_id: int):
         return HttpResponse("Access denied", status=403)
 
     try:
-        exam = Exam.objects.get(
+        exam = Exam.objects.select_related("term__academic_session").get(
             id=exam_id, is_yearly_final=True, admit_card_available=True
         )
-        student = Student.objects.get(user=request.user)
+        student = Student.objects.select_related("user", "classroom").get(
+            user=request.user
+        )
 
-        # Generate admit card PDF (for now, we'll use a simple admit card format)
-        buffer = dashboard_generate_admit_card_pdf(exam, student)
+        # Generate admit card PDF (for now, we'll use a simple admit card format),
+        # or reuse the cached copy for unchanged inputs
+        buffer = get_or_render_pdf(
+            "admit_card",
+            [
+                model_fingerprint(exam),
+                model_fingerprint(exam.term),
+                model_fingerprint(exam.term.academic_session),
+                [
+                    model_fingerprint(item)
+                    for item in ExamSchedule.objects.filter(exam=exam)
+                ],
+                model_fingerprint(student),
+                user_fingerprint(student.user),
+                model_fingerprint(student.classroom),
+                date.today(),  # printed as the issue date
+            ],
+            [exam, student],
+            lambda: generate_admit_card_pdf(exam, student),
+        )
 
         # Return PDF response
         response = HttpResponse(buffer, content_type="application/pdf")
@@ -262,6 +320,68 @@ def download_admit_card(request: HttpRequest, exam_id: int):
         return HttpResponse("Student profile not found", status=404)
 
 
+@login_required
+def admin_class_admit_cards(request: HttpRequest, exam_id: int):
+    role = get_user_role(request.user)
+    if role != "Admin":
+        return HttpResponse("Access denied", status=403)
+
+    try:
+        exam = Exam.objects.get(id=exam_id, is_yearly_final=True)
+    except Exam.DoesNotExist:
+        return HttpResponse("Admit cards are only issued for final exams", status=404)
+
+    # A single classroom, or every section of a grade
+    classroom_id = request.GET.get("classroom")
+    grade = request.GET.get("grade")
+    if classroom_id:
+        try:
+            classroom = Classroom.objects.get(id=classroom_id)
+        except (Classroom.DoesNotExist, ValueError):
+            return HttpResponse("Classroom not found", status=404)
+        students = Student.objects.filter(classroom=classroom)
+        label = str(classroom)
+    elif grade:
+        students = Student.objects.filter(classroom__grade=grade)
+        label = f"Grade {grade}"
+    else:
+        return HttpResponse("Choose a classroom or grade", status=400)
+
+    students = list(
+        students.select_related("user", "classroom").order_by(
+            "classroom__grade", "classroom__section", "roll_no"
+        )
+    )
+    if not students:
+        return HttpResponse("No students found", status=404)
+    schedule = get_admit_card_schedule(exam)
+    basename = f"admit_cards_{exam.name}_{label}".replace(" ", "_")
+
+    if request.GET.get("format") == "zip":
+        # One file per student, each rendered as the archive streams out
+        entries = (
+            (
+                f"{student.classroom}_{student.roll_no}.pdf".replace(" ", "_"),
+                generate_admit_card_pdf(exam, student, schedule).getvalue(),
+            )
+            for student in students
+        )
+        response = StreamingHttpResponse(
+            stream_zip(entries), content_type="application/zip"
+        )
+        response["Content-Disposition"] = content_disposition_header(
+            True, f"{basename}.zip"
+        )
+        return response
+
+    return FileResponse(
+        generate_admit_cards_pdf(exam, students, schedule),
+        as_attachment=True,
+        filename=f"{basename}.pdf",
+        content_type="application/pdf",
+    )
+
+
 @login_required
 def teacher_exam_marking(request: HttpRequest):
     role = get_user_role(request.user)
@@ -813,6 +933,22 @@ def save_exam_results(request: HttpRequest, exam_id: int, classroom_id: int):
 
                 result.save()
 
+        if action in ("commit", "lock"):
+            student_ids = [student_data["student_id"] for student_data in students_data]
+            record_activities(
+                {
+                    "event_type": ActivityEvent.EventType.RESULT,
+                    "message": f"Result entered for {exam.name}",
+                    "audience_message": f"Result available for {exam.name}",
+                    "actor": request.user,
+                    "audience": student.user,
+                    "status": "completed",
+                }
+                for student in Student.objects.filter(
+                    id__in=student_ids, classroom=classroom
+                ).select_related("user")
+            )
+
         # If action was "lock", create system alert for admin
         if action == "lock":
             Notice.objects.create(
@@ -843,9 +979,12 @@ def admin_exam_management(request: HttpRequest):
         .order_by("term__start_date", "name")
     )
 
+    classrooms = Classroom.objects.order_by("grade", "section")
+
     context = {
         "terms": terms,
         "exams": exams,
+        "classrooms": classrooms,
         "current_session": current_session,
     }
     return render(request, "academics/admin_exam_management.html", context)
@@ -1121,11 +1260,14 @@ def admin_publish_results(request: HttpRequest, exam_id: int):
     try:
         exam = Exam.objects.get(id=exam_id)
 
-        # Get all results that will be published
-        results_to_publish = ExamResult.objects.filter(
-            exam=exam,
-            status__in=[ExamResult.Status.SUBMITTED, ExamResult.Status.LOCKED],
-        ).select_related("student")
+        # Get all results that will be published (evaluated before the
+        # status update below, which would otherwise empty the queryset)
+        results_to_publish = list(
+            ExamResult.objects.filter(
+                exam=exam,
+                status__in=[ExamResult.Status.SUBMITTED, ExamResult.Status.LOCKED],
+            ).select_related("student")
+        )
 
         # Update all results for this exam to PUBLISHED
         updated_count = ExamResult.objects.filter(exam=exam).update(
@@ -1136,13 +1278,15 @@ def admin_publish_results(request: HttpRequest, exam_id: int):
         from students.models import Document
         from django.core.files.base import ContentFile
 
+        # Queue every PDF on the render pool first so they render concurrently
+        # while the rest are still being prepared
+        jobs = []
         for result in results_to_publish:
             try:
                 # Generate individual result PDF for the student
                 html_content = generate_individual_result_html(result.student, exam)
-                pdf_buffer = pdfkit.from_string(
+                result_pdf = submit_pdf(
                     html_content,
-                    False,
                     options={
                         "page-size": "A4",
                         "margin-top": "1in",
@@ -1152,15 +1296,8 @@ def admin_publish_results(request: HttpRequest, exam_id: int):
                     },
                 )
 
-                # Create document record
-                filename = f"exam_result_{exam.name}_{result.student.roll_no}.pdf"
-                document = Document.objects.create(
-                    student=result.student,
-                    name=f"Exam Result - {exam.name}",
-                    file=ContentFile(pdf_buffer, name=filename),
-                )
-
                 # For final exams, create marksheet certificates for passed students
+                marksheet_pdf = None
                 if exam.is_yearly_final:
                     student_results = ExamResult.objects.filter(
                         student=result.student,
@@ -1178,24 +1315,12 @@ def admin_publish_results(request: HttpRequest, exam_id: int):
                     )
 
                     if percentage >= 33:  # Passed
-                        from students.models import Certificate, CertificateType
-
-                        # Get or create marksheet certificate type
-                        marksheet_type, created = CertificateType.objects.get_or_create(
-                            name="Marksheet",
-                            defaults={
-                                "description": "Final exam marksheet certificate",
-                                "is_active": True,
-                            },
-                        )
-
                         # Generate marksheet PDF
                         marksheet_html = generate_marksheet_html(
                             result.student, exam, student_results
                         )
-                        marksheet_pdf = pdfkit.from_string(
+                        marksheet_pdf = submit_pdf(
                             marksheet_html,
-                            False,
                             options={
                                 "page-size": "A4",
                                 "margin-top": "0.5in",
@@ -1204,17 +1329,46 @@ def admin_publish_results(request: HttpRequest, exam_id: int):
                                 "margin-left": "0.5in",
                             },
                         )
+                jobs.append((result, result_pdf, marksheet_pdf))
+            except Exception as e:
+                print(
+                    f"Error creating document for student {result.student.roll_no}: {e}"
+                )
 
-                        # Create certificate
-                        certificate = Certificate.objects.create(
-                            student=result.student,
-                            certificate_type=marksheet_type,
-                            status=Certificate.Status.APPROVED,
-                        )
+        for result, result_pdf, marksheet_pdf in jobs:
+            try:
+                # Create document record
+                filename = f"exam_result_{exam.name}_{result.student.roll_no}.pdf"
+                document = Document.objects.create(
+                    student=result.student,
+                    name=f"Exam Result - {exam.name}",
+                    file=ContentFile(result_pdf.result(), name=filename),
+                )
+
+                if marksheet_pdf is not None:
+                    from students.models import Certificate, CertificateType
 
-                        # Save the PDF file
-                        cert_filename = f"marksheet_{exam.term.academic_session.year}_{result.student.roll_no}.pdf"
-                        certificate.file.save(cert_filename, ContentFile(marksheet_pdf))
+                    # Get or create marksheet certificate type
+                    marksheet_type, created = CertificateType.objects.get_or_create(
+                        name="Marksheet",
+                        defaults={
+                            "description": "Final exam marksheet certificate",
+                            "is_active": True,
+                        },
+                    )
+
+                    # Create certificate
+                    certificate = Certificate.objects.create(
+                        student=result.student,
+                        certificate_type=marksheet_type,
+                        status=Certificate.Status.APPROVED,
+                    )
+
+                    # Save the PDF file
+                    cert_filename = f"marksheet_{exam.term.academic_session.year}_{result.student.roll_no}.pdf"
+                    certificate.file.save(
+                        cert_filename, ContentFile(marksheet_pdf.result())
+                    )
 
             except Exception as e:
                 # Log error but continue with other students
@@ -1439,7 +1593,7 @@ def declare_class_results(request: HttpRequest, exam_id: int, classroom_id: int)
                     ExamResult.Status.PUBLISHED,
                 ],
             )
-            .select_related("student")
+            .select_related("student__user")
             .order_by("student__roll_no", "subject")
         )
 
@@ -1452,7 +1606,7 @@ def declare_class_results(request: HttpRequest, exam_id: int, classroom_id: int)
         # Generate HTML content for PDF
         html_content = generate_result_declaration_html(exam, classroom, results)
 
-        # Generate PDF using pdfkit
+        # Generate PDF on the render pool
         pdf_options = {
             "page-size": "A4",
             "margin-top": "1in",
@@ -1461,7 +1615,7 @@ def declare_class_results(request: HttpRequest, exam_id: int, classroom_id: int)
             "margin-left": "1in",
         }
 
-        pdf_buffer = pdfkit.from_string(html_content, False, options=pdf_options)
+        pdf_buffer = render_pdf(html_content, options=pdf_options)
 
         # Return PDF response
         response = HttpResponse(pdf_buffer, content_type="application/pdf")
@@ -1512,12 +1666,13 @@ def generate_annual_result_sheet(request: HttpRequest, classroom_id: int):
             messages.error(request, "No final exams found for the current session.")
             return redirect("academics:annual_result_sheet")
 
-        # Get all students in the classroom
-        students = Student.objects.filter(classroom=classroom).order_by("roll_no")
+        # Totals of every student in the classroom for the latest final exam
+        exam = exams.select_related("term__academic_session").last()
+        results_by_student = get_class_results_summary(classroom, exam)
 
         # Generate HTML content
         html_content = generate_annual_result_sheet_html(
-            classroom, current_session, exams, students
+            classroom, exam, results_by_student
         )
 
         # Generate PDF
@@ -1530,7 +1685,7 @@ def generate_annual_result_sheet(request: HttpRequest, classroom_id: int):
             "margin-left": "0.5in",
         }
 
-        pdf_buffer = pdfkit.from_string(html_content, False, options=pdf_options)
+        pdf_buffer = render_pdf(html_content, options=pdf_options)
 
         # Return PDF response
         response = HttpResponse(pdf_buffer, content_type="application/pdf")
@@ -1544,315 +1699,6 @@ def generate_annual_result_sheet(request: HttpRequest, classroom_id: int):
         return redirect("academics:annual_result_sheet")
 
 
-def generate_result_declaration_html(exam, classroom, results):
-    """Generate HTML content for result declaration PDF"""
-    # Group results by student
-    students_data = {}
-    subjects = set()
-
-    for result in results:
-        student_id = result.student.id
-        if student_id not in students_data:
-            students_data[student_id] = {
-                "student": result.student,
-                "results": {},
-                "total_marks": 0,
-                "obtained_marks": 0,
-            }
-
-        students_data[student_id]["results"][result.subject] = result
-        students_data[student_id]["total_marks"] += float(result.total_marks)
-        if result.marks_obtained:
-            students_data[student_id]["obtained_marks"] += float(result.marks_obtained)
-        subjects.add(result.subject)
-
-    # Calculate percentages and determine results
-    students_list = list(students_data.values())
-    for student_data in students_list:
-        if student_data["total_marks"] > 0:
-            student_data["percentage"] = (
-                student_data["obtained_marks"] / student_data["total_marks"]
-            ) * 100
-            student_data["result"] = (
-                "Pass" if student_data["percentage"] >= 33 else "Fail"
-            )
-        else:
-            student_data["percentage"] = 0
-            student_data["result"] = "N/A"
-
-    # Sort by roll number
-    students_list.sort(key=lambda x: x["student"].roll_no)
-
-    html = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="utf-8">
-        <title>Result Declaration - {exam.name}</title>
-        <style>
-            body {{
-                font-family: Arial, sans-serif;
-                margin: 0;
-                padding: 20px;
-                line-height: 1.6;
-            }}
-            .header {{
-                text-align: center;
-                border-bottom: 2px solid #333;
-                padding-bottom: 20px;
-                margin-bottom: 30px;
-            }}
-            .school-name {{
-                font-size: 24px;
-                font-weight: bold;
-                margin-bottom: 10px;
-            }}
-            .exam-info {{
-                font-size: 18px;
-                margin-bottom: 10px;
-            }}
-            .class-info {{
-                font-size: 16px;
-                margin-bottom: 20px;
-            }}
-            table {{
-                width: 100%;
-                border-collapse: collapse;
-                margin-bottom: 30px;
-            }}
-            th, td {{
-                border: 1px solid #333;
-                padding: 8px;
-                text-align: left;
-            }}
-            th {{
-                background-color: #f0f0f0;
-                font-weight: bold;
-            }}
-            .text-center {{
-                text-align: center;
-            }}
-            .pass {{
-                color: green;
-            }}
-            .fail {{
-                color: red;
-            }}
-            .footer {{
-                margin-top: 50px;
-                display: flex;
-                justify-content: space-between;
-            }}
-            .signature {{
-                width: 200px;
-                text-align: center;
-                border-top: 1px solid #333;
-                padding-top: 10px;
-            }}
-        </style>
-    </head>
-    <body>
-        <div class="header">
-            <div class="school-name">{config('SCHOOL_NAME', default='SCHOOL')}</div>
-            <div class="exam-info">Result Declaration - {exam.name}</div>
-            <div class="class-info">Class: {classroom.grade} {classroom.section or ""} | Session: {exam.term.academic_session.year}</div>
-        </div>
-
-        <table>
-            <thead>
-                <tr>
-                    <th>S.No.</th>
-                    <th>Admission/Roll No.</th>
-                    <th>Student Name</th>
-                    <th>Total Marks</th>
-                    <th>Obtained Marks</th>
-                    <th>Percentage</th>
-                    <th>Result</th>
-                </tr>
-            </thead>
-            <tbody>
-    """
-
-    for i, student_data in enumerate(students_list, 1):
-        student = student_data["student"]
-        result_class = "pass" if student_data["result"] == "Pass" else "fail"
-
-        html += f"""
-                <tr>
-                    <td class="text-center">{i}</td>
-                    <td class="text-center">{student.roll_no}</td>
-                    <td>{student.user.get_full_name()}</td>
-                    <td class="text-center">{student_data["total_marks"]:.0f}</td>
-                    <td class="text-center">{student_data["obtained_marks"]:.0f}</td>
-                    <td class="text-center">{student_data["percentage"]:.2f}%</td>
-                    <td class="text-center {result_class}">{student_data["result"]}</td>
-                </tr>
-        """
-
-    html += """
-            </tbody>
-        </table>
-
-        <div class="footer">
-            <div class="signature">
-                <div>Checked By</div>
-            </div>
-            <div class="signature">
-                <div>Controller of Exam</div>
-            </div>
-            <div class="signature">
-                <div>Principal</div>
-            </div>
-        </div>
-    </body>
-    </html>
-    """
-
-    return html
-
-
-def generate_individual_result_html(student, exam):
-    """Generate HTML content for individual student result PDF"""
-    # Get student's results for this exam
-    results = ExamResult.objects.filter(
-        student=student, exam=exam, status=ExamResult.Status.PUBLISHED
-    ).order_by("subject")
-
-    # Calculate totals
-    total_marks = sum(float(r.total_marks) for r in results)
-    obtained_marks = sum(float(r.marks_obtained or 0) for r in results)
-    percentage = (obtained_marks / total_marks * 100) if total_marks > 0 else 0
-    result_status = "Pass" if percentage >= 33 else "Fail"
-
-    html = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="utf-8">
-        <title>Exam Result - {student.user.get_full_name()}</title>
-        <style>
-            body {{
-                font-family: Arial, sans-serif;
-                margin: 0;
-                padding: 20px;
-                line-height: 1.6;
-            }}
-            .header {{
-                text-align: center;
-                border-bottom: 2px solid #333;
-                padding-bottom: 20px;
-                margin-bottom: 30px;
-            }}
-            .school-name {{
-                font-size: 24px;
-                font-weight: bold;
-                margin-bottom: 10px;
-            }}
-            .exam-info {{
-                font-size: 18px;
-                margin-bottom: 10px;
-            }}
-            .student-info {{
-                margin-bottom: 20px;
-            }}
-            table {{
-                width: 100%;
-                border-collapse: collapse;
-                margin-bottom: 30px;
-            }}
-            th, td {{
-                border: 1px solid #333;
-                padding: 8px;
-                text-align: left;
-            }}
-            th {{
-                background-color: #f0f0f0;
-                font-weight: bold;
-            }}
-            .text-center {{
-                text-align: center;
-            }}
-            .summary {{
-                background: #f9f9f9;
-                padding: 15px;
-                border-radius: 5px;
-                margin-bottom: 30px;
-            }}
-            .footer {{
-                margin-top: 50px;
-                display: flex;
-                justify-content: space-between;
-            }}
-            .signature {{
-                width: 200px;
-                text-align: center;
-                border-top: 1px solid #333;
-                padding-top: 10px;
-            }}
-        </style>
-    </head>
-    <body>
-        <div class="header">
-            <div class="school-name">{config('SCHOOL_NAME', default='SCHOOL')}</div>
-            <div class="exam-info">Exam Result - {exam.name}</div>
-            <div>Term: {exam.term.name} | Session: {exam.term.academic_session.year}</div>
-        </div>
-
-        <div class="student-info">
-            <strong>Student Name:</strong> {student.user.get_full_name()}<br>
-            <strong>Roll No:</strong> {student.roll_no}<br>
-            <strong>Admission No:</strong> {student.admission_no}<br>
-            <strong>Class:</strong> {student.classroom}<br>
-            <strong>Father's Name:</strong> {student.father_name}<br>
-            <strong>Mother's Name:</strong> {student.mother_name}
-        </div>
-
-        <table>
-            <thead>
-                <tr>
-                    <th>Subject</th>
-                    <th class="text-center">Max Marks</th>
-                    <th class="text-center">Marks Obtained</th>
-                    <th class="text-center">Grade</th>
-                </tr>
-            </thead>
-            <tbody>
-    """
-
-    for result in results:
-        html += f"""
-                <tr>
-                    <td>{result.subject}</td>
-                    <td class="text-center">{result.total_marks}</td>
-                    <td class="text-center">{result.marks_obtained or 'N/A'}</td>
-                    <td class="text-center">{result.grade or 'N/A'}</td>
-                </tr>
-        """
-
-    html += f"""
-            </tbody>
-        </table>
-
-        <div class="summary">
-            <strong>Total Marks:</strong> {total_marks:.0f}<br>
-            <strong>Marks Obtained:</strong> {obtained_marks:.0f}<br>
-            <strong>Percentage:</strong> {percentage:.2f}%<br>
-            <strong>Result:</strong> {result_status}
-        </div>
-
-        <div class="footer">
-            <div class="signature">
-                <div>Class Teacher</div>
-            </div>
-            <div class="signature">
-                <div>Principal</div>
-            </div>
-        </div>
-    </body>
-    </html>
-    """
-
-
 @login_required
 def student_marksheets(request: HttpRequest):
     """View for generating individual student marksheets"""
@@ -1942,7 +1788,7 @@ def generate_marksheet(request: HttpRequest, student_id: int):
             exam=final_exam,
             status=ExamResult.Status.PUBLISHED,
         )
-        .select_related("subject", "exam__term__academic_session")
+        .select_related("exam__term__academic_session")
         .order_by("subject")
     )
 
@@ -1969,3 +1815,93 @@ def generate_marksheet(request: HttpRequest, student_id: int):
         messages.error(request, f"Error generating marksheet PDF: {e}")
         # Optionally log the error here
         return redirect("academics:student_marksheets")
+
+
+@login_required
+def generate_class_marksheets(request: HttpRequest, classroom_id: int):
+    """
+    Generate the final exam marksheets of a whole classroom, either as a
+    streamed ZIP with one PDF per student or as one merged PDF.
+    """
+    role = get_user_role(request.user)
+    if role != "Admin":
+        return HttpResponse("Access denied", status=403)
+
+    try:
+        classroom = Classroom.objects.get(id=classroom_id)
+    except Classroom.DoesNotExist:
+        return HttpResponse("Classroom not found", status=404)
+
+    current_session = get_current_session(request)
+
+    try:
+        final_exam = Exam.objects.select_related("term__academic_session").get(
+            term__academic_session=current_session, is_yearly_final=True
+        )
+    except Exam.DoesNotExist:
+        messages.error(
+            request, f"No yearly final exam found for session {current_session.year}."
+        )
+        return redirect("academics:student_marksheets")
+    except Exam.MultipleObjectsReturned:
+        messages.error(
+            request, "Multiple final exams found. Please check your exam setup."
+        )
+        return redirect("academics:student_marksheets")
+
+    results_by_student = get_class_results_summary(classroom, final_exam)
+    if not results_by_student:
+        messages.error(
+            request,
+            f"No marksheets available for {classroom}. No published results found for the final exam.",
+        )
+        return redirect("academics:student_marksheets")
+
+    # Optional client-chosen id the page polls for progress
+    token = request.GET.get("token", "")
+    if not BATCH_TOKEN_RE.match(token):
+        token = ""
+    total = len(results_by_student)
+    set_batch_progress(request.user.id, token, 0, total)
+    basename = (
+        f"marksheets_{classroom.grade}{classroom.section or ''}_{current_session.year}"
+    )
+
+    if request.GET.get("format") == "pdf":
+        try:
+            pdf = generate_class_marksheets_pdf(final_exam, results_by_student)
+        except Exception as e:
+            messages.error(request, f"Error generating marksheet PDF: {e}")
+            return redirect("academics:student_marksheets")
+        set_batch_progress(request.user.id, token, total, total)
+        response = HttpResponse(pdf, content_type="application/pdf")
+        response["Content-Disposition"] = f'attachment; filename="{basename}.pdf"'
+        return response
+
+    user_id = request.user.id
+    entries = (
+        (f"marksheet_{student.roll_no}_{current_session.year}.pdf", pdf)
+        for student, pdf in iter_class_marksheet_pdfs(
+            final_exam,
+            results_by_student,
+            progress=lambda done: set_batch_progress(user_id, token, done, total),
+        )
+    )
+    response = StreamingHttpResponse(
+        stream_zip(entries), content_type="application/zip"
+    )
+    response["Content-Disposition"] = f'attachment; filename="{basename}.zip"'
+    return response
+
+
+@login_required
+def batch_progress(request: HttpRequest, token: str):
+    """Progress of a batch download started with the same token"""
+    role = get_user_role(request.user)
+    if role != "Admin":
+        return JsonResponse({"error": "Access denied"}, status=403)
+
+    progress = get_batch_progress(request.user.id, token)
+    if progress is None:
+        return JsonResponse({"error": "Not found"}, status=404)
+    return JsonResponse(progress)
@@ -20,23 +20,13 @@ def profile(request):
             )
 
         if "profile_photo" in request.FILES:
-            # Delete old image if it exists
-            if admin.profile_photo:
-                import os
-                from django.conf import settings
-
-                old_image_path = os.path.join(
-                    settings.MEDIA_ROOT, str(admin.profile_photo)
-                )
-                if os.path.exists(old_image_path):
-                    try:
-                        os.remove(old_image_path)
-                    except OSError:
-                        pass  # Ignore if file doesn't exist or can't be deleted
-
+            old_photo = admin.profile_photo.name
             form = AdministratorProfileForm(request.POST, request.FILES, instance=admin)
             if form.is_valid():
                 form.save()
+                # Through the storage, so a deduplicated blob is released
+                if old_photo and old_photo != admin.profile_photo.name:
+                    admin.profile_photo.storage.delete(old_photo)
                 return JsonResponse(
                     {
                         "success": True,
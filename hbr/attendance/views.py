@@ -14,6 +14,8 @@ from base.views import get_user_role
 from .models import Attendance, TeacherAttendance
 from students.models import Student, Classroom
 from teachers.models import Teacher
+from dashboard.models import ActivityEvent
+from dashboard.activity_utils import record_activity, record_activities
 
 
 # ==================== HELPER FUNCTIONS ====================
@@ -151,6 +153,14 @@ def process_attendance_row(
         status=status,
         remarks=remarks,
     )
+    record_activity(
+        ActivityEvent.EventType.ATTENDANCE,
+        f"Marked attendance for {student.user.get_full_name()}",
+        actor=teacher.user,
+        audience=student.user,
+        status=status.lower(),
+        audience_message=f"Attendance marked: {status.title()}",
+    )
     return True, None
 
 
@@ -276,7 +286,8 @@ def mark_student_attendance(request: HttpRequest):
 
             # Mark attendance for students
             attendance_count = 0
-            for student in students:
+            activity_events = []
+            for student in students.select_related("user"):
                 status = request.POST.get(f"status_{student.id}")
                 remarks = request.POST.get(f"remarks_{student.id}", "")
 
@@ -291,6 +302,18 @@ def mark_student_attendance(request: HttpRequest):
                         },
                     )
                     attendance_count += 1
+                    activity_events.append(
+                        {
+                            "event_type": ActivityEvent.EventType.ATTENDANCE,
+                            "message": f"Marked attendance for {student.user.get_full_name()}",
+                            "audience_message": f"Attendance marked: {status.title()}",
+                            "actor": request.user,
+                            "audience": student.user,
+                            "status": status.lower(),
+                        }
+                    )
+
+            record_activities(activity_events)
 
             messages.success(
                 request, f"Attendance marked for {attendance_count} students"
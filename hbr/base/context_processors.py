@@ -1,9 +1,7 @@
 from academics.models import AcademicSession
 from datetime import date
-from notices.models import Notice
-from students.models import Student
-from teachers.models import Teacher
-from django.db.models import Q
+from django.utils.functional import SimpleLazyObject
+from notices.delivery_utils import get_inbox_summary
 
 
 def get_user_role(user):
@@ -61,54 +59,26 @@ def user_role(request):
 
 
 def user_notifications(request):
-    """Context processor to add user notifications to all templates"""
-    if request.user.is_authenticated:
-        role = get_user_role(request.user)
-        if role == "Student":
-            try:
-                student = Student.objects.get(user=request.user)
-                notifications = (
-                    Notice.objects.filter(is_active=True)
-                    .filter(
-                        Q(
-                            notice_type=Notice.NoticeType.INDIVIDUAL_STUDENT,
-                            target_students=student,
-                        )
-                    )
-                    .exclude(dismissed_by=request.user)
-                    .order_by("-created_at")[:5]
-                )
-            except Student.DoesNotExist:
-                notifications = Notice.objects.none()
-        elif role == "Teacher":
-            try:
-                teacher = Teacher.objects.get(user=request.user)
-                notifications = (
-                    Notice.objects.filter(is_active=True)
-                    .filter(
-                        Q(
-                            notice_type=Notice.NoticeType.INDIVIDUAL_TEACHER,
-                            target_teachers=teacher,
-                        )
-                    )
-                    .exclude(dismissed_by=request.user)
-                    .order_by("-created_at")[:5]
-                )
-            except Teacher.DoesNotExist:
-                notifications = Notice.objects.none()
-        elif role == "Admin":
-            notifications = (
-                Notice.objects.filter(
-                    is_active=True, notice_type=Notice.NoticeType.SYSTEM_ALERT
-                )
-                .exclude(dismissed_by=request.user)
-                .order_by("-created_at")[:5]
-            )
-        else:
-            notifications = Notice.objects.none()
-
-        return {"notifications": notifications}
-    return {}
+    """Context processor to add unread notifications to all templates.
+
+    Resolved lazily from a per-user cache, so pages that never show the
+    notification dropdown cost nothing. Skipped for AJAX/JSON requests.
+    """
+    if not request.user.is_authenticated or is_ajax_request(request):
+        return {}
+
+    summary = SimpleLazyObject(lambda: get_inbox_summary(request.user))
+    return {
+        "notifications": SimpleLazyObject(lambda: summary["notifications"]),
+        "unread_notification_count": SimpleLazyObject(lambda: summary["unread_count"]),
+    }
+
+
+def is_ajax_request(request):
+    """Check whether a request was made by JS expecting a partial or JSON"""
+    return request.headers.get(
+        "X-Requested-With"
+    ) == "XMLHttpRequest" or "application/json" in request.headers.get("Accept", "")
 
 
 def school_name(request):
@@ -0,0 +1,202 @@
+import mimetypes
+import os
+import re
+import zipfile
+from urllib.parse import quote
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import (
+    content_disposition_header,
+    http_date,
+    parse_http_date_safe,
+)
+
+STREAM_CHUNK_SIZE = 64 * 1024
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+# Leading bytes of the file types users upload, for files without a usable
+# extension
+FILE_SIGNATURES = [
+    (b"%PDF-", "application/pdf"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"PK\x03\x04", "application/zip"),
+    (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1", "application/msword"),
+]
+
+
+def guess_content_type(name, head=b""):
+    """Content type from the file name, falling back to its leading bytes"""
+    content_type, encoding = mimetypes.guess_type(name)
+    if content_type and not encoding:
+        return content_type
+    for signature, signature_type in FILE_SIGNATURES:
+        if head.startswith(signature):
+            return signature_type
+    if head.startswith(b"RIFF") and head[8:12] == b"WEBP":
+        return "image/webp"
+    return "application/octet-stream"
+
+
+def parse_range(header, size):
+    """Parse a single ``bytes=`` range into (start, end), inclusive.
+
+    Returns None when the header should be ignored (missing, malformed or
+    multi-range) and False when the range cannot be satisfied.
+    """
+    match = RANGE_RE.match(header.strip()) if header else None
+    if not match or not any(match.groups()):
+        return None
+    start, end = match.groups()
+    if not start:
+        # Suffix range: the last N bytes
+        length = int(end)
+        # An empty file has no last N bytes to send
+        if not length or not size:
+            return False
+        return max(size - length, 0), size - 1
+    start = int(start)
+    end = min(int(end), size - 1) if end else size - 1
+    if start >= size or start > end:
+        return False
+    return start, end
+
+
+def iter_file_range(path, start, length):
+    with open(path, "rb") as file:
+        file.seek(start)
+        while length > 0:
+            chunk = file.read(min(STREAM_CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+def get_file_content_type(path, name):
+    with open(path, "rb") as file:
+        return guess_content_type(name, file.read(16))
+
+
+def build_file_response(request, path, size, etag, last_modified):
+    """Full, partial or front-server response for an unchanged file"""
+    server = getattr(settings, "PROTECTED_FILE_SERVER", "")
+    if server == "nginx":
+        relative = os.path.relpath(path, settings.MEDIA_ROOT)
+        response = HttpResponse()
+        response["X-Accel-Redirect"] = settings.PROTECTED_FILE_PREFIX + quote(
+            relative.replace(os.sep, "/")
+        )
+        return response
+    if server == "apache":
+        response = HttpResponse()
+        response["X-Sendfile"] = path
+        return response
+
+    byte_range = parse_range(request.headers.get("Range"), size)
+    if byte_range is not None and not if_range_matches(request, etag, last_modified):
+        byte_range = None
+    if byte_range is False:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{size}"
+        return response
+    if byte_range is None or request.method == "HEAD":
+        return FileResponse(open(path, "rb"))
+
+    start, end = byte_range
+    length = end - start + 1
+    response = StreamingHttpResponse(iter_file_range(path, start, length), status=206)
+    response["Content-Range"] = f"bytes {start}-{end}/{size}"
+    response["Content-Length"] = str(length)
+    return response
+
+
+def if_range_matches(request, etag, last_modified):
+    """Whether a Range request still applies to this version of the file"""
+    if_range = request.headers.get("If-Range")
+    if not if_range:
+        return True
+    if if_range.startswith('"') or if_range.startswith("W/"):
+        return if_range == etag
+    return parse_http_date_safe(if_range) == last_modified
+
+
+def serve_protected_file(request, field_file, as_attachment=False, filename=None):
+    """Serve a FileField's file after the caller has checked permissions.
+
+    Supports conditional GETs (ETag/Last-Modified), single byte ranges and
+    content type detection. With ``PROTECTED_FILE_SERVER`` set to "nginx" or
+    "apache", the transfer itself is handed to the front server through
+    X-Accel-Redirect/X-Sendfile.
+    """
+    filename = filename or os.path.basename(field_file.name)
+    try:
+        path = field_file.path
+    except NotImplementedError:
+        # Remote storage (e.g. Cloudinary in demo mode): stream it through
+        response = FileResponse(
+            field_file.open("rb"),
+            as_attachment=as_attachment,
+            filename=filename,
+            content_type=guess_content_type(field_file.name),
+        )
+        patch_cache_control(response, private=True)
+        return response
+
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return HttpResponse("File not found", status=404)
+
+    etag = f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+    last_modified = int(stat.st_mtime)
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = build_file_response(request, path, stat.st_size, etag, last_modified)
+    if response.status_code in (200, 206):
+        response["Content-Disposition"] = content_disposition_header(
+            as_attachment, filename
+        )
+        response["Content-Type"] = get_file_content_type(path, field_file.name)
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    response["Accept-Ranges"] = "bytes"
+    patch_cache_control(response, private=True, max_age=0, must_revalidate=True)
+    return response
+
+
+class ZipChunkBuffer:
+    """Write-only sink that hands the bytes written so far to a generator"""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def pop(self):
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def stream_zip(entries):
+    """Yield a ZIP archive chunk by chunk from (name, data) pairs.
+
+    ``entries`` may be a generator, so each member is produced only when the
+    previous one has been sent and the archive is never held in memory whole.
+    PDFs are already compressed, so members are stored rather than deflated.
+    """
+    buffer = ZipChunkBuffer()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as archive:
+        for name, data in entries:
+            archive.writestr(name, data)
+            yield buffer.pop()
+    yield buffer.pop()
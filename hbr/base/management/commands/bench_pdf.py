@@ -0,0 +1,364 @@
+import contextlib
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import date, time as dtime, timedelta
+from decimal import Decimal
+
+import django
+import reportlab
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from academics.models import AcademicSession, Term, Exam, ExamResult, ExamSchedule
+from academics.result_utils import (
+    MARKSHEET_PDF_OPTIONS,
+    generate_annual_result_sheet_html,
+    generate_marksheet_html,
+    generate_result_declaration_html,
+    get_class_results_summary,
+)
+from base.pdf import (
+    generate_admit_card_pdf,
+    generate_certificate_pdf,
+    generate_exam_timetable_pdf,
+    generate_payment_receipt_pdf,
+    generate_student_profile_pdf,
+)
+from base.pdf_render_utils import get_wkhtmltopdf_path, render_pdf
+from students.data_utils import prepare_student_profile_data
+from students.models import CertificateType, Classroom, Payment, Student
+
+REPORT_VERSION = 1
+SUBJECTS = ("Mathematics", "Science", "English", "Hindi", "Social Science")
+DECLARATION_PDF_OPTIONS = {
+    "page-size": "A4",
+    "margin-top": "1in",
+    "margin-right": "1in",
+    "margin-bottom": "1in",
+    "margin-left": "1in",
+}
+ANNUAL_PDF_OPTIONS = {**MARKSHEET_PDF_OPTIONS, "orientation": "landscape"}
+CERTIFICATE_TEMPLATE = (
+    "<h1>{{ school_name }}</h1><p>This is to certify that {{ student_name }}, "
+    "child of {{ father_name }}, studied in class {{ class }} "
+    "(roll no {{ roll_no }}).</p><p>{{ date }}</p>"
+)
+
+
+class BenchmarkRollback(Exception):
+    """Raised to roll back the seeded benchmark data"""
+
+
+def seed_fixtures(students):
+    """A final exam with a schedule and published results for one classroom"""
+    today = timezone.now().date()
+    session = AcademicSession.objects.create(
+        year="bench-pdf",
+        start_date=today - timedelta(days=180),
+        end_date=today + timedelta(days=180),
+    )
+    term = Term.objects.create(
+        academic_session=session,
+        name="Final Term",
+        start_date=session.start_date,
+        end_date=session.end_date,
+    )
+    exam = Exam.objects.create(
+        term=term, name="Final Exam", is_yearly_final=True, admit_card_available=True
+    )
+    for day, subject in enumerate(SUBJECTS):
+        ExamSchedule.objects.create(
+            exam=exam,
+            date=today + timedelta(days=day),
+            time=dtime(9),
+            subject=subject,
+            room=f"Room {day + 1}",
+        )
+
+    classroom = Classroom.objects.create(grade="bench-pdf", section="A")
+    users = User.objects.bulk_create(
+        User(
+            username=f"bench_pdf_{i}",
+            first_name="Student",
+            last_name=str(i),
+            email=f"bench_pdf_{i}@example.com",
+        )
+        for i in range(students)
+    )
+    student_objs = Student.objects.bulk_create(
+        Student(
+            user=user,
+            sr_no=i,
+            roll_no=i + 1,
+            admission_no=f"BENCHPDF{i}",
+            father_name="Father",
+            mother_name="Mother",
+            dob=date(2010, 1, 1),
+            gender="MALE",
+            classroom=classroom,
+            current_address="Address",
+            permanent_address="Address",
+        )
+        for i, user in enumerate(users)
+    )
+    ExamResult.objects.bulk_create(
+        ExamResult(
+            student=student,
+            exam=exam,
+            subject=subject,
+            marks_obtained=Decimal((i * 7 + len(subject) * 3) % 100),
+            total_marks=Decimal(100),
+            grade="ABCDF"[(i + len(subject)) % 5],
+            status=ExamResult.Status.PUBLISHED,
+        )
+        for i, student in enumerate(student_objs)
+        for subject in SUBJECTS
+    )
+    student = Student.objects.select_related("user", "classroom").get(
+        id=student_objs[0].id
+    )
+    payment = Payment.objects.create(
+        student=student,
+        amount=Decimal("1500"),
+        description="Tuition Fee",
+        status=Payment.Status.PAID,
+        payment_date=timezone.now(),
+        transaction_id="BENCHTXN",
+    )
+    certificate_type = CertificateType.objects.create(
+        name="Bench PDF Certificate", html_template=CERTIFICATE_TEMPLATE
+    )
+    return exam, classroom, student, payment, certificate_type
+
+
+def build_cases(exam, classroom, student, payment, certificate_type):
+    """Name -> (kind, build) for every generator; HTML cases also give options"""
+    student_data, user_data = prepare_student_profile_data(student, student.user)
+    schedule = [
+        {
+            "date": item.date.strftime("%d/%m/%Y"),
+            "time": item.time.strftime("%H:%M"),
+            "subject": item.subject,
+            "room": item.room,
+        }
+        for item in ExamSchedule.objects.filter(exam=exam).order_by("date", "time")
+    ]
+    exam = Exam.objects.select_related("term__academic_session").get(id=exam.id)
+    results = list(
+        ExamResult.objects.filter(student=student, exam=exam).order_by("subject")
+    )
+    class_results = list(
+        ExamResult.objects.filter(exam=exam, student__classroom=classroom)
+        .select_related("student__user")
+        .order_by("student__roll_no", "subject")
+    )
+
+    return {
+        "student_profile": (
+            "reportlab",
+            lambda: generate_student_profile_pdf(student_data, user_data),
+        ),
+        "admit_card": ("reportlab", lambda: generate_admit_card_pdf(exam, student)),
+        "exam_timetable": (
+            "reportlab",
+            lambda: generate_exam_timetable_pdf(exam, schedule, student),
+        ),
+        "payment_receipt": (
+            "reportlab",
+            lambda: generate_payment_receipt_pdf(payment),
+        ),
+        "certificate": (
+            "certificate",
+            lambda: generate_certificate_pdf(student, certificate_type),
+        ),
+        "marksheet": (
+            "html",
+            lambda: generate_marksheet_html(student, exam, results),
+            MARKSHEET_PDF_OPTIONS,
+        ),
+        "result_declaration": (
+            "html",
+            lambda: generate_result_declaration_html(exam, classroom, class_results),
+            DECLARATION_PDF_OPTIONS,
+        ),
+        "annual_result_sheet": (
+            "html",
+            lambda: generate_annual_result_sheet_html(
+                classroom, exam, get_class_results_summary(classroom, exam)
+            ),
+            ANNUAL_PDF_OPTIONS,
+        ),
+    }
+
+
+def output_size(output):
+    if hasattr(output, "getvalue"):
+        output = output.getvalue()
+    if isinstance(output, str):
+        output = output.encode()
+    return len(output)
+
+
+def measure(function, iterations):
+    """Timing over ``iterations`` calls, then the Python heap peak of one call"""
+    output = function()  # warm up fonts, templates and imports
+    timings = []
+    gc.disable()
+    try:
+        for _ in range(iterations):
+            started = time.perf_counter()
+            function()
+            timings.append((time.perf_counter() - started) * 1000)
+    finally:
+        gc.enable()
+
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "iterations": iterations,
+        "min_ms": round(min(timings), 3),
+        "median_ms": round(statistics.median(timings), 3),
+        "max_ms": round(max(timings), 3),
+        "peak_kb": round(peak / 1024, 1),
+        "output_bytes": output_size(output),
+    }
+
+
+def detect_wkhtmltopdf():
+    path = get_wkhtmltopdf_path()
+    if not path:
+        return {"available": False, "path": None, "version": None}
+    try:
+        version = subprocess.run(
+            [path, "--version"], capture_output=True, text=True, timeout=10
+        ).stdout.strip()
+        version = version.splitlines()[0] if version else None
+    except (OSError, subprocess.SubprocessError) as e:
+        return {"available": False, "path": path, "version": None, "error": str(e)}
+    return {"available": True, "path": path, "version": version}
+
+
+def get_git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+            cwd=settings.BASE_DIR,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a classroom inside a rolled back transaction, time and "
+        "memory-profile every PDF generator, and print a JSON report."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--students",
+            type=int,
+            default=40,
+            help="Students in the seeded classroom (default: 40)",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=10,
+            help="Timed calls per generator (default: 10)",
+        )
+        parser.add_argument(
+            "--pdf-iterations",
+            type=int,
+            default=3,
+            help="Timed wkhtmltopdf conversions per HTML document (default: 3)",
+        )
+        parser.add_argument(
+            "--output",
+            help="Write the JSON report to this file instead of stdout",
+        )
+
+    def handle(self, *args, **options):
+        wkhtmltopdf = detect_wkhtmltopdf()
+        if not wkhtmltopdf["available"]:
+            self.stderr.write(
+                "wkhtmltopdf not found; HTML to PDF conversions are skipped and "
+                "certificates are measured on the ReportLab fallback."
+            )
+
+        generators = {}
+        try:
+            # Generators print their fallbacks; keep stdout for the report
+            with contextlib.redirect_stdout(sys.stderr), transaction.atomic():
+                cases = build_cases(*seed_fixtures(options["students"]))
+                for name, (kind, build, *pdf_options) in cases.items():
+                    self.stderr.write(f"Measuring {name}...")
+                    result = measure(build, options["iterations"])
+                    if kind == "certificate":
+                        # The generator silently falls back when pdfkit fails
+                        result["engine"] = (
+                            "reportlab fallback"
+                            if b"ReportLab" in build().getvalue()
+                            else "wkhtmltopdf"
+                        )
+                    elif kind == "html":
+                        result = {"html": result}
+                        if wkhtmltopdf["available"]:
+                            html = build()
+                            try:
+                                result["pdf"] = measure(
+                                    lambda: render_pdf(html, options=pdf_options[0]),
+                                    options["pdf_iterations"],
+                                )
+                            except Exception as e:
+                                # A broken install is reported, not fatal
+                                result["pdf"] = {"error": str(e)}
+                        else:
+                            result["pdf"] = {"skipped": "wkhtmltopdf not found"}
+                    else:
+                        result["engine"] = kind
+                    generators[name] = result
+                raise BenchmarkRollback
+        except BenchmarkRollback:
+            pass
+
+        report = {
+            "report_version": REPORT_VERSION,
+            "git_commit": get_git_commit(),
+            "created_at": timezone.now().isoformat(timespec="seconds"),
+            "environment": {
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "reportlab": reportlab.Version,
+                "platform": platform.platform(),
+                "pdf_render_pool": getattr(settings, "PDF_RENDER_POOL", True),
+                "pdf_render_workers": getattr(settings, "PDF_RENDER_WORKERS", 2),
+            },
+            "wkhtmltopdf": wkhtmltopdf,
+            "fixtures": {"students": options["students"], "subjects": len(SUBJECTS)},
+            "generators": generators,
+        }
+        data = json.dumps(report, indent=2, sort_keys=True)
+        if options["output"]:
+            with open(options["output"], "w") as file:
+                file.write(data + "\n")
+            self.stderr.write(f"Report written to {options['output']}")
+        else:
+            self.stdout.write(data)
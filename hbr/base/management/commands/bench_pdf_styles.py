@@ -0,0 +1,144 @@
+import gc
+import time
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from academics.models import AcademicSession, Term, Exam
+from base.pdf import (
+    generate_exam_timetable_pdf,
+    generate_payment_receipt_pdf,
+    generate_student_profile_pdf,
+)
+from base.pdf.styles import build_paragraph_styles, build_table_styles
+from students.models import Student, Classroom, Payment
+
+
+def build_samples():
+    """Generator calls for unsaved sample objects, so no database is needed"""
+    user = User(
+        username="bench",
+        first_name="Bench",
+        last_name="Student",
+        email="bench@example.com",
+        date_joined=timezone.now(),
+    )
+    student = Student(
+        user=user,
+        sr_no=1,
+        roll_no=1,
+        admission_no="BENCH1",
+        father_name="Father",
+        mother_name="Mother",
+        dob=date(2010, 1, 1),
+        gender="MALE",
+        classroom=Classroom(grade="10", section="A"),
+    )
+    student_data = {
+        "sr_no": 1,
+        "roll_no": 1,
+        "admission_no": "BENCH1",
+        "father_name": "Father",
+        "mother_name": "Mother",
+        "dob": student.dob,
+        "mobile_no": "9999999999",
+        "category": "General",
+        "gender": "MALE",
+        "classroom": student.classroom,
+        "profile_photo": None,
+        "stream": None,
+        "subjects": "Mathematics, Science",
+        "current_address": "Address",
+        "permanent_address": "Address",
+        "weight": None,
+        "height": None,
+    }
+    user_data = {
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+        "username": user.username,
+        "email": user.email,
+        "date_joined": user.date_joined,
+    }
+    exam = Exam(
+        name="Final Exam",
+        term=Term(name="Final Term", academic_session=AcademicSession(year="2025")),
+    )
+    schedule = [
+        {
+            "date": f"{day:02d}/03/2025",
+            "time": "09:00",
+            "subject": "Subject",
+            "room": "",
+        }
+        for day in range(1, 7)
+    ]
+    payment = Payment(
+        id=1, student=student, amount=Decimal("1500"), description="Fee", status="PAID"
+    )
+    return {
+        "profile": lambda: generate_student_profile_pdf(student_data, user_data),
+        "timetable": lambda: generate_exam_timetable_pdf(exam, schedule, student),
+        "receipt": lambda: generate_payment_receipt_pdf(payment),
+    }
+
+
+def time_calls(function, iterations):
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        for _ in range(iterations):
+            function()
+        return (time.perf_counter() - started) * 1000 / iterations
+    finally:
+        gc.enable()
+
+
+def compare(before, after, iterations, rounds=7):
+    """Best-of-rounds ms per call for two functions, measured alternately"""
+    before_ms, after_ms = [], []
+    for _ in range(rounds):
+        before_ms.append(time_calls(before, iterations))
+        after_ms.append(time_calls(after, iterations))
+    return min(before_ms), min(after_ms)
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the per-document cost of building ReportLab styles on every "
+        "call (the old generators) against the shared style registries."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=20,
+            help="Documents rendered per timing round (default: 20)",
+        )
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+        setup_ms = min(
+            time_calls(lambda: (build_paragraph_styles(), build_table_styles()), 100)
+            for _ in range(5)
+        )
+        self.stdout.write(f"Style setup per call: {setup_ms:.3f} ms")
+
+        self.stdout.write(
+            f"{'document':<10} {'before ms':>10} {'after ms':>10} {'saved':>7}"
+        )
+        for name, render in build_samples().items():
+            render()  # warm up fonts and imports
+            before_ms, after_ms = compare(
+                lambda: (build_paragraph_styles(), build_table_styles(), render()),
+                render,
+                iterations,
+            )
+            self.stdout.write(
+                f"{name:<10} {before_ms:>10.3f} {after_ms:>10.3f} "
+                f"{(before_ms - after_ms) / before_ms:>7.1%}"
+            )
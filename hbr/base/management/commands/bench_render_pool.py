@@ -0,0 +1,115 @@
+import time
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from academics.models import AcademicSession, Term, Exam, ExamResult
+from academics.result_utils import generate_marksheet_html
+from base.pdf_render_utils import (
+    get_wkhtmltopdf_path,
+    render_merged_pdf,
+    render_pdf_direct,
+    render_pdfs,
+)
+from students.models import Student, Classroom
+
+SUBJECTS = ("Mathematics", "Science", "English", "Hindi", "Social Science")
+PDF_OPTIONS = {
+    "page-size": "A4",
+    "margin-top": "0.5in",
+    "margin-right": "0.5in",
+    "margin-bottom": "0.5in",
+    "margin-left": "0.5in",
+}
+
+
+def build_marksheets(count):
+    """Marksheet HTML for unsaved sample students"""
+    exam = Exam(
+        name="Final Exam",
+        term=Term(name="Final Term", academic_session=AcademicSession(year="2025")),
+    )
+    classroom = Classroom(grade="10", section="A")
+    documents = []
+    for i in range(count):
+        student = Student(
+            user=User(first_name="Student", last_name=str(i)),
+            roll_no=i + 1,
+            admission_no=f"BENCH{i}",
+            father_name="Father",
+            mother_name="Mother",
+            dob=date(2010, 1, 1),
+            classroom=classroom,
+        )
+        results = [
+            ExamResult(
+                subject=subject,
+                marks_obtained=Decimal((i * 7 + len(subject)) % 100),
+                total_marks=Decimal(100),
+                grade="ABCDF"[(i + len(subject)) % 5],
+            )
+            for subject in SUBJECTS
+        ]
+        documents.append(generate_marksheet_html(student, exam, results))
+    return documents
+
+
+class Command(BaseCommand):
+    help = (
+        "Render sample marksheets with per-call pdfkit, the render pool and "
+        "batched render pool jobs, and report documents per second."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--documents",
+            type=int,
+            default=40,
+            help="Number of marksheets to render per mode (default: 40)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10,
+            help="Documents per wkhtmltopdf process in batched mode (default: 10)",
+        )
+
+    def handle(self, *args, **options):
+        if not get_wkhtmltopdf_path():
+            raise CommandError(
+                "wkhtmltopdf not found; install it or set WKHTMLTOPDF_PATH."
+            )
+        documents = build_marksheets(options["documents"])
+        batch_size = options["batch_size"]
+
+        modes = {
+            "pdfkit": lambda: [
+                render_pdf_direct([html], PDF_OPTIONS) for html in documents
+            ],
+            "pool": lambda: render_pdfs(documents, PDF_OPTIONS),
+            "pool batched": lambda: [
+                render_merged_pdf(documents[i : i + batch_size], PDF_OPTIONS)
+                for i in range(0, len(documents), batch_size)
+            ],
+        }
+
+        self.stdout.write(f"{'mode':<14} {'seconds':>8} {'docs/s':>8}")
+        rates = {}
+        for name, run in modes.items():
+            started = time.perf_counter()
+            try:
+                run()
+            except ImportError:
+                self.stdout.write(f"{name:<14} {'skipped (pdfkit not installed)':>17}")
+                continue
+            elapsed = time.perf_counter() - started
+            rates[name] = len(documents) / elapsed
+            self.stdout.write(f"{name:<14} {elapsed:>8.2f} {rates[name]:>8.1f}")
+
+        if "pdfkit" in rates:
+            for name in ("pool", "pool batched"):
+                self.stdout.write(
+                    f"{name}: {rates[name] / rates['pdfkit']:.1f}x per-call pdfkit"
+                )
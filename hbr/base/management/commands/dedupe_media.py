@@ -0,0 +1,93 @@
+import os
+import uuid
+
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandError
+
+from base.pdf.thumbnails import THUMBNAIL_DIR
+from base.pdf_cache_utils import PDF_CACHE_DIR
+from base.storage import (
+    BLOB_DIR,
+    DedupFileSystemStorage,
+    hash_path,
+    iter_media_files,
+)
+
+# Caches written straight to disk by their own code, which also evicts them
+SKIPPED_DIRS = {BLOB_DIR, PDF_CACHE_DIR, THUMBNAIL_DIR}
+
+
+class Command(BaseCommand):
+    help = (
+        "Move media stored before deduplication into the blob store, "
+        "replacing duplicate files with links to a single copy."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report what would be linked and reclaimed",
+        )
+
+    def handle(self, *args, **options):
+        storage = default_storage
+        if not isinstance(storage, DedupFileSystemStorage):
+            raise CommandError(
+                "The default storage is not base.storage.DedupFileSystemStorage."
+            )
+        root = storage.location
+        if not os.path.isdir(root):
+            self.stdout.write("MEDIA_ROOT does not exist; nothing to do.")
+            return
+
+        dry_run = options["dry_run"]
+        adopted = linked = failed = 0
+        reclaimed = 0
+        # Hashes first seen in this dry run, which would have become blobs
+        seen = set()
+        for entry in iter_media_files(root, SKIPPED_DIRS):
+            file_stat = entry.stat(follow_symlinks=False)
+            if file_stat.st_nlink > 1:
+                continue  # already linked to its blob
+            try:
+                content_hash = hash_path(entry.path)
+                blob_path = storage.get_blob_path(content_hash)
+                if dry_run:
+                    if content_hash in seen or os.path.exists(blob_path):
+                        linked += 1
+                        reclaimed += file_stat.st_size
+                    else:
+                        seen.add(content_hash)
+                        adopted += 1
+                    continue
+
+                storage.make_directory(os.path.dirname(blob_path))
+                try:
+                    # The first copy becomes the blob, without copying it
+                    os.link(entry.path, blob_path)
+                    adopted += 1
+                    continue
+                except FileExistsError:
+                    pass
+                # Swap the duplicate for a link to the blob in one rename
+                temp_path = f"{entry.path}.{uuid.uuid4().hex}.dedupe"
+                os.link(blob_path, temp_path)
+                try:
+                    os.replace(temp_path, entry.path)
+                except OSError:
+                    os.remove(temp_path)
+                    raise
+                linked += 1
+                reclaimed += file_stat.st_size
+            except OSError as e:
+                failed += 1
+                self.stderr.write(f"{os.path.relpath(entry.path, root)}: {e}")
+
+        verb = "Would link" if dry_run else "Linked"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{verb} {linked} duplicates ({reclaimed / 1024 / 1024:.1f} MB), "
+                f"{adopted} unique files into the blob store, failed {failed}."
+            )
+        )
@@ -0,0 +1,216 @@
+import os
+import posixpath
+import shutil
+import time
+from collections import Counter
+
+from django.apps import apps
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandError
+from django.db import models
+
+from base.pdf.thumbnails import THUMBNAIL_DIR, get_thumbnail_dir
+from base.pdf_cache_utils import PDF_CACHE_DIR, evict_pdf_cache
+from base.storage import BLOB_DIR, iter_media_files
+from front_cms.image_utils import iter_variant_names
+
+# Managed by their own code, and checked separately below
+MANAGED_DIRS = {BLOB_DIR, PDF_CACHE_DIR, THUMBNAIL_DIR}
+VALUES_CHUNK_SIZE = 2000
+
+
+def get_file_fields(model):
+    return [
+        field
+        for field in model._meta.concrete_fields
+        if isinstance(field, models.FileField)
+    ]
+
+
+def collect_referenced_names():
+    """Storage names of every file a model row points at.
+
+    One query per model fetches all its file fields at once, plus the
+    ``variants`` record of CMS images, streamed in chunks.
+    """
+    referenced = set()
+    for model in apps.get_models():
+        if model._meta.proxy:
+            continue
+        columns = [field.attname for field in get_file_fields(model)]
+        has_variants = hasattr(model, "VARIANT_WIDTHS")
+        if has_variants:
+            columns.append("variants")
+        if not columns:
+            continue
+        rows = model._base_manager.values_list(*columns).iterator(
+            chunk_size=VALUES_CHUNK_SIZE
+        )
+        for row in rows:
+            if has_variants:
+                *row, variants = row
+                referenced.update(iter_variant_names(variants))
+            referenced.update(posixpath.normpath(name) for name in row if name)
+    return referenced
+
+
+def get_age(file_stat, now):
+    # The change time moves when a link to the file is added or dropped,
+    # so a blob orphaned moments ago isn't old yet
+    return now - max(file_stat.st_mtime, file_stat.st_ctime)
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete media files that no model row references any more: "
+        "uploads left behind by deleted students, notices and images, "
+        "unlinked blobs, thumbnails of gone photos and stale cache temp files."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report what would be deleted",
+        )
+        parser.add_argument(
+            "--min-age",
+            type=float,
+            default=24,
+            help=(
+                "Leave files younger than this many hours, which may belong "
+                "to an upload still in progress (default: 24)"
+            ),
+        )
+
+    def handle(self, *args, **options):
+        try:
+            root = default_storage.path("")
+        except NotImplementedError:
+            raise CommandError("The default storage is not on the local disk.")
+        if not os.path.isdir(root):
+            self.stdout.write("MEDIA_ROOT does not exist; nothing to do.")
+            return
+
+        self.dry_run = options["dry_run"]
+        self.verbosity = options["verbosity"]
+        self.min_age = options["min_age"] * 3600
+        self.now = time.time()
+        self.counts = Counter()
+        self.sizes = Counter()
+
+        referenced = collect_referenced_names()
+        self.stdout.write(f"{len(referenced)} files referenced by the database.")
+
+        self.collect_uploads(root, referenced)
+        self.collect_blobs(os.path.join(root, BLOB_DIR))
+        self.collect_thumbnails(os.path.join(root, THUMBNAIL_DIR), root, referenced)
+        for cache_dir in (PDF_CACHE_DIR, THUMBNAIL_DIR):
+            self.collect_cache_temp_files(os.path.join(root, cache_dir))
+        if not self.dry_run:
+            evicted = evict_pdf_cache()
+            if evicted:
+                self.stdout.write(f"Evicted {evicted} PDF cache entries.")
+
+        verb = "Would delete" if self.dry_run else "Deleted"
+        for kind in sorted(self.counts):
+            self.stdout.write(
+                f"{verb} {self.counts[kind]} {kind} "
+                f"({self.sizes[kind] / 1024 / 1024:.1f} MB)"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{verb} {sum(self.counts.values())} orphans, "
+                f"{sum(self.sizes.values()) / 1024 / 1024:.1f} MB."
+            )
+        )
+
+    def is_old(self, file_stat):
+        return get_age(file_stat, self.now) >= self.min_age
+
+    def found(self, kind, path, size):
+        self.counts[kind] += 1
+        self.sizes[kind] += size
+        if self.verbosity >= 2:
+            self.stdout.write(f"  {kind}: {path}")
+
+    def collect_uploads(self, root, referenced):
+        """Files under MEDIA_ROOT that no row references"""
+        for entry in iter_media_files(root, MANAGED_DIRS):
+            name = os.path.relpath(entry.path, root).replace(os.sep, "/")
+            if name in referenced:
+                continue
+            file_stat = entry.stat(follow_symlinks=False)
+            if not self.is_old(file_stat):
+                continue
+            # With more links, a deduplicated copy stays referenced elsewhere
+            size = file_stat.st_size if file_stat.st_nlink <= 2 else 0
+            self.found("unreferenced uploads", name, size)
+            if not self.dry_run:
+                try:
+                    # Through the storage, which also drops the blob it links
+                    default_storage.delete(name)
+                except OSError as e:
+                    self.stderr.write(f"{name}: {e}")
+
+    def collect_blobs(self, blob_root):
+        """Blobs no upload links to, and interrupted blob writes"""
+        if not os.path.isdir(blob_root):
+            return
+        for entry in iter_media_files(blob_root):
+            file_stat = entry.stat(follow_symlinks=False)
+            if file_stat.st_nlink > 1 or not self.is_old(file_stat):
+                continue
+            self.found("unlinked blobs", entry.name, file_stat.st_size)
+            if not self.dry_run:
+                self.remove(entry.path)
+
+    def collect_thumbnails(self, thumbnail_root, root, referenced):
+        """PDF thumbnails of photos that are no longer referenced"""
+        if not os.path.isdir(thumbnail_root):
+            return
+        live = {
+            os.path.basename(get_thumbnail_dir(os.path.join(root, name)))
+            for name in referenced
+        }
+        with os.scandir(thumbnail_root) as prefixes:
+            prefix_paths = [entry.path for entry in prefixes if entry.is_dir()]
+        for prefix_path in prefix_paths:
+            with os.scandir(prefix_path) as sources:
+                stale = [
+                    entry
+                    for entry in sources
+                    if entry.is_dir(follow_symlinks=False) and entry.name not in live
+                ]
+            for entry in stale:
+                files = list(iter_media_files(entry.path))
+                if not all(
+                    self.is_old(file.stat(follow_symlinks=False)) for file in files
+                ):
+                    continue
+                size = sum(file.stat(follow_symlinks=False).st_size for file in files)
+                self.found("stale thumbnail sets", entry.name, size)
+                if not self.dry_run:
+                    shutil.rmtree(entry.path, ignore_errors=True)
+
+    def collect_cache_temp_files(self, cache_root):
+        """Temp files of PDF and thumbnail cache writes that never completed"""
+        if not os.path.isdir(cache_root):
+            return
+        for entry in iter_media_files(cache_root):
+            if not entry.name.endswith(".tmp"):
+                continue
+            file_stat = entry.stat(follow_symlinks=False)
+            if not self.is_old(file_stat):
+                continue
+            self.found("cache temp files", entry.name, file_stat.st_size)
+            if not self.dry_run:
+                self.remove(entry.path)
+
+    def remove(self, path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.stderr.write(f"{path}: {e}")
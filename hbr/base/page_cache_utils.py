@@ -0,0 +1,108 @@
+import time
+from functools import wraps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse
+
+PAGE_CACHE_VERSION_KEY = "public_page:version"
+# How long a render may hold a page's lock before others give up on it
+PAGE_RENDER_LOCK_TIMEOUT = 30
+# How long a request waits for another's render when there is nothing to
+# serve meanwhile, before rendering the page itself
+PAGE_RENDER_WAIT = 5
+PAGE_RENDER_POLL_INTERVAL = 0.05
+
+# Rendered public pages are cached for anonymous visitors by path, tagged
+# with a version that CMS and public notice signals bump. On a stale or
+# missing entry only the request holding the page's lock renders; the others
+# serve the previous version meanwhile, or wait for the render when there is
+# none. PUBLIC_PAGE_CACHE_TIMEOUT bounds staleness where invalidations can't
+# reach (e.g. the per-process default cache); 0 disables the cache.
+
+
+def get_page_cache_timeout():
+    return getattr(settings, "PUBLIC_PAGE_CACHE_TIMEOUT", 600)
+
+
+def get_public_page_version():
+    return cache.get_or_set(PAGE_CACHE_VERSION_KEY, 1, None)
+
+
+def bump_public_page_version():
+    try:
+        cache.incr(PAGE_CACHE_VERSION_KEY)
+    except ValueError:
+        cache.set(PAGE_CACHE_VERSION_KEY, 1, None)
+
+
+def invalidate_public_pages():
+    """Drop every cached public page once the current transaction commits"""
+    transaction.on_commit(bump_public_page_version)
+
+
+def is_cacheable(request, response):
+    """Only plain 200 pages that carry nothing specific to the visitor"""
+    return (
+        response.status_code == 200
+        and not response.streaming
+        and not response.cookies
+        and not request.META.get("CSRF_COOKIE_USED")
+        and not request.META.get("CSRF_COOKIE_NEEDS_UPDATE")
+    )
+
+
+def cached_response(entry, status):
+    _, content, content_type = entry
+    response = HttpResponse(content, content_type=content_type)
+    response["Server-Timing"] = f'page;desc="{status}"'
+    return response
+
+
+def cache_public_page(view):
+    """Serve a view's page to anonymous GET/HEAD requests from the cache.
+
+    The cache key ignores the query string, so only decorate views whose
+    output doesn't depend on it.
+    """
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        timeout = get_page_cache_timeout()
+        if (
+            not timeout
+            or request.method not in ("GET", "HEAD")
+            or request.user.is_authenticated
+        ):
+            return view(request, *args, **kwargs)
+
+        key = f"public_page:{request.path}"
+        version = get_public_page_version()
+        entry = cache.get(key)
+        if entry is not None and entry[0] == version:
+            return cached_response(entry, "hit")
+
+        lock_key = f"{key}:lock:{version}"
+        if not cache.add(lock_key, 1, PAGE_RENDER_LOCK_TIMEOUT):
+            if entry is not None:
+                return cached_response(entry, "stale")
+            deadline = time.monotonic() + PAGE_RENDER_WAIT
+            while time.monotonic() < deadline:
+                time.sleep(PAGE_RENDER_POLL_INTERVAL)
+                entry = cache.get(key)
+                if entry is not None and entry[0] == version:
+                    return cached_response(entry, "hit")
+            return view(request, *args, **kwargs)
+
+        try:
+            response = view(request, *args, **kwargs)
+            if is_cacheable(request, response):
+                cache.set(
+                    key, (version, response.content, response["Content-Type"]), timeout
+                )
+        finally:
+            cache.delete(lock_key)
+        response["Server-Timing"] = 'page;desc="miss"'
+        return response
+
+    return wrapper
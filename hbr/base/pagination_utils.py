@@ -0,0 +1,173 @@
+import base64
+import binascii
+import datetime
+import json
+from functools import reduce
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from django.http import JsonResponse
+
+
+class KeysetPage:
+    """One page of a keyset-paginated queryset.
+
+    Iterates like a list; ``next_cursor``/``previous_cursor`` are opaque
+    strings to pass back as the ``cursor`` of the neighbouring pages.
+    """
+
+    def __init__(self, object_list, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    @property
+    def has_other_pages(self):
+        return self.has_next or self.has_previous
+
+
+def encode_cursor_value(value):
+    # Full precision: a truncated timestamp would skip or repeat rows
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    return str(value)
+
+
+def encode_cursor(direction, values):
+    payload = json.dumps([direction, values], default=encode_cursor_value)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    """Decode a cursor into (direction, values); None if it is invalid"""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        direction, values = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, ValueError, TypeError):
+        return None
+    if direction not in ("next", "previous") or not isinstance(values, list):
+        return None
+    return direction, values
+
+
+def get_ordering_field(model, field):
+    """Model field an ordering entry such as "-user__first_name" sorts by"""
+    *relations, name = field.lstrip("-").split("__")
+    for relation in relations:
+        model = model._meta.get_field(relation).related_model
+    return model._meta.get_field(name)
+
+
+def clean_cursor_values(model, ordering, values):
+    """Cursor values converted to their ordering fields' types.
+
+    Cursors come from the client, so a crafted or stale one could carry
+    values the query would fail on; those give None.
+    """
+    if len(values) != len(ordering):
+        return None
+    cleaned = []
+    for field, value in zip(ordering, values):
+        if value is None:
+            return None
+        try:
+            cleaned.append(get_ordering_field(model, field).to_python(value))
+        except (ValidationError, ValueError, TypeError):
+            return None
+    return cleaned
+
+
+def get_ordering_value(obj, field):
+    for attr in field.lstrip("-").split("__"):
+        obj = getattr(obj, attr)
+    return obj
+
+
+def keyset_filter(ordering, values):
+    """Q selecting rows that sort strictly after ``values`` under ``ordering``"""
+    conditions = []
+    for index, field in enumerate(ordering):
+        name = field.lstrip("-")
+        lookup = "lt" if field.startswith("-") else "gt"
+        equal = {
+            previous.lstrip("-"): value
+            for previous, value in zip(ordering[:index], values)
+        }
+        conditions.append(Q(**equal, **{f"{name}__{lookup}": values[index]}))
+    # Implied by the conditions, but lets the database seek an index on the
+    # first field instead of scanning it from the start
+    first = ordering[0].lstrip("-")
+    bound = "lte" if ordering[0].startswith("-") else "gte"
+    return Q(**{f"{first}__{bound}": values[0]}) & reduce(
+        lambda left, right: left | right, conditions
+    )
+
+
+def reverse_ordering(ordering):
+    return [field[1:] if field.startswith("-") else f"-{field}" for field in ordering]
+
+
+def paginate_keyset(queryset, ordering, cursor=None, per_page=20):
+    """Paginate a queryset by seeking past the last row instead of OFFSET.
+
+    ``ordering`` must end in a unique field (usually "id" or "-id") and its
+    fields must not be null, so every page costs one indexed range query no
+    matter how deep it is. There is no COUNT(*) and no page numbers.
+    """
+    direction, values = decode_cursor(cursor) or ("next", None)
+    if values is not None:
+        values = clean_cursor_values(queryset.model, ordering, values)
+        if values is None:
+            direction = "next"
+
+    page_ordering = ordering if direction == "next" else reverse_ordering(ordering)
+    rows = queryset.order_by(*page_ordering)
+    if values is not None:
+        rows = rows.filter(keyset_filter(page_ordering, values))
+    rows = list(rows[: per_page + 1])
+
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+    if direction == "previous":
+        rows.reverse()
+
+    def cursor_for(obj, cursor_direction):
+        return encode_cursor(
+            cursor_direction, [get_ordering_value(obj, field) for field in ordering]
+        )
+
+    has_next = has_more if direction == "next" else values is not None
+    has_previous = values is not None if direction == "next" else has_more
+    return KeysetPage(
+        rows,
+        next_cursor=cursor_for(rows[-1], "next") if rows and has_next else None,
+        previous_cursor=(
+            cursor_for(rows[0], "previous") if rows and has_previous else None
+        ),
+    )
+
+
+def keyset_json_response(page, key, serialize):
+    """JSON counterpart of a keyset-paginated list view"""
+    return JsonResponse(
+        {
+            key: [serialize(obj) for obj in page],
+            "next_cursor": page.next_cursor,
+            "previous_cursor": page.previous_cursor,
+        }
+    )
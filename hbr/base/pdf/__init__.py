@@ -0,0 +1,29 @@
+from .certificates import (
+    generate_certificate_html,
+    generate_certificate_pdf,
+    generate_certificate_pdf_fallback,
+    generate_certificate_pdfs,
+    get_certificate_template,
+    invalidate_certificate_template,
+)
+from .documents import (
+    generate_admit_card_pdf,
+    generate_admit_cards_pdf,
+    generate_exam_timetable_pdf,
+    generate_payment_receipt_pdf,
+    generate_student_profile_pdf,
+)
+
+__all__ = [
+    "generate_admit_card_pdf",
+    "generate_admit_cards_pdf",
+    "generate_certificate_html",
+    "generate_certificate_pdf",
+    "generate_certificate_pdf_fallback",
+    "generate_certificate_pdfs",
+    "generate_exam_timetable_pdf",
+    "generate_payment_receipt_pdf",
+    "generate_student_profile_pdf",
+    "get_certificate_template",
+    "invalidate_certificate_template",
+]
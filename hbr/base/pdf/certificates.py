@@ -0,0 +1,258 @@
+import hashlib
+import threading
+from datetime import datetime
+from io import BytesIO
+from django.template import Template, Context
+from reportlab.lib.units import inch
+from reportlab.platypus import Paragraph, Spacer
+from base.pdf_render_utils import submit_pdf
+from .flowables import build_pdf, get_school_name
+from .styles import PARAGRAPH_STYLES
+
+CERTIFICATE_PDF_OPTIONS = {
+    "page-size": "A4",
+    "margin-top": "1in",
+    "margin-right": "1in",
+    "margin-bottom": "1in",
+    "margin-left": "1in",
+    "encoding": "UTF-8",
+}
+
+# Compiled admin-authored templates by (CertificateType id, source hash).
+# The hash keeps an edit from serving the old template even in a process
+# that missed the save signal; the signal just frees the stale entry.
+_certificate_templates = {}
+_certificate_templates_lock = threading.Lock()
+
+
+def get_certificate_template(certificate_type):
+    """A certificate type's HTML template, parsed once per version"""
+    source = certificate_type.html_template
+    key = (certificate_type.pk, hashlib.sha256(source.encode()).hexdigest())
+    template = _certificate_templates.get(key)
+    if template is None:
+        template = Template(source)
+        with _certificate_templates_lock:
+            _certificate_templates[key] = template
+    return template
+
+
+def invalidate_certificate_template(certificate_type_id):
+    """Forget the compiled templates of a certificate type"""
+    with _certificate_templates_lock:
+        for key in [
+            key for key in _certificate_templates if key[0] == certificate_type_id
+        ]:
+            del _certificate_templates[key]
+
+
+def generate_certificate_html(student, certificate_type, template=None):
+    """
+    Render the HTML of a student's certificate.
+
+    Args:
+        student: Student model instance
+        certificate_type: CertificateType model instance
+        template: Compiled template of the type (optional)
+
+    Returns:
+        HTML string
+    """
+    # Prepare template context
+    context = {
+        "student_name": student.user.get_full_name(),
+        "father_name": student.father_name,
+        "mother_name": student.mother_name,
+        "class": str(student.classroom),
+        "roll_no": student.roll_no,
+        "admission_no": student.admission_no,
+        "date": datetime.now().strftime("%d %B %Y"),
+        "school_name": get_school_name(),
+    }
+
+    # Use HTML template if available, otherwise use default
+    if certificate_type.html_template:
+        template = template or get_certificate_template(certificate_type)
+        html_content = template.render(Context(context))
+    else:
+        # Default template
+        description_html = (
+            f'<p class="content">{certificate_type.description}</p>'
+            if certificate_type.description
+            else ""
+        )
+        html_content = f"""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <style>
+                body {{
+                    font-family: Arial, sans-serif;
+                    text-align: center;
+                    padding: 50px;
+                    background: #f9f9f9;
+                }}
+                .certificate {{
+                    background: white;
+                    padding: 40px;
+                    border: 5px solid #8F403C;
+                    max-width: 800px;
+                    margin: 0 auto;
+                }}
+                h1 {{
+                    color: #8F403C;
+                    font-size: 36px;
+                    margin-bottom: 20px;
+                }}
+                .student-name {{
+                    font-size: 28px;
+                    font-weight: bold;
+                    color: #8F403C;
+                    margin: 20px 0;
+                }}
+                .content {{
+                    font-size: 18px;
+                    line-height: 1.6;
+                    margin: 20px 0;
+                }}
+                .signature {{
+                    margin-top: 50px;
+                    font-size: 16px;
+                }}
+            </style>
+        </head>
+        <body>
+            <div class="certificate">
+                <h1>{{ school_name }}</h1>
+                <h2>Certificate of Achievement</h2>
+                <p class="content">This is to certify that</p>
+                <p class="student-name">{context['student_name']}</p>
+                <p class="content">has successfully completed the requirements for</p>
+                <h3>{certificate_type.name}</h3>
+                {description_html}
+                <p class="content">Issued on: {context['date']}</p>
+                <div class="signature">
+                    <p>___________________________</p>
+                    <p>Principal</p>
+                    <p>{{ school_name }}</p>
+                </div>
+            </div>
+        </body>
+        </html>
+        """
+
+    return html_content
+
+
+def generate_certificate_pdfs(students, certificate_type, return_exceptions=False):
+    """
+    Generate certificates of one type for many students.
+
+    The type's template is compiled once and the PDFs are rendered
+    concurrently on the renderer pool.
+
+    Args:
+        students: Student model instances
+        certificate_type: CertificateType model instance
+        return_exceptions: Put a failed certificate's exception in its place
+            in the result instead of raising it
+
+    Returns:
+        List of BytesIO buffers containing the PDFs, in ``students`` order
+    """
+    students = list(students)
+    template = (
+        get_certificate_template(certificate_type)
+        if certificate_type.html_template
+        else None
+    )
+
+    def submit(student):
+        html = generate_certificate_html(student, certificate_type, template)
+        return submit_pdf(html, CERTIFICATE_PDF_OPTIONS)
+
+    def render(student, future):
+        try:
+            return BytesIO(future.result())
+        except Exception as e:
+            # Fallback to ReportLab if pdfkit fails
+            print(f"PDFKit failed: {e}, using ReportLab fallback")
+            return generate_certificate_pdf_fallback(student, certificate_type)
+
+    if not return_exceptions:
+        futures = [submit(student) for student in students]
+        return [render(student, future) for student, future in zip(students, futures)]
+
+    futures = []
+    for student in students:
+        try:
+            futures.append(submit(student))
+        except Exception as e:
+            futures.append(e)
+    buffers = []
+    for student, future in zip(students, futures):
+        if isinstance(future, Exception):
+            buffers.append(future)
+            continue
+        try:
+            buffers.append(render(student, future))
+        except Exception as e:
+            buffers.append(e)
+    return buffers
+
+
+def generate_certificate_pdf(student, certificate_type):
+    """
+    Generate a certificate PDF for a student using HTML template.
+
+    Args:
+        student: Student model instance
+        certificate_type: CertificateType model instance
+
+    Returns:
+        BytesIO buffer containing the PDF
+    """
+    return generate_certificate_pdfs([student], certificate_type)[0]
+
+
+def generate_certificate_pdf_fallback(student, certificate_type):
+    """
+    Fallback certificate generation using ReportLab.
+    """
+    styles = PARAGRAPH_STYLES
+    body_style = styles["BodyLargeCentered"]
+    story = []
+
+    # Header
+    story.append(Paragraph(get_school_name(), styles["SchoolTitleCentered"]))
+    story.append(Spacer(1, 0.5 * inch))
+
+    # Certificate Title
+    story.append(Paragraph(certificate_type.name, styles["CenteredTitle"]))
+    story.append(Spacer(1, 0.5 * inch))
+
+    # Body Text
+    story.append(Paragraph("This is to certify that", body_style))
+    story.append(Spacer(1, 0.25 * inch))
+
+    # Student Name
+    full_name = f"{student.user.first_name} {student.user.last_name}"
+    story.append(Paragraph(full_name, styles["CertificateName"]))
+
+    # Certificate Type Description
+    if certificate_type.description:
+        story.append(Spacer(1, 0.25 * inch))
+        story.append(Paragraph(certificate_type.description, body_style))
+
+    # Date
+    current_date = datetime.now().strftime("%d %B %Y")
+    story.append(Spacer(1, 0.5 * inch))
+    story.append(Paragraph(f"Issued on: {current_date}", body_style))
+
+    # Signature placeholder
+    story.append(Spacer(1, 1 * inch))
+    story.append(Paragraph("___________________________", body_style))
+    story.append(Paragraph("Principal", body_style))
+    story.append(Paragraph(get_school_name(), body_style))
+
+    return build_pdf(story, top_margin=1 * inch, bottom_margin=1 * inch)
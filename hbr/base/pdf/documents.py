@@ -0,0 +1,397 @@
+from datetime import datetime
+from reportlab.lib.units import inch
+from reportlab.platypus import PageBreak, Paragraph, Spacer, Table
+from academics.models import ExamSchedule
+from .flowables import (
+    build_pdf,
+    document_footer,
+    divider,
+    get_school_name,
+    profile_photo,
+    school_header,
+)
+from .styles import PARAGRAPH_STYLES, TABLE_STYLES
+
+
+def generate_student_profile_pdf(student_data, user_data):
+    """
+    Generate a PDF student profile document.
+
+    Args:
+        student_data: Dictionary containing student model data
+        user_data: Dictionary containing user model data
+
+    Returns:
+        BytesIO buffer containing the PDF
+    """
+    styles = PARAGRAPH_STYLES
+    story = school_header()
+
+    # --- Profile Section Table ---
+    student_info = [
+        [
+            profile_photo(
+                student_data.get("profile_photo"), 1.2 * inch, styles["Contact"]
+            ),
+            Paragraph(
+                f'<b>{user_data["first_name"]} {user_data["last_name"]}</b>',
+                styles["StudentName"],
+            ),
+        ],
+        [
+            "",
+            Paragraph(
+                f'Email: {user_data["email"]}<br/>'
+                f'Mobile: {student_data["mobile_no"]}<br/>'
+                f'Admission No: {student_data["admission_no"]}',
+                styles["Contact"],
+            ),
+        ],
+    ]
+
+    profile_table = Table(student_info, colWidths=[1.5 * inch, 5 * inch])
+    profile_table.setStyle(TABLE_STYLES["profile_card"])
+    story.append(profile_table)
+    story.append(Spacer(1, 0.3 * inch))
+
+    # --- Student Details Table ---
+    story.append(Paragraph("Student Information", styles["SectionHeader"]))
+
+    details_data = [
+        [
+            "SR Number",
+            str(student_data["sr_no"]),
+            "Roll Number",
+            str(student_data["roll_no"]),
+        ],
+        [
+            "Father's Name",
+            student_data["father_name"],
+            "Mother's Name",
+            student_data["mother_name"],
+        ],
+        [
+            "Date of Birth",
+            student_data["dob"].strftime("%d/%m/%Y") if student_data["dob"] else "N/A",
+            "Gender",
+            student_data["gender"],
+        ],
+        [
+            "Category",
+            student_data["category"] or "General",
+            "Class",
+            str(student_data["classroom"]),
+        ],
+        [
+            "Stream",
+            student_data.get("stream") or "N/A",
+            "Weight",
+            f"{student_data.get('weight')} kg" if student_data.get("weight") else "N/A",
+        ],
+        [
+            "Height",
+            f"{student_data.get('height')} cm" if student_data.get("height") else "N/A",
+            "Date Joined",
+            user_data["date_joined"].strftime("%d/%m/%Y"),
+        ],
+        [
+            "Subjects",
+            student_data.get("subjects") or "N/A",
+            "",
+            "",
+        ],
+        [
+            "Current Address",
+            student_data.get("current_address") or "N/A",
+            "",
+            "",
+        ],
+        [
+            "Permanent Address",
+            student_data.get("permanent_address") or "N/A",
+            "",
+            "",
+        ],
+    ]
+
+    details_table = Table(
+        details_data, colWidths=[1.5 * inch, 1.75 * inch, 1.5 * inch, 1.75 * inch]
+    )
+    details_table.setStyle(TABLE_STYLES["profile_details"])
+    story.append(details_table)
+    story.append(Spacer(1, 0.4 * inch))
+
+    # --- Footer ---
+    story.extend(
+        document_footer(
+            [
+                "This is an official student profile document generated by the school management system.",
+                f"Generated on: {user_data['date_joined'].strftime('%d %B %Y')}",
+            ]
+        )
+    )
+
+    return build_pdf(story)
+
+
+def get_admit_card_schedule(exam):
+    """An exam's schedule rows in the order admit cards list them"""
+    return list(ExamSchedule.objects.filter(exam=exam).order_by("date", "time"))
+
+
+def admit_card_story(exam, student, schedule):
+    """Flowables for one student's admit card, given the exam's schedule rows"""
+    styles = PARAGRAPH_STYLES
+    story = school_header()
+
+    # Admit Card Title
+    story.append(Paragraph("ADMIT CARD", styles["DocumentTitle"]))
+    story.append(Paragraph(f"Exam: {exam.name}", styles["DocumentTitle"]))
+    story.append(Spacer(1, 0.3 * inch))
+
+    # Student Information Table with Photo
+    student_info = [
+        [
+            profile_photo(student.profile_photo, 1 * inch, styles["Body"]),
+            Paragraph(
+                f"<b>{student.user.get_full_name()}</b><br/>"
+                f"Roll No: {student.roll_no}<br/>"
+                f"Class: {student.classroom}",
+                styles["Body"],
+            ),
+        ],
+        [
+            "",
+            Paragraph(
+                f"Father's Name: {student.father_name}<br/>"
+                f"Mother's Name: {student.mother_name}<br/>"
+                f"Date of Birth: {student.dob.strftime('%d/%m/%Y') if student.dob else 'N/A'}",
+                styles["Body"],
+            ),
+        ],
+    ]
+
+    student_table = Table(student_info, colWidths=[1.2 * inch, 5.3 * inch])
+    student_table.setStyle(TABLE_STYLES["admit_card_student"])
+    story.append(student_table)
+    story.append(Spacer(1, 0.3 * inch))
+
+    # Exam Schedule
+    story.append(Paragraph("Exam Schedule:", styles["Body"]))
+    story.append(Spacer(1, 0.1 * inch))
+
+    if schedule:
+        schedule_data = [["Date", "Time", "Subject", "Room"]]
+        for item in schedule:
+            schedule_data.append(
+                [
+                    item.date.strftime("%d/%m/%Y"),
+                    item.time.strftime("%H:%M"),
+                    item.subject,
+                    item.room or "N/A",
+                ]
+            )
+
+        schedule_table = Table(
+            schedule_data, colWidths=[1.5 * inch, 1.2 * inch, 2.5 * inch, 1.3 * inch]
+        )
+        schedule_table.setStyle(TABLE_STYLES["admit_card_schedule"])
+        story.append(schedule_table)
+    else:
+        story.append(Paragraph("No schedule information available.", styles["Body"]))
+
+    # Instructions
+    story.append(Spacer(1, 0.3 * inch))
+    story.append(Paragraph("Important Instructions:", styles["Body"]))
+    story.append(Spacer(1, 0.1 * inch))
+
+    instructions = [
+        "1. Bring this admit card to the examination hall.",
+        "2. Arrive at the examination center 30 minutes before the exam time.",
+        "3. Carry a valid photo ID along with this admit card.",
+        "4. Electronic devices are not allowed in the examination hall.",
+        "5. Follow all examination rules and regulations.",
+    ]
+
+    for instruction in instructions:
+        story.append(Paragraph(instruction, styles["Body"]))
+
+    # Footer
+    current_date = datetime.now().strftime("%d %B %Y")
+    story.append(Spacer(1, 0.5 * inch))
+    story.extend(
+        document_footer(
+            [
+                f"Issued on: {current_date}",
+                f"{get_school_name()} - Examination Department",
+            ]
+        )
+    )
+
+    return story
+
+
+def generate_admit_card_pdf(exam, student, schedule=None):
+    """
+    Generate an admit card PDF for a student.
+
+    Args:
+        exam: Exam model instance
+        student: Student model instance
+        schedule: Preloaded ExamSchedule rows (optional)
+
+    Returns:
+        BytesIO buffer containing the PDF
+    """
+    if schedule is None:
+        schedule = get_admit_card_schedule(exam)
+    return build_pdf(admit_card_story(exam, student, schedule))
+
+
+def generate_admit_cards_pdf(exam, students, schedule=None):
+    """
+    Generate one multi-page PDF holding the admit cards of many students.
+
+    Every card starts on a new page and the whole batch is laid out in a
+    single build, sharing one load of the exam schedule.
+
+    Args:
+        exam: Exam model instance
+        students: Student model instances, with user and classroom loaded
+        schedule: Preloaded ExamSchedule rows (optional)
+
+    Returns:
+        BytesIO buffer containing the PDF
+    """
+    if schedule is None:
+        schedule = get_admit_card_schedule(exam)
+    story = []
+    for student in students:
+        if story:
+            story.append(PageBreak())
+        story.extend(admit_card_story(exam, student, schedule))
+    if not story:
+        story.append(Paragraph("No students found.", PARAGRAPH_STYLES["Body"]))
+    return build_pdf(story)
+
+
+def generate_exam_timetable_pdf(exam, schedule_data, student=None):
+    """
+    Generate an exam timetable PDF.
+
+    Args:
+        exam: Exam model instance
+        schedule_data: List of schedule dictionaries
+        student: Student model instance (optional)
+
+    Returns:
+        BytesIO buffer containing the PDF
+    """
+    styles = PARAGRAPH_STYLES
+    story = school_header()
+
+    # Exam Title
+    story.append(Paragraph(f"Exam Timetable - {exam.name}", styles["DocumentTitle"]))
+
+    # Term and Session Info
+    story.append(Paragraph(f"Term: {exam.term.name}", styles["Body"]))
+    story.append(
+        Paragraph(
+            f"Academic Session: {exam.term.academic_session.year}", styles["Body"]
+        )
+    )
+
+    if student:
+        story.append(
+            Paragraph(f"Student: {student.user.get_full_name()}", styles["Body"])
+        )
+        story.append(Paragraph(f"Roll No: {student.roll_no}", styles["Body"]))
+
+    story.append(Spacer(1, 0.3 * inch))
+
+    # Schedule Table
+    if schedule_data:
+        table_data = [["Date", "Time", "Subject", "Room"]]
+        for item in schedule_data:
+            table_data.append(
+                [item["date"], item["time"], item["subject"], item["room"] or "N/A"]
+            )
+
+        schedule_table = Table(
+            table_data, colWidths=[1.5 * inch, 1.2 * inch, 2.5 * inch, 1.3 * inch]
+        )
+        schedule_table.setStyle(TABLE_STYLES["exam_timetable"])
+        story.append(schedule_table)
+    else:
+        story.append(Paragraph("No schedule information available.", styles["Body"]))
+
+    # Footer
+    current_date = datetime.now().strftime("%d %B %Y")
+    story.append(Spacer(1, 0.5 * inch))
+    story.extend(
+        document_footer(
+            [
+                f"Generated on: {current_date}",
+                f"{get_school_name()} - Examination Department",
+            ]
+        )
+    )
+
+    return build_pdf(story)
+
+
+def generate_payment_receipt_pdf(payment):
+    """
+    Generate a payment receipt PDF.
+
+    Args:
+        payment: Payment model instance
+
+    Returns:
+        BytesIO buffer containing the PDF
+    """
+    styles = PARAGRAPH_STYLES
+    body_style = styles["BodyLarge"]
+    story = []
+
+    # Header
+    story.append(Paragraph(get_school_name(), styles["SchoolTitleCentered"]))
+    story.append(Spacer(1, 0.5 * inch))
+
+    # Receipt Title
+    story.append(Paragraph("Payment Receipt", styles["CenteredTitle"]))
+    story.append(Spacer(1, 0.5 * inch))
+
+    # Receipt Details
+    story.append(Paragraph(f"<b>Receipt No:</b> {payment.id}", body_style))
+    story.append(
+        Paragraph(f"<b>Student:</b> {payment.student.user.get_full_name()}", body_style)
+    )
+    story.append(Paragraph(f"<b>Roll No:</b> {payment.student.roll_no}", body_style))
+    story.append(Paragraph(f"<b>Description:</b> {payment.description}", body_style))
+    story.append(Paragraph(f"<b>Amount:</b> ₹{payment.amount}", body_style))
+    story.append(Paragraph(f"<b>Status:</b> {payment.status}", body_style))
+    if payment.payment_date:
+        story.append(
+            Paragraph(
+                f"<b>Payment Date:</b> {payment.payment_date.strftime('%d %B %Y')}",
+                body_style,
+            )
+        )
+    if payment.transaction_id:
+        story.append(
+            Paragraph(f"<b>Transaction ID:</b> {payment.transaction_id}", body_style)
+        )
+
+    # Date
+    current_date = datetime.now().strftime("%d %B %Y")
+    story.append(Spacer(1, 0.5 * inch))
+    story.append(Paragraph(f"Issued on: {current_date}", body_style))
+
+    # Signature placeholder
+    story.append(Spacer(1, 1 * inch))
+    story.append(Paragraph("___________________________", body_style))
+    story.append(Paragraph("Accounts Department", body_style))
+    story.append(Paragraph(get_school_name(), body_style))
+
+    return build_pdf(story, top_margin=1 * inch, bottom_margin=1 * inch)
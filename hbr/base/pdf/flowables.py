@@ -0,0 +1,79 @@
+import os
+from io import BytesIO
+from django.conf import settings
+from decouple import config
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.units import inch
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, Image
+from .styles import PARAGRAPH_STYLES, TABLE_STYLES
+from .thumbnails import get_print_image
+
+SCHOOL_ADDRESS = "123 Education Street, Knowledge City - 400001"
+SCHOOL_CONTACT = "Phone: +91-22-1234-5678 | Email: info@stmaryshigh.edu"
+NO_PHOTO = '<para align="center" fontSize="8" textColor="#9CA3AF">No Photo</para>'
+
+# Flowables hold layout state, so these build fresh (cheap) instances around
+# the shared styles instead of sharing flowables between documents.
+
+
+def get_school_name():
+    return config("SCHOOL_NAME", default="SCHOOL")
+
+
+def divider():
+    """Full-width accent rule in the primary colour"""
+    table = Table([[""]], colWidths=[6.5 * inch])
+    table.setStyle(TABLE_STYLES["divider"])
+    return table
+
+
+def school_header():
+    """Letterhead: school name, address and contact line over a divider"""
+    return [
+        Paragraph(get_school_name(), PARAGRAPH_STYLES["SchoolTitle"]),
+        Paragraph(SCHOOL_ADDRESS, PARAGRAPH_STYLES["SchoolSubtitle"]),
+        Paragraph(SCHOOL_CONTACT, PARAGRAPH_STYLES["SchoolSubtitle"]),
+        divider(),
+        Spacer(1, 0.25 * inch),
+    ]
+
+
+def document_footer(lines):
+    """Divider followed by small centred footer lines"""
+    return [
+        divider(),
+        Spacer(1, 0.15 * inch),
+        *(Paragraph(line, PARAGRAPH_STYLES["Footer"]) for line in lines),
+    ]
+
+
+def profile_photo(photo, size, fallback_style):
+    """A student's photo scaled to a square, or a "No Photo" placeholder"""
+    if photo:
+        try:
+            image_path = os.path.join(settings.MEDIA_ROOT, str(photo))
+            if os.path.exists(image_path):
+                image = Image(
+                    get_print_image(image_path, size), width=size, height=size
+                )
+                image.hAlign = "CENTER"
+                return image
+        except Exception:
+            pass
+    return Paragraph(NO_PHOTO, fallback_style)
+
+
+def build_pdf(story, top_margin=0.6 * inch, bottom_margin=0.6 * inch):
+    """Lay out a story on letter paper and return the PDF in a BytesIO"""
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=letter,
+        topMargin=top_margin,
+        bottomMargin=bottom_margin,
+        leftMargin=0.75 * inch,
+        rightMargin=0.75 * inch,
+    )
+    doc.build(story)
+    buffer.seek(0)
+    return buffer
@@ -0,0 +1,243 @@
+from types import MappingProxyType
+from reportlab.lib import colors
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.platypus import TableStyle
+
+# Built once at import and shared read-only by every document (ReportLab only
+# reads styles while laying out); documents used to rebuild them on each call.
+
+PRIMARY_COLOR = colors.HexColor("#8F403C")  # Deep Maroon
+SECONDARY_COLOR = colors.HexColor("#F4F9FA")  # Light Blue-Gray
+DARK_TEXT = colors.HexColor("#333333")
+LIGHT_TEXT = colors.HexColor("#9CA3AF")
+BORDER_COLOR = colors.HexColor("#E5E7EB")
+
+
+def build_paragraph_styles():
+    """Paragraph styles by name, derived from ReportLab's sample sheet"""
+    sample = getSampleStyleSheet()
+    styles = [
+        # Letterhead used by profiles, admit cards and timetables
+        ParagraphStyle(
+            "SchoolTitle",
+            parent=sample["Heading1"],
+            fontSize=24,
+            spaceAfter=4,
+            alignment=0,
+            textColor=PRIMARY_COLOR,
+            fontName="Helvetica-Bold",
+            leading=28,
+        ),
+        ParagraphStyle(
+            "SchoolSubtitle",
+            parent=sample["Normal"],
+            fontSize=10,
+            alignment=0,
+            textColor=LIGHT_TEXT,
+            spaceAfter=4,
+            leading=14,
+        ),
+        # Centred letterhead used by receipts and certificates
+        ParagraphStyle(
+            "SchoolTitleCentered",
+            parent=sample["Heading1"],
+            fontSize=28,
+            spaceAfter=10,
+            alignment=1,
+            textColor=PRIMARY_COLOR,
+            fontName="Helvetica-Bold",
+        ),
+        ParagraphStyle(
+            "DocumentTitle",
+            parent=sample["Heading1"],
+            fontSize=20,
+            alignment=1,
+            textColor=PRIMARY_COLOR,
+            fontName="Helvetica-Bold",
+            spaceAfter=20,
+        ),
+        ParagraphStyle(
+            "CenteredTitle",
+            parent=sample["Heading1"],
+            fontSize=24,
+            spaceAfter=20,
+            alignment=1,
+            textColor=PRIMARY_COLOR,
+            fontName="Helvetica-Bold",
+        ),
+        ParagraphStyle(
+            "SectionHeader",
+            parent=sample["Heading2"],
+            fontSize=14,
+            alignment=0,
+            textColor=PRIMARY_COLOR,
+            fontName="Helvetica-Bold",
+            spaceAfter=8,
+            spaceBefore=15,
+        ),
+        ParagraphStyle(
+            "StudentName",
+            parent=sample["Heading1"],
+            fontSize=20,
+            alignment=0,
+            textColor=DARK_TEXT,
+            fontName="Helvetica-Bold",
+            spaceAfter=4,
+            leading=24,
+        ),
+        ParagraphStyle(
+            "CertificateName",
+            parent=sample["Heading1"],
+            fontSize=20,
+            alignment=1,
+            textColor=PRIMARY_COLOR,
+            fontName="Helvetica-Bold",
+            spaceAfter=10,
+        ),
+        ParagraphStyle(
+            "Contact",
+            parent=sample["Normal"],
+            fontSize=9,
+            alignment=0,
+            textColor=DARK_TEXT,
+            leading=13,
+        ),
+        ParagraphStyle(
+            "Body",
+            parent=sample["Normal"],
+            fontSize=12,
+            alignment=0,
+            textColor=DARK_TEXT,
+            leading=16,
+        ),
+        ParagraphStyle(
+            "BodyLarge",
+            parent=sample["Normal"],
+            fontSize=14,
+            alignment=0,
+            textColor=DARK_TEXT,
+            leading=20,
+        ),
+        ParagraphStyle(
+            "BodyLargeCentered",
+            parent=sample["Normal"],
+            fontSize=14,
+            alignment=1,
+            textColor=DARK_TEXT,
+            leading=20,
+        ),
+        ParagraphStyle(
+            "Footer",
+            parent=sample["Normal"],
+            fontSize=8,
+            alignment=1,
+            textColor=LIGHT_TEXT,
+            leading=12,
+        ),
+    ]
+    return MappingProxyType({style.name: style for style in styles})
+
+
+def _schedule_table_style(header_size, header_padding, body_size, body_padding):
+    return TableStyle(
+        [
+            # Header styling
+            ("BACKGROUND", (0, 0), (-1, 0), SECONDARY_COLOR),
+            ("TEXTCOLOR", (0, 0), (-1, 0), DARK_TEXT),
+            ("ALIGN", (0, 0), (-1, 0), "CENTER"),
+            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+            ("FONTSIZE", (0, 0), (-1, 0), header_size),
+            ("TOPPADDING", (0, 0), (-1, 0), header_padding),
+            ("BOTTOMPADDING", (0, 0), (-1, 0), header_padding),
+            # Data styling
+            ("BACKGROUND", (0, 1), (-1, -1), colors.white),
+            ("TEXTCOLOR", (0, 1), (-1, -1), DARK_TEXT),
+            ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+            ("FONTSIZE", (0, 1), (-1, -1), body_size),
+            ("TOPPADDING", (0, 1), (-1, -1), body_padding),
+            ("BOTTOMPADDING", (0, 1), (-1, -1), body_padding),
+            # Grid
+            ("GRID", (0, 0), (-1, -1), 0.5, BORDER_COLOR),
+        ]
+    )
+
+
+def build_table_styles():
+    """Table styles by the kind of table they dress"""
+    return MappingProxyType(
+        {
+            "divider": TableStyle(
+                [
+                    ("LINEABOVE", (0, 0), (-1, -1), 2, PRIMARY_COLOR),
+                    ("TOPPADDING", (0, 0), (-1, -1), 0),
+                    ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
+                ]
+            ),
+            "profile_card": TableStyle(
+                [
+                    ("BACKGROUND", (0, 0), (-1, -1), SECONDARY_COLOR),
+                    ("ALIGN", (0, 0), (0, -1), "CENTER"),
+                    ("ALIGN", (1, 0), (1, -1), "LEFT"),
+                    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+                    ("SPAN", (0, 0), (0, 1)),
+                    ("LEFTPADDING", (0, 0), (-1, -1), 15),
+                    ("RIGHTPADDING", (0, 0), (-1, -1), 15),
+                    ("TOPPADDING", (0, 0), (-1, -1), 15),
+                    ("BOTTOMPADDING", (0, 0), (-1, -1), 15),
+                    ("BOX", (0, 0), (-1, -1), 0.5, BORDER_COLOR),
+                ]
+            ),
+            "profile_details": TableStyle(
+                [
+                    ("BACKGROUND", (0, 0), (-1, -1), colors.white),
+                    ("TEXTCOLOR", (0, 0), (-1, -1), DARK_TEXT),
+                    ("ALIGN", (0, 0), (0, -1), "LEFT"),
+                    ("ALIGN", (1, 0), (1, -1), "LEFT"),
+                    ("ALIGN", (2, 0), (2, -1), "LEFT"),
+                    ("ALIGN", (3, 0), (3, -1), "LEFT"),
+                    # Bold the labels for better visual hierarchy
+                    ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
+                    ("FONTNAME", (2, 0), (2, -1), "Helvetica-Bold"),
+                    ("FONTSIZE", (0, 0), (-1, -1), 9),
+                    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+                    ("LEFTPADDING", (0, 0), (-1, -1), 12),
+                    ("RIGHTPADDING", (0, 0), (-1, -1), 12),
+                    ("TOPPADDING", (0, 0), (-1, -1), 10),
+                    ("BOTTOMPADDING", (0, 0), (-1, -1), 10),
+                    ("GRID", (0, 0), (-1, -1), 0.5, BORDER_COLOR),
+                    (
+                        "ROWBACKGROUNDS",
+                        (0, 0),
+                        (-1, -1),
+                        [SECONDARY_COLOR, colors.white],
+                    ),
+                    # Span empty cells for full-width rows
+                    ("SPAN", (1, 5), (3, 5)),
+                    ("SPAN", (1, 6), (3, 6)),
+                    ("SPAN", (1, 7), (3, 7)),
+                ]
+            ),
+            "admit_card_student": TableStyle(
+                [
+                    ("BACKGROUND", (0, 0), (-1, -1), colors.white),
+                    ("TEXTCOLOR", (0, 0), (-1, -1), DARK_TEXT),
+                    ("ALIGN", (0, 0), (0, -1), "CENTER"),
+                    ("ALIGN", (1, 0), (1, -1), "LEFT"),
+                    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+                    ("FONTSIZE", (0, 0), (-1, -1), 10),
+                    ("TOPPADDING", (0, 0), (-1, -1), 12),
+                    ("BOTTOMPADDING", (0, 0), (-1, -1), 12),
+                    ("LEFTPADDING", (0, 0), (-1, -1), 12),
+                    ("RIGHTPADDING", (0, 0), (-1, -1), 12),
+                    ("GRID", (0, 0), (-1, -1), 0.5, BORDER_COLOR),
+                    ("SPAN", (0, 0), (0, 1)),  # Profile photo spans both rows
+                ]
+            ),
+            "admit_card_schedule": _schedule_table_style(10, 8, 9, 6),
+            "exam_timetable": _schedule_table_style(12, 12, 10, 8),
+        }
+    )
+
+
+PARAGRAPH_STYLES = build_paragraph_styles()
+TABLE_STYLES = build_table_styles()
@@ -0,0 +1,82 @@
+import glob
+import hashlib
+import os
+import tempfile
+from django.conf import settings
+from PIL import Image as PILImage
+
+THUMBNAIL_DIR = "pdf_thumbnails"
+PRINT_DPI = 300
+JPEG_QUALITY = 85
+
+# Uploaded photos straight off a phone are several megapixels; ReportLab
+# would decode and embed every one at full size in every document. Photos
+# are instead scaled once to the print size and the JPEG is reused until the
+# upload changes.
+
+
+def get_thumbnail_root():
+    return os.path.join(settings.MEDIA_ROOT, THUMBNAIL_DIR)
+
+
+def get_thumbnail_dir(image_path):
+    """Directory holding every cached thumbnail of one photo"""
+    source = hashlib.sha1(os.path.abspath(image_path).encode()).hexdigest()
+    return os.path.join(get_thumbnail_root(), source[:2], source)
+
+
+def get_thumbnail_path(image_path, mtime_ns, pixels):
+    """Cache file for one version of a photo at one size"""
+    return os.path.join(get_thumbnail_dir(image_path), f"{mtime_ns}-{pixels}.jpg")
+
+
+def write_thumbnail(image_path, thumbnail_path, pixels):
+    with PILImage.open(image_path) as image:
+        image.draft("RGB", (pixels, pixels))  # cheap JPEG downscale on decode
+        # Same square stretch the PDF applies when it sizes the image
+        thumbnail = image.resize((pixels, pixels), PILImage.LANCZOS)
+    if thumbnail.mode in ("RGBA", "LA", "P"):
+        thumbnail = thumbnail.convert("RGBA")
+        background = PILImage.new("RGB", thumbnail.size, "white")
+        background.paste(thumbnail, mask=thumbnail.getchannel("A"))
+        thumbnail = background
+    elif thumbnail.mode != "RGB":
+        thumbnail = thumbnail.convert("RGB")
+
+    directory = os.path.dirname(thumbnail_path)
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "wb") as file:
+        thumbnail.save(file, "JPEG", quality=JPEG_QUALITY, optimize=True)
+    os.replace(temp_path, thumbnail_path)
+
+    # Thumbnails of earlier uploads to the same path are never used again
+    for path in glob.glob(os.path.join(directory, f"*-{pixels}.jpg")):
+        if path != thumbnail_path:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+def get_print_image(image_path, size):
+    """Path of a JPEG of ``image_path`` scaled to ``size`` points at print DPI.
+
+    Built on first use and cached by source path and modification time;
+    images already no larger than the print size are returned as they are.
+    """
+    pixels = round(size / 72 * PRINT_DPI)
+    mtime_ns = os.stat(image_path).st_mtime_ns
+    thumbnail_path = get_thumbnail_path(image_path, mtime_ns, pixels)
+    if os.path.exists(thumbnail_path):
+        return thumbnail_path
+
+    try:
+        with PILImage.open(image_path) as image:
+            if image.format == "JPEG" and max(image.size) <= pixels:
+                return image_path
+        write_thumbnail(image_path, thumbnail_path, pixels)
+    except OSError:
+        # Unreadable or unwritable: let ReportLab try the original
+        return image_path
+    return thumbnail_path
@@ -0,0 +1,158 @@
+import glob
+import hashlib
+import json
+import os
+import tempfile
+import time
+from django.conf import settings
+from decouple import config
+
+PDF_CACHE_DIR = "pdf_cache"
+EVICTION_INTERVAL = 60
+
+# Bump a document's version whenever its generator's output changes, so
+# entries rendered by the old code are never served again
+TEMPLATE_VERSIONS = {
+    "profile": 2,
+    "admit_card": 2,
+    "exam_timetable": 1,
+    "receipt": 1,
+}
+
+_last_eviction = None
+
+
+def get_cache_root():
+    return os.path.join(settings.MEDIA_ROOT, PDF_CACHE_DIR)
+
+
+def model_fingerprint(obj):
+    """Every concrete field value of a model instance, for cache keys"""
+    if obj is None:
+        return None
+    return [
+        obj._meta.label,
+        [(field.attname, field.value_to_string(obj)) for field in obj._meta.fields],
+    ]
+
+
+def user_fingerprint(user):
+    """The user fields documents print, for cache keys.
+
+    Not model_fingerprint(): last_login changes on every login and would
+    re-render every document the user downloads afterwards.
+    """
+    if user is None:
+        return None
+    return [user.first_name, user.last_name, user.username, user.email]
+
+
+def object_tag(model, pk):
+    """Filename tag linking cache entries to the object they were built from"""
+    return f"{model._meta.model_name}{pk}"
+
+
+def build_cache_key(kind, inputs):
+    payload = json.dumps(
+        [
+            kind,
+            TEMPLATE_VERSIONS[kind],
+            config("SCHOOL_NAME", default="SCHOOL"),
+            inputs,
+        ],
+        default=str,
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def get_cache_path(key, tags):
+    # Tags sit between dots so "exam5" never matches an "exam51" entry
+    filename = ".".join([key, *tags, "pdf"])
+    return os.path.join(get_cache_root(), key[:2], filename)
+
+
+def read_cached_pdf(path):
+    try:
+        with open(path, "rb") as file:
+            data = file.read()
+    except FileNotFoundError:
+        return None
+    # The modification time doubles as the last access time for eviction
+    os.utime(path)
+    return data
+
+
+def write_cached_pdf(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    with os.fdopen(fd, "wb") as file:
+        file.write(data)
+    os.replace(temp_path, path)
+
+
+def get_or_render_pdf(kind, inputs, related, render):
+    """Return PDF bytes for ``inputs``, rendering only on a cache miss.
+
+    ``inputs`` must capture everything the generator reads (model
+    fingerprints, prepared data, the date if the document prints it), so a
+    changed input always means a new key. ``related`` lists the model
+    instances whose deletion or changes should purge the entry.
+    """
+    if not settings.PDF_CACHE_MAX_SIZE:
+        return render().getvalue()
+
+    path = get_cache_path(
+        build_cache_key(kind, inputs),
+        [object_tag(type(obj), obj.pk) for obj in related],
+    )
+    data = read_cached_pdf(path)
+    if data is None:
+        data = render().getvalue()
+        write_cached_pdf(path, data)
+        maybe_evict_pdf_cache()
+    return data
+
+
+def invalidate_pdf_cache(model, pk):
+    """Delete every cached PDF built from a model instance"""
+    pattern = os.path.join(get_cache_root(), "*", f"*.{object_tag(model, pk)}.*")
+    for path in glob.glob(pattern):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def evict_pdf_cache(max_size=None):
+    """Delete least recently used entries until the cache fits ``max_size``"""
+    max_size = settings.PDF_CACHE_MAX_SIZE if max_size is None else max_size
+    entries = []
+    for path in glob.glob(os.path.join(get_cache_root(), "*", "*.pdf")):
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= max_size:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+        removed += 1
+    return removed
+
+
+def maybe_evict_pdf_cache():
+    """Run eviction at most once per EVICTION_INTERVAL seconds per process"""
+    global _last_eviction
+    now = time.monotonic()
+    if _last_eviction is None or now - _last_eviction >= EVICTION_INTERVAL:
+        _last_eviction = now
+        evict_pdf_cache()
@@ -0,0 +1,153 @@
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from django.conf import settings
+
+# Options every render gets unless the caller overrides them. Documents are
+# written to disk as UTF-8, so the encoding has to be stated explicitly.
+DEFAULT_OPTIONS = {
+    "quiet": "",
+    "encoding": "UTF-8",
+}
+
+# wkhtmltopdf has no server mode, so the pool bounds how many renderer
+# processes run at once; the worker threads live for the whole process.
+_executor = None
+_executor_lock = threading.Lock()
+
+
+class RenderError(Exception):
+    """Raised when wkhtmltopdf fails or runs past its timeout"""
+
+
+@lru_cache
+def get_wkhtmltopdf_path():
+    """Path to the wkhtmltopdf binary, resolved once per process"""
+    return getattr(settings, "WKHTMLTOPDF_PATH", "") or shutil.which("wkhtmltopdf")
+
+
+def pool_enabled():
+    return getattr(settings, "PDF_RENDER_POOL", True) and bool(get_wkhtmltopdf_path())
+
+
+def get_executor():
+    """The process-wide renderer pool, started on first use"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, "PDF_RENDER_WORKERS", 2),
+                    thread_name_prefix="pdf-render",
+                )
+    return _executor
+
+
+def build_command(options, inputs, output):
+    """wkhtmltopdf argv for pdfkit-style options ({"page-size": "A4", ...})"""
+    command = [get_wkhtmltopdf_path()]
+    for name, value in {**DEFAULT_OPTIONS, **(options or {})}.items():
+        command.append(f"--{name.lstrip('-')}")
+        if value not in ("", None, True):
+            command.append(str(value))
+    return command + list(inputs) + [output]
+
+
+def write_html_documents(workdir, html_documents):
+    paths = []
+    for index, html in enumerate(html_documents):
+        path = os.path.join(workdir, f"page{index}.html")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(html)
+        paths.append(path)
+    return paths
+
+
+def run_wkhtmltopdf(html_documents, options=None, timeout=None):
+    """Render one or more HTML documents into a single PDF with one process"""
+    timeout = timeout or getattr(settings, "PDF_RENDER_TIMEOUT", 60)
+    with tempfile.TemporaryDirectory(prefix="pdf-render-") as workdir:
+        inputs = write_html_documents(workdir, html_documents)
+        output = os.path.join(workdir, "output.pdf")
+
+        try:
+            process = subprocess.run(
+                build_command(options, inputs, output),
+                capture_output=True,
+                timeout=timeout,
+            )
+        except subprocess.TimeoutExpired:
+            raise RenderError(f"wkhtmltopdf timed out after {timeout}s")
+
+        # wkhtmltopdf exits non-zero for failed sub-resources (images, fonts)
+        # while still writing a usable document
+        if not os.path.exists(output) or not os.path.getsize(output):
+            raise RenderError(
+                process.stderr.decode(errors="replace").strip()
+                or f"wkhtmltopdf exited with status {process.returncode}"
+            )
+        with open(output, "rb") as file:
+            return file.read()
+
+
+def render_pdf_direct(html_documents, options=None):
+    """The plain pdfkit path, used when the pool is disabled or unavailable"""
+    import pdfkit
+
+    path = get_wkhtmltopdf_path()
+    configuration = pdfkit.configuration(wkhtmltopdf=path) if path else None
+    if len(html_documents) == 1:
+        return pdfkit.from_string(
+            html_documents[0], False, options=options, configuration=configuration
+        )
+    with tempfile.TemporaryDirectory(prefix="pdf-render-") as workdir:
+        return pdfkit.from_file(
+            write_html_documents(workdir, html_documents),
+            False,
+            options=options,
+            configuration=configuration,
+        )
+
+
+def submit_pdf(html, options=None, timeout=None):
+    """Queue an HTML document on the renderer pool; returns a Future of bytes"""
+    if pool_enabled():
+        return get_executor().submit(run_wkhtmltopdf, [html], options, timeout)
+    future = Future()
+    try:
+        future.set_result(render_pdf_direct([html], options))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+def render_pdf(html, options=None, timeout=None):
+    """Render an HTML document to PDF bytes (drop-in for pdfkit.from_string)"""
+    return submit_pdf(html, options, timeout).result()
+
+
+def render_pdfs(html_documents, options=None, timeout=None):
+    """Render documents to separate PDFs concurrently, preserving order"""
+    futures = [submit_pdf(html, options, timeout) for html in html_documents]
+    return [future.result() for future in futures]
+
+
+def render_merged_pdf(html_documents, options=None, timeout=None):
+    """Render documents back to back into one PDF with a single process.
+
+    Saves one wkhtmltopdf startup per extra document; the timeout applies
+    per document.
+    """
+    html_documents = list(html_documents)
+    if not pool_enabled():
+        return render_pdf_direct(html_documents, options)
+    timeout = (timeout or getattr(settings, "PDF_RENDER_TIMEOUT", 60)) * max(
+        len(html_documents), 1
+    )
+    return (
+        get_executor().submit(run_wkhtmltopdf, html_documents, options, timeout)
+    ).result()
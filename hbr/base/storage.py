@@ -0,0 +1,170 @@
+import errno
+import hashlib
+import os
+import shutil
+import stat
+import uuid
+from django.core.files.storage import FileSystemStorage
+
+BLOB_DIR = "blobs"
+HASH_CHUNK_SIZE = 64 * 1024
+
+# Errors meaning the filesystem can't hard link these paths (no support,
+# a mount boundary, or too many links to one inode); the file is copied.
+LINK_UNSUPPORTED_ERRORS = (errno.EPERM, errno.EXDEV, errno.EMLINK, errno.ENOTSUP)
+
+
+def hash_path(path):
+    """SHA-256 hex digest of a file on disk"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def iter_media_files(root, skipped_dirs=()):
+    """Every regular file under a media root, as os.DirEntry objects.
+
+    Top level directories named in ``skipped_dirs`` are left out. The tree
+    is walked with os.scandir, so only one directory listing is held at a
+    time per level.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if directory != root or entry.name not in skipped_dirs:
+                        stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+
+
+class DedupFileSystemStorage(FileSystemStorage):
+    """Local media storage that keeps one copy of each distinct file.
+
+    Content is written once to ``blobs/<ab>/<sha256>`` under the storage
+    root, and every saved name is a hard link to its blob. Names, URLs and
+    ``path()`` work as with FileSystemStorage, so views, X-Sendfile and the
+    PDF generators read the usual paths. The inode's link count is the
+    reference count: deleting a name drops one link, and the blob itself is
+    removed with its last name. Links dropped outside the storage (e.g. an
+    ``os.remove``) leave a blob with no names, which ``media_gc`` reclaims.
+    """
+
+    def get_blob_root(self):
+        return os.path.join(self.location, BLOB_DIR)
+
+    def get_blob_path(self, content_hash):
+        return os.path.join(self.get_blob_root(), content_hash[:2], content_hash)
+
+    def make_directory(self, directory):
+        if self.directory_permissions_mode is not None:
+            os.makedirs(directory, self.directory_permissions_mode, exist_ok=True)
+        else:
+            os.makedirs(directory, exist_ok=True)
+
+    def store_blob(self, content):
+        """Write content to the blob store, unless it is there already.
+
+        Returns:
+            The blob's path
+        """
+        blob_root = self.get_blob_root()
+        self.make_directory(blob_root)
+        digest = hashlib.sha256()
+        # Created like FileSystemStorage's files, so the umask applies
+        temp_path = os.path.join(blob_root, f".upload-{uuid.uuid4().hex}")
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                for chunk in content.chunks():
+                    if isinstance(chunk, str):
+                        chunk = chunk.encode()
+                    digest.update(chunk)
+                    file.write(chunk)
+            if self.file_permissions_mode is not None:
+                os.chmod(temp_path, self.file_permissions_mode)
+            blob_path = self.get_blob_path(digest.hexdigest())
+            self.make_directory(os.path.dirname(blob_path))
+            try:
+                # Atomic, so concurrent uploads of the same file agree on one
+                # blob
+                os.link(temp_path, blob_path)
+            except FileExistsError:
+                pass
+        finally:
+            os.remove(temp_path)
+        return blob_path
+
+    def link_blob(self, blob_path, full_path):
+        """Hard link a blob to a new name; FileExistsError if it is taken"""
+        try:
+            os.link(blob_path, full_path)
+        except OSError as e:
+            if e.errno not in LINK_UNSUPPORTED_ERRORS:
+                raise
+            with open(blob_path, "rb") as source:
+                fd = os.open(full_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+                with os.fdopen(fd, "wb") as target:
+                    shutil.copyfileobj(source, target)
+            self.release_blob(blob_path, os.stat(blob_path))
+
+    def release_blob(self, blob_path, file_stat):
+        """Remove a blob once no saved name links to it any more"""
+        try:
+            blob_stat = os.stat(blob_path)
+        except FileNotFoundError:
+            return
+        if os.path.samestat(blob_stat, file_stat) and blob_stat.st_nlink == 1:
+            try:
+                os.remove(blob_path)
+            except FileNotFoundError:
+                pass
+
+    def _save(self, name, content):
+        if self._allow_overwrite:
+            self.delete(name)
+        full_path = self.path(name)
+        try:
+            self.make_directory(os.path.dirname(full_path))
+        except FileExistsError:
+            raise FileExistsError(
+                "%s exists and is not a directory." % os.path.dirname(full_path)
+            )
+
+        blob_path = self.store_blob(content)
+        while True:
+            try:
+                self.link_blob(blob_path, full_path)
+            except FileExistsError:
+                name = self.get_available_name(name)
+                full_path = self.path(name)
+            except FileNotFoundError:
+                # The blob's last other name was deleted meanwhile
+                content.seek(0)
+                blob_path = self.store_blob(content)
+            else:
+                break
+
+        name = os.path.relpath(full_path, self.location)
+        self._ensure_location_group_id(full_path)
+        return str(name).replace("\\", "/")
+
+    def delete(self, name):
+        if not name:
+            raise ValueError("The name must be given to delete().")
+        full_path = self.path(name)
+        blob_path = None
+        try:
+            file_stat = os.lstat(full_path)
+        except FileNotFoundError:
+            return
+        # Only the blob links to it besides this name, so it goes too
+        if stat.S_ISREG(file_stat.st_mode) and file_stat.st_nlink == 2:
+            blob_path = self.get_blob_path(hash_path(full_path))
+        super().delete(name)
+        if blob_path:
+            self.release_blob(blob_path, file_stat)
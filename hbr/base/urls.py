@@ -10,6 +10,7 @@ urlpatterns = [
     path("events/", views.events, name="events"),
     path("contact/", views.contact, name="contact"),
     path("gallary/", views.gallery_view, name="gallery"),
+    path("gallary/api/", views.gallery_api, name="gallery_api"),
     path("result/", views.result, name="result"),
     path("apply-enroll/", views.apply_enroll, name="apply_enroll"),
     path("news/", views.news, name="news"),
@@ -1,14 +1,21 @@
-from django.http import HttpRequest, HttpResponseBadRequest
+from django.http import HttpRequest, HttpResponseBadRequest, JsonResponse
 from django.shortcuts import redirect, render
 from django.contrib import messages
 from django.contrib.auth.models import Group, User
 from django.contrib.auth import login, authenticate, logout
 from django.contrib.auth.decorators import login_required
+from front_cms.image_utils import get_image_sources
 from front_cms.models import CarouselImage, GalleryImage, PopupImage
 from notices.models import Notice
 from academics.models import Exam, ExamResult
 from students.models import Student
 from decouple import config
+from .page_cache_utils import cache_public_page
+from .pagination_utils import keyset_json_response, paginate_keyset
+
+# Same order as the homepage; "-id" makes it unique for keyset pagination
+GALLERY_ORDERING = ["display_order", "-created_at", "-id"]
+GALLERY_PAGE_SIZE = 12
 
 
 def get_user_role(user):
@@ -27,6 +34,7 @@ def logout_view(request: HttpRequest):
 
 
 # Create your views here.
+@cache_public_page
 def homepage(request: HttpRequest):
     # Get active carousel images ordered by display_order
     carousel_images = CarouselImage.objects.filter(is_active=True).order_by(
@@ -57,29 +65,70 @@ def homepage(request: HttpRequest):
     return render(request, "base/home.html", context)
 
 
+@cache_public_page
 def about(request: HttpRequest):
     return render(request, "base/about.html")
 
 
+@cache_public_page
 def academics(request: HttpRequest):
     return render(request, "base/academics.html")
 
 
+@cache_public_page
 def admissions(request: HttpRequest):
     return render(request, "base/admissions.html")
 
 
+@cache_public_page
 def faculty(request: HttpRequest):
     return render(request, "base/faculty.html")
 
+@cache_public_page
 def gallery_view(request):
-    gallery_images = GalleryImage.objects.all().order_by('-created_at')
+    # Only the first screen; the rest is fetched from gallery_api on scroll
+    gallery_images = paginate_keyset(
+        GalleryImage.objects.filter(is_active=True),
+        GALLERY_ORDERING,
+        per_page=GALLERY_PAGE_SIZE,
+    )
     return render(request, 'base/gallery.html', {
         'gallery_images': gallery_images,
+        'categories': GalleryImage.CATEGORY_CHOICES,
         'school_name': config("SCHOOL_NAME"),
     })
 
 
+def serialize_gallery_image(image):
+    return {
+        "id": image.id,
+        "title": image.title,
+        "description": image.description,
+        "category": image.category,
+        "category_display": image.get_category_display(),
+        **get_image_sources(image),
+    }
+
+
+def gallery_api(request: HttpRequest):
+    """Active gallery images as JSON, a keyset page at a time"""
+    gallery_images = GalleryImage.objects.filter(is_active=True)
+    category = request.GET.get("category")
+    if category:
+        if category not in dict(GalleryImage.CATEGORY_CHOICES):
+            return JsonResponse({"error": "Invalid category"}, status=400)
+        gallery_images = gallery_images.filter(category=category)
+
+    page = paginate_keyset(
+        gallery_images,
+        GALLERY_ORDERING,
+        request.GET.get("cursor"),
+        per_page=GALLERY_PAGE_SIZE,
+    )
+    return keyset_json_response(page, "images", serialize_gallery_image)
+
+
+@cache_public_page
 def events(request: HttpRequest):
     return render(request, "base/events.html")
 
@@ -94,6 +143,7 @@ def apply_enroll(request: HttpRequest):
 
 
 
+@cache_public_page
 def news(request: HttpRequest):
     # Get all active public notices
     public_notices = Notice.objects.filter(
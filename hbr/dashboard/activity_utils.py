@@ -0,0 +1,57 @@
+from django.db.models import F
+from .models import ActivityEvent
+
+
+def record_activity(
+    event_type, message, actor=None, audience=None, status="", audience_message=""
+):
+    """Append a single event to the activity log.
+
+    ``message`` is written for the actor and admins; ``audience_message``,
+    if given, is what the audience sees instead.
+    """
+    return ActivityEvent.objects.create(
+        event_type=event_type,
+        message=message[:255],
+        audience_message=audience_message[:255],
+        actor=actor,
+        audience=audience,
+        status=status,
+    )
+
+
+def record_activities(events):
+    """Append many events to the activity log in one query.
+
+    ``events`` is an iterable of dicts with the same keys as record_activity.
+    """
+    return ActivityEvent.objects.bulk_create(
+        [
+            ActivityEvent(
+                event_type=event["event_type"],
+                message=event["message"][:255],
+                audience_message=event.get("audience_message", "")[:255],
+                actor=event.get("actor"),
+                audience=event.get("audience"),
+                status=event.get("status", ""),
+            )
+            for event in events
+        ]
+    )
+
+
+def get_activity_feed(queryset, limit=5, for_audience=False):
+    """Return the latest events of a filtered ActivityEvent queryset as feed items.
+
+    With ``for_audience``, events read as worded for the user they concern.
+    """
+    feed = list(
+        queryset.order_by("-created_at")
+        .annotate(type=F("event_type"), time=F("created_at"))
+        .values("type", "message", "audience_message", "time", "status")[:limit]
+    )
+    for item in feed:
+        audience_message = item.pop("audience_message")
+        if for_audience and audience_message:
+            item["message"] = audience_message
+    return feed
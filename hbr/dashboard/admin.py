@@ -2,6 +2,29 @@ from django.contrib import admin
 
 # Register your models here.
 from front_cms.models import GalleryImage, CarouselImage, PopupImage
+from .models import ActivityEvent
 
 # Register your models here.
 admin.site.register([GalleryImage, CarouselImage, PopupImage])
+
+
+@admin.register(ActivityEvent)
+class ActivityEventAdmin(admin.ModelAdmin):
+    list_display = (
+        "created_at",
+        "event_type",
+        "message",
+        "status",
+        "actor",
+        "audience",
+    )
+    list_filter = ("event_type", "status")
+    search_fields = ("message", "actor__username", "audience__username")
+    ordering = ("-created_at",)
+
+    # The activity log is append-only
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
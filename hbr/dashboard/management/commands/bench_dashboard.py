@@ -0,0 +1,224 @@
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth.models import User, Group
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from academics.models import AcademicSession, Term, Exam, ExamAssignment, ExamResult
+from attendance.models import Attendance
+from dashboard.views import DASHBOARD_WIDGETS, get_dashboard_profile
+from leave.models import Leave
+from students.models import Student, Classroom
+from teachers.models import Teacher
+
+ROLES = ("Admin", "Teacher", "Student")
+SUBJECTS = ("Mathematics", "Science", "English", "Hindi", "Social Science")
+
+
+class BenchmarkRollback(Exception):
+    """Raised to roll back the seeded benchmark data"""
+
+
+def seed_dataset(prefix, students, days, groups):
+    """Seed one batch of classrooms, users, attendance, results and leaves"""
+    today = timezone.now().date()
+
+    teacher_user = User.objects.create_user(f"{prefix}_teacher", first_name="Bench")
+    teacher_user.groups.add(groups["Teacher"])
+    teacher = Teacher.objects.create(user=teacher_user, subject="Mathematics")
+
+    session = AcademicSession.objects.create(
+        year=f"{prefix}-session",
+        start_date=today - timedelta(days=180),
+        end_date=today + timedelta(days=180),
+    )
+    term = Term.objects.create(
+        academic_session=session,
+        name="First Term",
+        start_date=session.start_date,
+        end_date=session.end_date,
+    )
+    exams = [Exam.objects.create(term=term, name=f"Exam {i}") for i in range(1, 7)]
+
+    classrooms = [
+        Classroom.objects.create(grade=f"{prefix}-{grade}", section="A")
+        for grade in range(1, 5)
+    ]
+    for classroom in classrooms:
+        for exam in exams:
+            ExamAssignment.objects.create(
+                exam=exam, teacher=teacher, classroom=classroom
+            )
+
+    users = User.objects.bulk_create(
+        User(username=f"{prefix}_student_{i}", first_name="Student", last_name=str(i))
+        for i in range(students)
+    )
+    groups["Student"].user_set.add(*users)
+    student_objs = Student.objects.bulk_create(
+        Student(
+            user=user,
+            sr_no=i,
+            roll_no=i,
+            admission_no=f"{prefix}{i}",
+            father_name="Father",
+            mother_name="Mother",
+            dob=date(2010, 1, 1),
+            gender="MALE",
+            classroom=classrooms[i % len(classrooms)],
+        )
+        for i, user in enumerate(users)
+    )
+
+    statuses = [
+        Attendance.Status.PRESENT,
+        Attendance.Status.PRESENT,
+        Attendance.Status.ABSENT,
+    ]
+    Attendance.objects.bulk_create(
+        (
+            Attendance(
+                student=student,
+                teacher=teacher,
+                date=today - timedelta(days=day),
+                status=statuses[(student.id + day) % len(statuses)],
+            )
+            for student in student_objs
+            for day in range(days)
+        ),
+        batch_size=2000,
+    )
+    ExamResult.objects.bulk_create(
+        (
+            ExamResult(
+                student=student,
+                exam=exam,
+                subject=subject,
+                marks_obtained=Decimal((student.id * 7 + len(subject)) % 100),
+                grade="ABCDF"[(student.id + exam.id) % 5],
+                status=ExamResult.Status.SUBMITTED,
+                submitted_at=timezone.now(),
+            )
+            for student in student_objs
+            for exam in exams
+            for subject in SUBJECTS
+        ),
+        batch_size=2000,
+    )
+    Leave.objects.bulk_create(
+        Leave(
+            student=student,
+            reason="Benchmark leave",
+            from_date=today,
+            to_date=today,
+            status=Leave.Status.PENDING,
+        )
+        for student in student_objs[::10]
+    )
+    return {"Admin": None, "Teacher": teacher_user, "Student": users[0]}
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a small and a large dataset inside a rolled back transaction and "
+        "check that every dashboard widget runs a constant number of queries."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--students",
+            type=int,
+            default=5000,
+            help="Number of students in the large dataset (default: 5000)",
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=60,
+            help="Days of attendance history per student (default: 60)",
+        )
+        parser.add_argument(
+            "--max-queries",
+            type=int,
+            default=5,
+            help="Query budget for a single widget (default: 5)",
+        )
+
+    def measure(self, users):
+        """Run every widget builder for every role, uncached"""
+        measurements = {}
+        for role in ROLES:
+            user = users[role]
+            profile = get_dashboard_profile(user, role) if user else None
+            for name, widget in DASHBOARD_WIDGETS.items():
+                builder = widget["builders"].get(role)
+                if builder is None:
+                    continue
+                started = time.perf_counter()
+                with CaptureQueriesContext(connection) as queries:
+                    builder(profile)
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                measurements[(role, name)] = (len(queries), elapsed_ms)
+        return measurements
+
+    def handle(self, *args, **options):
+        students = options["students"]
+        days = options["days"]
+        cache.clear()
+
+        results = {}
+        try:
+            with transaction.atomic():
+                groups = {
+                    name: Group.objects.get_or_create(name=name)[0] for name in ROLES
+                }
+                admin_user = User.objects.create_user("bench_admin")
+                admin_user.groups.add(groups["Admin"])
+
+                self.stdout.write("Seeding small dataset...")
+                users = seed_dataset("bench_small", 10, 7, groups)
+                users["Admin"] = admin_user
+                results["small"] = self.measure(users)
+
+                self.stdout.write(
+                    f"Seeding large dataset ({students} students, {days} days)..."
+                )
+                users = seed_dataset("bench_large", students, days, groups)
+                users["Admin"] = admin_user
+                results["large"] = self.measure(users)
+                raise BenchmarkRollback
+        except BenchmarkRollback:
+            pass
+
+        self.stdout.write(
+            f"{'role':<8} {'widget':<18} {'small q':>8} {'large q':>8} {'large ms':>9}"
+        )
+        mismatches = []
+        over_budget = []
+        for (role, name), (small_queries, _) in results["small"].items():
+            large_queries, large_ms = results["large"][(role, name)]
+            self.stdout.write(
+                f"{role:<8} {name:<18} {small_queries:>8} {large_queries:>8} {large_ms:>9.1f}"
+            )
+            if small_queries != large_queries:
+                mismatches.append(f"{role}/{name}")
+            if large_queries > options["max_queries"]:
+                over_budget.append(f"{role}/{name}")
+
+        if mismatches:
+            raise CommandError(
+                "Query count grows with data size for: " + ", ".join(mismatches)
+            )
+        if over_budget:
+            raise CommandError(
+                f"More than {options['max_queries']} queries for: "
+                + ", ".join(over_budget)
+            )
+        self.stdout.write(
+            self.style.SUCCESS("All dashboard widgets run constant queries.")
+        )
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-19 07:10
+
+from django.db import migrations, models
+
+RESULT_PREFIX = "Result entered for "
+
+
+def backfill_audience_messages(apps, schema_editor):
+    """Student wording for attendance and result events logged before it was
+    stored separately"""
+    ActivityEvent = apps.get_model("dashboard", "ActivityEvent")
+    events = ActivityEvent.objects.filter(
+        audience_message="", event_type__in=["attendance", "result"]
+    ).only("event_type", "message", "status")
+    updated = []
+    for event in events.iterator():
+        if event.event_type == "attendance":
+            event.audience_message = f"Attendance marked: {event.status.title()}"
+        elif event.message.startswith(RESULT_PREFIX):
+            exam_name = event.message[len(RESULT_PREFIX) :]
+            event.audience_message = f"Result available for {exam_name}"[:255]
+        else:
+            continue
+        updated.append(event)
+    ActivityEvent.objects.bulk_update(updated, ["audience_message"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dashboard", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="activityevent",
+            name="audience_message",
+            field=models.CharField(
+                blank=True,
+                help_text="Wording shown to the audience, when it differs from message",
+                max_length=255,
+            ),
+        ),
+        migrations.RunPython(backfill_audience_messages, migrations.RunPython.noop),
+    ]
@@ -8,3 +8,57 @@
 
 # This file is kept for backward compatibility and migration purposes
 # All models are now imported from their respective apps
+from django.db import models
+from django.contrib.auth.models import User
+from django.utils import timezone
+
+
+class ActivityEvent(models.Model):
+    """Append-only log of activity shown in the dashboard recent activity feeds"""
+
+    class EventType(models.TextChoices):
+        ATTENDANCE = "attendance", "Attendance"
+        RESULT = "result", "Result"
+        LEAVE = "leave", "Leave"
+        NOTICE = "notice", "Notice"
+
+    event_type = models.CharField(max_length=20, choices=EventType.choices)
+    actor = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="activity_events",
+        help_text="User who performed the action",
+    )
+    audience = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="received_activity_events",
+        help_text="User the action concerns, e.g. the student whose attendance was marked",
+    )
+    message = models.CharField(max_length=255)
+    audience_message = models.CharField(
+        max_length=255,
+        blank=True,
+        help_text="Wording shown to the audience, when it differs from message",
+    )
+    status = models.CharField(max_length=20, blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"{self.event_type} - {self.message}"
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["actor", "-created_at"], name="activity_actor_idx"),
+            models.Index(
+                fields=["audience", "-created_at"], name="activity_audience_idx"
+            ),
+            models.Index(
+                fields=["event_type", "-created_at"], name="activity_type_idx"
+            ),
+        ]
@@ -6,4 +6,5 @@ app_name = "dashboard"
 urlpatterns = [
     path("", views.dashboard_home, name="dashboard"),
     path("settings/", views.settings_view, name="settings"),
+    path("widgets/<str:widget>/", views.dashboard_widget, name="widget"),
 ]
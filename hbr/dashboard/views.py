@@ -1,9 +1,13 @@
-from django.http import HttpRequest, HttpResponse
+import time
+from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.db.models import Count, Q, Sum, Avg
+from django.core.cache import cache
 from django.utils import timezone
+from django.utils.cache import patch_cache_control
+from django.utils.timesince import timesince
 from datetime import datetime, date, timedelta
 from django.core.serializers.json import DjangoJSONEncoder
 from base.views import get_user_role
@@ -13,6 +17,9 @@ from teachers.models import Teacher
 from attendance.models import Attendance
 from leave.models import Leave
 from notices.models import Notice
+from notices.delivery_utils import get_inbox
+from .models import ActivityEvent
+from .activity_utils import get_activity_feed
 from django.db.models import Q
 
 
@@ -32,26 +39,87 @@ def get_current_session():
     return current_session
 
 
+# Stat cards rendered by the dashboard shell for each role; values are
+# filled in by the "stats" widget endpoint.
+DASHBOARD_STAT_KEYS = {
+    "Admin": [
+        "total_students",
+        "total_teachers",
+        "total_exams",
+        "pending_leaves",
+        "active_notices",
+    ],
+    "Teacher": ["my_students", "pending_results", "total_exams", "my_leaves"],
+    "Student": ["my_attendance", "total_exams", "pending_fees", "my_leaves"],
+}
+
+
 @login_required
 def dashboard_home(request: HttpRequest):
-    """Main dashboard home view - provides navigation to different modules"""
+    """Dashboard shell - widget data is fetched separately via dashboard_widget"""
     user = request.user
     role = get_user_role(user)
 
-    # Get role-specific data and statistics
-    dashboard_data = get_dashboard_data(user, role)
-
     context = {
         "dashboard_sections": get_dashboard_sections(role),
         "role": role,
         "user": user,
-        "current_session": get_current_session(),
         "current_time": datetime.now(),
-        **dashboard_data,
+        "stat_keys": DASHBOARD_STAT_KEYS.get(role, []),
+        "quick_actions": get_quick_actions(role),
+        "widgets": get_dashboard_widgets(role),
     }
     return render(request, "dashboard/index.html", context)
 
 
+@login_required
+def dashboard_widget(request: HttpRequest, widget: str):
+    """Return the JSON data for a single dashboard widget"""
+    user = request.user
+    role = get_user_role(user)
+
+    builders = DASHBOARD_WIDGETS.get(widget, {}).get("builders", {})
+    if role not in builders:
+        return JsonResponse({"error": "Widget not found"}, status=404)
+
+    ttl = DASHBOARD_WIDGETS[widget]["ttl"]
+    cache_key = f"dashboard:widget:{widget}:{user.pk}"
+    started = time.perf_counter()
+
+    data = cache.get(cache_key)
+    cache_status = "hit"
+    if data is None:
+        cache_status = "miss"
+        try:
+            profile = get_dashboard_profile(user, role)
+        except (Student.DoesNotExist, Teacher.DoesNotExist):
+            return JsonResponse({"error": "Profile not found"}, status=404)
+        data = builders[role](profile)
+        cache.set(cache_key, data, ttl)
+
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    response = JsonResponse({"widget": widget, "data": data})
+    response["Server-Timing"] = f'{widget};desc="{cache_status}";dur={elapsed_ms:.1f}'
+    patch_cache_control(response, private=True, max_age=ttl)
+    return response
+
+
+def get_dashboard_profile(user, role):
+    """Get the Student/Teacher profile the role's widgets are built from"""
+    if role == "Teacher":
+        return Teacher.objects.get(user=user)
+    if role == "Student":
+        return Student.objects.get(user=user)
+    return None
+
+
+def get_dashboard_widgets(role):
+    """Get the names of the widgets available to a role"""
+    return [
+        name for name, widget in DASHBOARD_WIDGETS.items() if role in widget["builders"]
+    ]
+
+
 def get_dashboard_sections(role):
     """Get available dashboard sections based on user role"""
     sections = {
@@ -110,37 +178,10 @@ def get_dashboard_sections(role):
     return sections.get(role, [])
 
 
-def get_dashboard_data(user, role):
-    """Get role-specific dashboard data and statistics"""
-    data = {
-        "stats": {},
-        "charts": {},
-        "recent_activity": [],
-        "quick_actions": [],
-    }
-
-    if role == "Admin":
-        # Admin statistics
-        data["stats"] = {
-            "total_students": Student.objects.count(),
-            "total_teachers": Teacher.objects.count(),
-            "total_exams": ExamAssignment.objects.count(),
-            "pending_leaves": Leave.objects.filter(status="pending").count(),
-            "active_notices": Notice.objects.filter(is_active=True).count(),
-        }
-
-        # Charts data for admin
-        data["charts"] = {
-            "attendance_trend": get_attendance_trend_data(),
-            "exam_performance": get_exam_performance_data(),
-            "leave_status": get_leave_status_data(),
-        }
-
-        # Recent activity for admin
-        data["recent_activity"] = get_recent_activity_admin()
-
-        # Quick actions for admin
-        data["quick_actions"] = [
+def get_quick_actions(role):
+    """Get quick action links based on user role"""
+    actions = {
+        "Admin": [
             {
                 "title": "Add New Student",
                 "url": "/students/add/",
@@ -165,35 +206,8 @@ def get_dashboard_data(user, role):
                 "icon": "bell",
                 "color": "info",
             },
-        ]
-
-    elif role == "Teacher":
-        # Teacher statistics
-        teacher = Teacher.objects.get(user=user)
-        data["stats"] = {
-            "my_students": Student.objects.filter(
-                classroom__examassignment__teacher=teacher
-            )
-            .distinct()
-            .count(),
-            "pending_results": ExamResult.objects.filter(
-                exam__examassignment__teacher=teacher, marks_obtained__isnull=True
-            ).count(),
-            "total_exams": ExamAssignment.objects.filter(teacher=teacher).count(),
-            "my_leaves": Leave.objects.filter(student__user=user).count(),
-        }
-
-        # Charts data for teacher
-        data["charts"] = {
-            "class_performance": get_class_performance_data(teacher),
-            "attendance_overview": get_teacher_attendance_data(teacher),
-        }
-
-        # Recent activity for teacher
-        data["recent_activity"] = get_recent_activity_teacher(teacher)
-
-        # Quick actions for teacher
-        data["quick_actions"] = [
+        ],
+        "Teacher": [
             {
                 "title": "Mark Attendance",
                 "url": "/attendance/mark-student/",
@@ -206,29 +220,8 @@ def get_dashboard_data(user, role):
                 "icon": "edit",
                 "color": "success",
             },
-        ]
-
-    elif role == "Student":
-        # Student statistics
-        student = Student.objects.get(user=user)
-        data["stats"] = {
-            "my_attendance": calculate_student_attendance_percentage(student),
-            "total_exams": ExamResult.objects.filter(student=student).count(),
-            "pending_fees": 0,  # Placeholder for payment system
-            "my_leaves": Leave.objects.filter(teacher__user=user).count(),
-        }
-
-        # Charts data for student
-        data["charts"] = {
-            "performance_trend": get_student_performance_data(student),
-            "attendance_chart": get_student_attendance_data(student),
-        }
-
-        # Recent activity for student
-        data["recent_activity"] = get_recent_activity_student(student)
-
-        # Quick actions for student
-        data["quick_actions"] = [
+        ],
+        "Student": [
             {
                 "title": "View Results",
                 "url": "/academics/exams/",
@@ -253,65 +246,122 @@ def get_dashboard_data(user, role):
                 "icon": "calendar-plus",
                 "color": "info",
             },
-        ]
+        ],
+    }
+    return actions.get(role, [])
 
-    return data
 
+def get_admin_stats():
+    """Get statistics for the admin dashboard"""
+    return {
+        "total_students": Student.objects.count(),
+        "total_teachers": Teacher.objects.count(),
+        "total_exams": ExamAssignment.objects.count(),
+        "pending_leaves": Leave.objects.filter(status=Leave.Status.PENDING).count(),
+        "active_notices": Notice.objects.filter(is_active=True).count(),
+    }
 
-def get_attendance_trend_data():
-    """Get attendance trend data for the last 7 days"""
+
+def get_teacher_stats(teacher):
+    """Get statistics for the teacher dashboard"""
+    return {
+        "my_students": Student.objects.filter(
+            classroom__examassignment__teacher=teacher
+        )
+        .distinct()
+        .count(),
+        "pending_results": ExamResult.objects.filter(
+            exam__examassignment__teacher=teacher, marks_obtained__isnull=True
+        ).count(),
+        "total_exams": ExamAssignment.objects.filter(teacher=teacher).count(),
+        "my_leaves": Leave.objects.filter(student__user=teacher.user_id).count(),
+    }
+
+
+def get_student_stats(student):
+    """Get statistics for the student dashboard"""
+    return {
+        "my_attendance": calculate_student_attendance_percentage(student),
+        "total_exams": ExamResult.objects.filter(student=student).count(),
+        "pending_fees": 0,  # Placeholder for payment system
+        "my_leaves": Leave.objects.filter(teacher__user=student.user_id).count(),
+    }
+
+
+def serialize_activity(activities):
+    """Add a human readable "time since" to recent activity entries"""
+    return [
+        {**activity, "time_since": timesince(activity["time"])}
+        for activity in activities
+    ]
+
+
+def get_last_week_dates():
+    """Get the last 7 days, oldest first"""
     today = timezone.now().date()
-    data = []
+    return [today - timedelta(days=i) for i in range(6, -1, -1)]
 
-    for i in range(6, -1, -1):
-        date = today - timedelta(days=i)
-        present = Attendance.objects.filter(date=date, status="present").count()
-        absent = Attendance.objects.filter(date=date, status="absent").count()
-        data.append(
-            {
-                "date": date.strftime("%b %d"),
-                "present": present,
-                "absent": absent,
-            }
+
+def get_attendance_trend_data():
+    """Get attendance trend data for the last 7 days"""
+    days = get_last_week_dates()
+    counts = {
+        (row["date"], row["status"]): row["count"]
+        for row in Attendance.objects.filter(
+            date__range=(days[0], days[-1]),
+            status__in=[Attendance.Status.PRESENT, Attendance.Status.ABSENT],
         )
+        .values("date", "status")
+        .annotate(count=Count("id"))
+    }
 
-    return data
+    return [
+        {
+            "date": day.strftime("%b %d"),
+            "present": counts.get((day, Attendance.Status.PRESENT), 0),
+            "absent": counts.get((day, Attendance.Status.ABSENT), 0),
+        }
+        for day in days
+    ]
 
 
 def get_exam_performance_data():
     """Get exam performance distribution"""
-    results = ExamResult.objects.all()
-    grade_distribution = {
-        "A": results.filter(grade="A").count(),
-        "B": results.filter(grade="B").count(),
-        "C": results.filter(grade="C").count(),
-        "D": results.filter(grade="D").count(),
-        "F": results.filter(grade="F").count(),
-    }
-    return grade_distribution
+    counts = dict(
+        ExamResult.objects.filter(grade__in=["A", "B", "C", "D", "F"])
+        .values("grade")
+        .annotate(count=Count("id"))
+        .values_list("grade", "count")
+    )
+    return {grade: counts.get(grade, 0) for grade in ["A", "B", "C", "D", "F"]}
 
 
 def get_leave_status_data():
     """Get leave status distribution"""
-    return {
-        "approved": Leave.objects.filter(status="APPROVED").count(),
-        "pending": Leave.objects.filter(status="PENDING").count(),
-        "rejected": Leave.objects.filter(status="REJECTED").count(),
-    }
+    return Leave.objects.aggregate(
+        approved=Count("id", filter=Q(status="APPROVED")),
+        pending=Count("id", filter=Q(status="PENDING")),
+        rejected=Count("id", filter=Q(status="REJECTED")),
+    )
 
 
 def get_class_performance_data(teacher):
     """Get class performance data for teacher"""
-    exams = ExamAssignment.objects.filter(teacher=teacher)
-    data = []
-
-    for exam_assignment in exams[:5]:  # Last 5 exams
-        avg_marks = (
-            ExamResult.objects.filter(exam=exam_assignment.exam).aggregate(
-                avg=Avg("marks_obtained")
-            )["avg"]
-            or 0
+    exam_assignments = list(
+        ExamAssignment.objects.filter(teacher=teacher).select_related("exam")[:5]
+    )  # Last 5 exams
+    averages = dict(
+        ExamResult.objects.filter(
+            exam_id__in=[assignment.exam_id for assignment in exam_assignments]
         )
+        .values("exam_id")
+        .annotate(avg=Avg("marks_obtained"))
+        .values_list("exam_id", "avg")
+    )
+
+    data = []
+    for exam_assignment in exam_assignments:
+        avg_marks = averages.get(exam_assignment.exam_id) or 0
         data.append(
             {
                 "exam": (
@@ -328,38 +378,43 @@ def get_class_performance_data(teacher):
 
 def get_teacher_attendance_data(teacher):
     """Get attendance data marked by teacher"""
-    today = timezone.now().date()
-    data = []
-
-    for i in range(6, -1, -1):
-        date = today - timedelta(days=i)
-        marked = Attendance.objects.filter(date=date, teacher=teacher).count()
-        data.append(
-            {
-                "date": date.strftime("%b %d"),
-                "marked": marked,
-            }
-        )
-
-    return data
+    days = get_last_week_dates()
+    counts = dict(
+        Attendance.objects.filter(teacher=teacher, date__range=(days[0], days[-1]))
+        .values("date")
+        .annotate(count=Count("id"))
+        .values_list("date", "count")
+    )
+
+    return [
+        {
+            "date": day.strftime("%b %d"),
+            "marked": counts.get(day, 0),
+        }
+        for day in days
+    ]
 
 
 def calculate_student_attendance_percentage(student):
     """Calculate student's attendance percentage"""
-    total_classes = Attendance.objects.filter(student=student).count()
-    if total_classes == 0:
+    counts = Attendance.objects.filter(student=student).aggregate(
+        total=Count("id"),
+        present=Count("id", filter=Q(status=Attendance.Status.PRESENT)),
+    )
+    if counts["total"] == 0:
         return 0
 
-    present_classes = Attendance.objects.filter(
-        student=student, status="present"
-    ).count()
-    return round((present_classes / total_classes) * 100, 1)
+    return round((counts["present"] / counts["total"]) * 100, 1)
 
 
 def get_student_performance_data(student):
     """Get student's performance trend"""
     # Order by exam name since exam_date field doesn't exist
-    results = ExamResult.objects.filter(student=student).order_by("exam__name")[:10]
+    results = (
+        ExamResult.objects.filter(student=student)
+        .select_related("exam")
+        .order_by("exam__name")[:10]
+    )
     data = []
 
     for result in results:
@@ -380,202 +435,119 @@ def get_student_performance_data(student):
 
 def get_student_attendance_data(student):
     """Get student's attendance data for last 7 days"""
-    today = timezone.now().date()
-    data = []
-
-    for i in range(6, -1, -1):
-        date = today - timedelta(days=i)
-        attendance = Attendance.objects.filter(student=student, date=date).first()
-        status = attendance.status if attendance else "not_marked"
-        data.append(
-            {
-                "date": date.strftime("%b %d"),
-                "status": status,
-            }
-        )
-
-    return data
+    days = get_last_week_dates()
+    statuses = dict(
+        Attendance.objects.filter(
+            student=student, date__range=(days[0], days[-1])
+        ).values_list("date", "status")
+    )
+
+    return [
+        {
+            "date": day.strftime("%b %d"),
+            "status": statuses[day].lower() if day in statuses else "not_marked",
+        }
+        for day in days
+    ]
 
 
 def get_recent_activity_admin():
     """Get recent activity for admin"""
-    activities = []
-
-    # Recent leaves
-    recent_leaves = Leave.objects.order_by("-apply_date")[:3]
-    for leave in recent_leaves:
-        if leave.student:
-            applicant_name = leave.student.user.get_full_name()
-        elif leave.teacher:
-            applicant_name = leave.teacher.user.get_full_name()
-        else:
-            applicant_name = "Unknown"
-
-        activities.append(
-            {
-                "type": "leave",
-                "message": f"{applicant_name} applied for leave",
-                "time": leave.apply_date,
-                "status": leave.status.lower(),
-            }
-        )
-
-    # Recent exam results
-    recent_results = ExamResult.objects.filter(submitted_at__isnull=False).order_by(
-        "-submitted_at"
-    )[:3]
-    for result in recent_results:
-        activities.append(
-            {
-                "type": "result",
-                "message": f"Result entered for {result.exam.name}",
-                "time": result.submitted_at,
-                "status": "completed",
-            }
+    return get_activity_feed(
+        ActivityEvent.objects.filter(
+            event_type__in=[
+                ActivityEvent.EventType.LEAVE,
+                ActivityEvent.EventType.RESULT,
+            ]
         )
-
-    # Convert all times to datetime for consistent sorting
-    for activity in activities:
-        if isinstance(activity["time"], date) and not isinstance(
-            activity["time"], datetime
-        ):
-            # Convert date to datetime
-            activity["time"] = timezone.make_aware(
-                datetime.combine(activity["time"], datetime.min.time())
-            )
-
-    return sorted(activities, key=lambda x: x["time"], reverse=True)[:5]
+    )
 
 
 def get_recent_activity_teacher(teacher):
     """Get recent activity for teacher"""
-    activities = []
-
-    # Recent attendance marked
-    recent_attendance = Attendance.objects.filter(teacher=teacher).order_by("-date")[:3]
-    for att in recent_attendance:
-        activities.append(
-            {
-                "type": "attendance",
-                "message": f"Marked attendance for {att.student.user.get_full_name()}",
-                "time": att.date,
-                "status": "completed",
-            }
-        )
-
-    # Recent results entered
-    recent_results = ExamResult.objects.filter(
-        exam__examassignment__teacher=teacher, submitted_at__isnull=False
-    ).order_by("-submitted_at")[:3]
-    for result in recent_results:
-        activities.append(
-            {
-                "type": "result",
-                "message": f"Entered result for {result.exam.name}",
-                "time": result.submitted_at,
-                "status": "completed",
-            }
+    return get_activity_feed(
+        ActivityEvent.objects.filter(
+            actor_id=teacher.user_id,
+            event_type__in=[
+                ActivityEvent.EventType.ATTENDANCE,
+                ActivityEvent.EventType.RESULT,
+            ],
         )
-
-    # Convert all times to datetime for consistent sorting
-    for activity in activities:
-        if isinstance(activity["time"], date) and not isinstance(
-            activity["time"], datetime
-        ):
-            # Convert date to datetime
-            activity["time"] = timezone.make_aware(
-                datetime.combine(activity["time"], datetime.min.time())
-            )
-
-    return sorted(activities, key=lambda x: x["time"], reverse=True)[:5]
+    )
 
 
 def get_recent_activity_student(student):
     """Get recent activity for student"""
-    activities = []
-
-    # Recent attendance
-    recent_attendance = Attendance.objects.filter(student=student).order_by("-date")[:3]
-    for att in recent_attendance:
-        activities.append(
-            {
-                "type": "attendance",
-                "message": f"Attendance marked: {att.status.title()}",
-                "time": att.date,
-                "status": att.status,
-            }
-        )
-
-    # Recent results
-    recent_results = ExamResult.objects.filter(
-        student=student, submitted_at__isnull=False
-    ).order_by("-submitted_at")[:3]
-    for result in recent_results:
-        activities.append(
-            {
-                "type": "result",
-                "message": f"Result available for {result.exam.name}",
-                "time": result.submitted_at,
-                "status": "available",
-            }
-        )
-
-    # Convert all times to datetime for consistent sorting
-    for activity in activities:
-        if isinstance(activity["time"], date) and not isinstance(
-            activity["time"], datetime
-        ):
-            # Convert date to datetime
-            activity["time"] = timezone.make_aware(
-                datetime.combine(activity["time"], datetime.min.time())
-            )
-
-    return sorted(activities, key=lambda x: x["time"], reverse=True)[:5]
+    return get_activity_feed(
+        ActivityEvent.objects.filter(
+            audience_id=student.user_id,
+            event_type__in=[
+                ActivityEvent.EventType.ATTENDANCE,
+                ActivityEvent.EventType.RESULT,
+            ],
+        ),
+        for_audience=True,
+    )
+
+
+# Dashboard widgets served by dashboard_widget. Each widget maps a role to a
+# builder taking that role's profile (None for Admin) and has its own cache TTL.
+DASHBOARD_WIDGETS = {
+    "stats": {
+        "ttl": 60,
+        "builders": {
+            "Admin": lambda profile: get_admin_stats(),
+            "Teacher": get_teacher_stats,
+            "Student": get_student_stats,
+        },
+    },
+    "attendance_trend": {
+        "ttl": 300,
+        "builders": {
+            "Admin": lambda profile: get_attendance_trend_data(),
+            "Teacher": get_teacher_attendance_data,
+            "Student": get_student_attendance_data,
+        },
+    },
+    "exam_performance": {
+        "ttl": 300,
+        "builders": {
+            "Admin": lambda profile: get_exam_performance_data(),
+            "Student": get_student_performance_data,
+        },
+    },
+    "leave_status": {
+        "ttl": 120,
+        "builders": {
+            "Admin": lambda profile: get_leave_status_data(),
+        },
+    },
+    "recent_activity": {
+        "ttl": 60,
+        "builders": {
+            "Admin": lambda profile: serialize_activity(get_recent_activity_admin()),
+            "Teacher": lambda profile: serialize_activity(
+                get_recent_activity_teacher(profile)
+            ),
+            "Student": lambda profile: serialize_activity(
+                get_recent_activity_student(profile)
+            ),
+        },
+    },
+    "class_performance": {
+        "ttl": 300,
+        "builders": {
+            "Teacher": get_class_performance_data,
+        },
+    },
+}
 
 
 def get_user_notifications(user, role):
-    """Get personal notifications for the user based on role"""
-    if role == "Student":
-        try:
-            student = Student.objects.get(user=user)
-            notifications = (
-                Notice.objects.filter(is_active=True)
-                .filter(
-                    Q(
-                        notice_type=Notice.NoticeType.INDIVIDUAL_STUDENT,
-                        target_students=student,
-                    )
-                )
-                .order_by("-created_at")[:5]
-            )
-        except Student.DoesNotExist:
-            notifications = Notice.objects.none()
-    elif role == "Teacher":
-        try:
-            teacher = Teacher.objects.get(user=user)
-            notifications = (
-                Notice.objects.filter(is_active=True)
-                .filter(
-                    Q(
-                        notice_type=Notice.NoticeType.INDIVIDUAL_TEACHER,
-                        target_teachers=teacher,
-                    )
-                )
-                .order_by("-created_at")[:5]
-            )
-        except Teacher.DoesNotExist:
-            notifications = Notice.objects.none()
-    elif role == "Admin":
-        notifications = (
-            Notice.objects.filter(is_active=True)
-            .exclude(notice_type=Notice.NoticeType.SYSTEM_ALERT)
-            .exclude(dismissed_by=user)
-            .order_by("-created_at")[:5]
-        )
-    else:
-        notifications = Notice.objects.none()
-
-    return notifications
+    """Get personal notifications for the user from their notice inbox"""
+    return [
+        delivery.notice for delivery in get_inbox(user).select_related("notice")[:5]
+    ]
 
 
 @login_required
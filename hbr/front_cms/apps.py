@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class FrontCmsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "front_cms"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,207 @@
+import hashlib
+import posixpath
+from io import BytesIO
+from django.core.files.base import ContentFile
+from PIL import Image as PILImage, ImageOps
+
+VARIANT_DIR = "variants"
+
+# Pillow format and save options per variant format, in srcset preference
+VARIANT_FORMATS = {
+    "webp": ("WEBP", {"quality": 80, "method": 4}),
+    "jpeg": ("JPEG", {"quality": 82, "optimize": True, "progressive": True}),
+}
+
+# Uploads are served at up to 5 MB each; the public pages instead pick the
+# smallest resized copy that fills the slot. Variants are recorded on the
+# model as:
+#
+#     {"source": <image name>, "width": .., "height": ..,
+#      "webp": [{"name", "width", "height", "size"}, ...], "jpeg": [...]}
+#
+# and rebuilt whenever the image's file name changes.
+
+
+def get_variant_name(source_name, width, extension):
+    directory, filename = posixpath.split(source_name)
+    stem = posixpath.splitext(filename)[0]
+    return posixpath.join(directory, VARIANT_DIR, f"{stem}-{width}w.{extension}")
+
+
+def get_variant_widths(widths, source_width):
+    """The configured widths below the source's, plus the source width itself
+    when it is smaller than the largest configured one"""
+    variant_widths = [width for width in widths if width < source_width]
+    if source_width < max(widths) or not variant_widths:
+        variant_widths.append(source_width)
+    return variant_widths
+
+
+def open_source(image_field, max_width):
+    image_field.open("rb")
+    try:
+        image = PILImage.open(image_field)
+        # Cheap JPEG downscale on decode; the square keeps both sides large
+        # enough whichever way EXIF rotates the photo
+        image.draft("RGB", (max_width, max_width))
+        image.load()
+    finally:
+        image_field.close()
+    return ImageOps.exif_transpose(image)
+
+
+def flatten(image):
+    background = PILImage.new("RGB", image.size, "white")
+    background.paste(image, mask=image.getchannel("A"))
+    return background
+
+
+def build_variants(image_field, widths):
+    """Resize an image field's file to ``widths`` in every variant format.
+
+    Returns:
+        The variants record stored on the model
+    """
+    storage = image_field.storage
+    image = open_source(image_field, max(widths))
+    if image.mode in ("RGBA", "LA", "P", "PA") or "transparency" in image.info:
+        image = image.convert("RGBA")
+    elif image.mode != "RGB":
+        image = image.convert("RGB")
+
+    source_width, source_height = image.size
+    variants = {
+        "source": image_field.name,
+        "width": source_width,
+        "height": source_height,
+        **{extension: [] for extension in VARIANT_FORMATS},
+    }
+
+    try:
+        for width in get_variant_widths(widths, source_width):
+            height = max(1, round(source_height * width / source_width))
+            resized = image
+            if width != source_width:
+                resized = image.resize((width, height), PILImage.LANCZOS)
+            for extension, (image_format, options) in VARIANT_FORMATS.items():
+                frame = resized
+                if image_format == "JPEG" and frame.mode == "RGBA":
+                    frame = flatten(frame)
+                buffer = BytesIO()
+                frame.save(buffer, image_format, **options)
+                name = storage.save(
+                    get_variant_name(image_field.name, width, extension),
+                    ContentFile(buffer.getvalue()),
+                )
+                variants[extension].append(
+                    {
+                        "name": name,
+                        "width": width,
+                        "height": height,
+                        "size": buffer.tell(),
+                    }
+                )
+    except Exception:
+        delete_variants(storage, variants)
+        raise
+    return variants
+
+
+def iter_variant_names(variants):
+    """Storage names of every file in a variants record"""
+    for extension in VARIANT_FORMATS:
+        for variant in (variants or {}).get(extension, []):
+            yield variant["name"]
+
+
+def delete_variants(storage, variants):
+    for name in iter_variant_names(variants):
+        try:
+            storage.delete(name)
+        except Exception as e:
+            print(f"Error deleting image variant {name}: {e}")
+
+
+def hash_file(file):
+    """SHA-256 hex digest of an uploaded or stored file's content"""
+    digest = hashlib.sha256()
+    for chunk in file.chunks():
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def is_current(instance):
+    """Whether a CMS image's variants (and content hash) match its file"""
+    if (instance.variants or {}).get("source") != (instance.image.name or None):
+        return False
+    # Uploads from before content hashes were recorded
+    return not (instance.image and getattr(instance, "content_hash", None) == "")
+
+
+def update_image_variants(instance, force=False):
+    """Rebuild a CMS image's variants when its file changed.
+
+    Models with a ``content_hash`` get it recomputed at the same time. Only
+    those columns are saved, so no further save signals fire.
+
+    Returns:
+        True if the variants were rebuilt
+    """
+    if not force and is_current(instance):
+        return False
+
+    image = instance.image
+    old_variants = instance.variants or {}
+    fields = {"variants": {}}
+    if image:
+        fields["variants"] = build_variants(image, type(instance).VARIANT_WIDTHS)
+    if hasattr(instance, "content_hash"):
+        fields["content_hash"] = ""
+        if image:
+            image.open("rb")
+            try:
+                fields["content_hash"] = hash_file(image)
+            finally:
+                image.close()
+    type(instance).objects.filter(pk=instance.pk).update(**fields)
+    for name, value in fields.items():
+        setattr(instance, name, value)
+    delete_variants(instance._meta.get_field("image").storage, old_variants)
+    return True
+
+
+def get_srcset(variants, extension, storage):
+    return ", ".join(
+        f"{storage.url(variant['name'])} {variant['width']}w"
+        for variant in variants.get(extension, [])
+    )
+
+
+def get_image_sources(image):
+    """URLs and dimensions for showing a CMS image.
+
+    ``src`` is the widest JPEG variant, ``thumbnail`` the narrowest; images
+    without current variants fall back to the original with no srcsets or
+    dimensions.
+    """
+    variants = image.variants or {}
+    if variants.get("source") != image.image.name or not variants.get("jpeg"):
+        url = image.image.url
+        return {
+            "src": url,
+            "thumbnail": url,
+            "srcset": "",
+            "webp_srcset": "",
+            "width": None,
+            "height": None,
+        }
+
+    storage = image.image.storage
+    return {
+        "src": storage.url(variants["jpeg"][-1]["name"]),
+        "thumbnail": storage.url(variants["jpeg"][0]["name"]),
+        "srcset": get_srcset(variants, "jpeg", storage),
+        "webp_srcset": get_srcset(variants, "webp", storage),
+        "width": variants["width"],
+        "height": variants["height"],
+    }
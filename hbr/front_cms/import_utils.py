@@ -0,0 +1,126 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from base.page_cache_utils import invalidate_public_pages
+from PIL import UnidentifiedImageError
+from .image_utils import build_variants, delete_variants, hash_file
+
+MAX_IMPORT_FILE_SIZE = 5 * 1024 * 1024
+
+# Shared by all bulk imports so concurrent uploads can't multiply threads.
+# Pillow releases the GIL while decoding, resizing and encoding, so the
+# workers run in parallel.
+_import_executor = None
+_import_executor_lock = threading.Lock()
+
+
+def get_import_executor():
+    global _import_executor
+    if _import_executor is None:
+        with _import_executor_lock:
+            if _import_executor is None:
+                _import_executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, "IMAGE_IMPORT_WORKERS", 4),
+                    thread_name_prefix="image-import",
+                )
+    return _import_executor
+
+
+def get_import_title(upload):
+    """Title from the file name, without its extension"""
+    return upload.name.rsplit(".", 1)[0] if "." in upload.name else upload.name
+
+
+def check_upload(upload):
+    """Cheap checks, then the content hash; returns (hash, error)"""
+    if not (upload.content_type or "").startswith("image/"):
+        return None, "Invalid file type"
+    if upload.size > MAX_IMPORT_FILE_SIZE:
+        return None, "File too large (max 5MB)"
+    return hash_file(upload), None
+
+
+def process_upload(instance, upload):
+    """Store an upload on an unsaved CMS image and build its variants.
+
+    Decoding the image for its variants is what verifies it; a file that
+    doesn't decode is removed again.
+    """
+    instance.image.save(upload.name, upload, save=False)
+    try:
+        instance.variants = build_variants(
+            instance.image, type(instance).VARIANT_WIDTHS
+        )
+    except Exception as e:
+        instance.image.delete(save=False)
+        if isinstance(e, (UnidentifiedImageError, SyntaxError)):
+            raise ValueError("Not a valid image") from e
+        raise
+    return instance
+
+
+def discard_imported(instances):
+    for instance in instances:
+        delete_variants(instance.image.storage, instance.variants)
+        instance.image.delete(save=False)
+
+
+def import_images(model, uploads, **fields):
+    """Bulk import uploaded files as new ``model`` rows.
+
+    Uploads are checked and hashed, then stored and resized, on the import
+    pool. Files whose content is already in the library, or earlier in the
+    same batch, are skipped, so importing an album twice adds nothing. The
+    new rows are inserted with one bulk_create, which sends no save signals,
+    so the public page cache is purged here.
+
+    Returns:
+        (imported instances, skipped file names, ["file name: error", ...])
+    """
+    executor = get_import_executor()
+    errors = []
+    checked = []
+    for upload, future in [
+        (upload, executor.submit(check_upload, upload)) for upload in uploads
+    ]:
+        try:
+            content_hash, error = future.result()
+        except Exception as e:
+            content_hash, error = None, str(e)
+        if error:
+            errors.append(f"{upload.name}: {error}")
+        else:
+            checked.append((upload, content_hash))
+
+    seen = set(
+        model.objects.filter(
+            content_hash__in={content_hash for _, content_hash in checked}
+        ).values_list("content_hash", flat=True)
+    )
+    skipped = []
+    pending = []
+    for upload, content_hash in checked:
+        if content_hash in seen:
+            skipped.append(upload.name)
+            continue
+        seen.add(content_hash)
+        instance = model(
+            title=get_import_title(upload), content_hash=content_hash, **fields
+        )
+        pending.append((upload, executor.submit(process_upload, instance, upload)))
+
+    instances = []
+    for upload, future in pending:
+        try:
+            instances.append(future.result())
+        except Exception as e:
+            errors.append(f"{upload.name}: {e}")
+
+    try:
+        model.objects.bulk_create(instances, batch_size=500)
+    except Exception:
+        discard_imported(instances)
+        raise
+    if instances:
+        invalidate_public_pages()
+    return instances, skipped, errors
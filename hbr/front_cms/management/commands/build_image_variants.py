@@ -0,0 +1,73 @@
+from django.core.management.base import BaseCommand
+from base.page_cache_utils import invalidate_public_pages
+from front_cms.image_utils import update_image_variants
+from front_cms.models import CarouselImage, GalleryImage, PopupImage
+
+MODELS = {
+    "carousel": CarouselImage,
+    "gallery": GalleryImage,
+    "popup": PopupImage,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Build the resized WebP and JPEG variants of carousel, gallery and "
+        "popup images uploaded before variants existed, or whose variants "
+        "are out of date."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            choices=sorted(MODELS),
+            action="append",
+            help="Only this kind of image (repeatable; default: all)",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Rebuild variants that are already current",
+        )
+
+    def handle(self, *args, **options):
+        built = skipped = failed = 0
+        original_bytes = variant_bytes = 0
+        for key in options["model"] or sorted(MODELS):
+            for image in MODELS[key].objects.exclude(image="").order_by("id"):
+                try:
+                    rebuilt = update_image_variants(image, force=options["force"])
+                except Exception as e:
+                    failed += 1
+                    self.stderr.write(f"{key} #{image.id} {image.image.name}: {e}")
+                    continue
+                if not rebuilt:
+                    skipped += 1
+                    continue
+                built += 1
+                jpeg = image.variants["jpeg"]
+                try:
+                    original_bytes += image.image.size
+                except OSError:
+                    pass
+                # What a wide screen downloads now instead of the original
+                variant_bytes += min(
+                    jpeg[-1]["size"], image.variants["webp"][-1]["size"]
+                )
+                self.stdout.write(
+                    f"{key} #{image.id}: {len(jpeg)} widths "
+                    f"({', '.join(str(variant['width']) for variant in jpeg)})"
+                )
+
+        if built:
+            invalidate_public_pages()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Built {built}, already current {skipped}, failed {failed}."
+            )
+        )
+        if original_bytes:
+            self.stdout.write(
+                f"Largest variants: {variant_bytes / 1024:.0f} KB "
+                f"against {original_bytes / 1024:.0f} KB of originals."
+            )
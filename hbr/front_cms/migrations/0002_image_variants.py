@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("front_cms", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="carouselimage",
+            name="variants",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                editable=False,
+                help_text="Resized copies of the image, built by front_cms.image_utils",
+            ),
+        ),
+        migrations.AddField(
+            model_name="galleryimage",
+            name="variants",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                editable=False,
+                help_text="Resized copies of the image, built by front_cms.image_utils",
+            ),
+        ),
+        migrations.AddField(
+            model_name="popupimage",
+            name="variants",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                editable=False,
+                help_text="Resized copies of the image, built by front_cms.image_utils",
+            ),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("front_cms", "0002_image_variants"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="carouselimage",
+            name="content_hash",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                help_text="SHA-256 of the image file, used to skip duplicate imports",
+                max_length=64,
+            ),
+        ),
+        migrations.AddField(
+            model_name="galleryimage",
+            name="content_hash",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                help_text="SHA-256 of the image file, used to skip duplicate imports",
+                max_length=64,
+            ),
+        ),
+    ]
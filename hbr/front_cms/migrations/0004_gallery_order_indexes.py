@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("front_cms", "0003_image_content_hash"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="galleryimage",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["display_order", "-created_at", "-id"],
+                name="gallery_order_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="galleryimage",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["category", "display_order", "-created_at", "-id"],
+                name="gallery_category_order_idx",
+            ),
+        ),
+    ]
@@ -16,6 +16,9 @@ def popup_image_path(instance, filename):
 
 
 class CarouselImage(models.Model):
+    # Widths of the resized copies served through srcset
+    VARIANT_WIDTHS = (640, 1024, 1440, 1920)
+
     title = models.CharField(
         max_length=200, help_text="Display title for the carousel image"
     )
@@ -35,6 +38,19 @@ class CarouselImage(models.Model):
     is_active = models.BooleanField(
         default=True, help_text="Show this image in carousel"
     )
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        db_index=True,
+        editable=False,
+        help_text="SHA-256 of the image file, used to skip duplicate imports",
+    )
+    variants = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        help_text="Resized copies of the image, built by front_cms.image_utils",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -61,6 +77,7 @@ class GalleryImage(models.Model):
         ("facilities", "Facilities"),
         ("other", "Other"),
     ]
+    VARIANT_WIDTHS = (320, 640, 960)
 
     title = models.CharField(max_length=200, help_text="Image title")
     image = models.ImageField(upload_to=gallery_image_path, help_text="Gallery image")
@@ -72,6 +89,19 @@ class GalleryImage(models.Model):
     is_active = models.BooleanField(
         default=True, help_text="Show this image in gallery"
     )
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        db_index=True,
+        editable=False,
+        help_text="SHA-256 of the image file, used to skip duplicate imports",
+    )
+    variants = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        help_text="Resized copies of the image, built by front_cms.image_utils",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -79,6 +109,20 @@ class GalleryImage(models.Model):
         ordering = ["display_order", "-created_at"]
         verbose_name = "Gallery Image"
         verbose_name_plural = "Gallery Images"
+        # The public gallery's keyset pages, unfiltered and by category.
+        # Partial, so SQLite matches them to its bare "WHERE is_active"
+        indexes = [
+            models.Index(
+                fields=["display_order", "-created_at", "-id"],
+                condition=models.Q(is_active=True),
+                name="gallery_order_idx",
+            ),
+            models.Index(
+                fields=["category", "display_order", "-created_at", "-id"],
+                condition=models.Q(is_active=True),
+                name="gallery_category_order_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.title} ({self.get_category_display()})"
@@ -91,6 +135,8 @@ class GalleryImage(models.Model):
 
 
 class PopupImage(models.Model):
+    VARIANT_WIDTHS = (400, 800)
+
     title = models.CharField(max_length=200, help_text="Popup title")
     image = models.ImageField(
         upload_to=popup_image_path, help_text="Popup image (recommended: 800x600px)"
@@ -107,6 +153,12 @@ class PopupImage(models.Model):
     end_date = models.DateTimeField(
         blank=True, null=True, help_text="When to stop showing the popup"
     )
+    variants = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        help_text="Resized copies of the image, built by front_cms.image_utils",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
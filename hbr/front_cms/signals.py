@@ -0,0 +1,27 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from base.page_cache_utils import invalidate_public_pages
+from .image_utils import delete_variants, update_image_variants
+from .models import CarouselImage, GalleryImage, PopupImage
+
+
+@receiver(post_save, sender=CarouselImage)
+@receiver(post_save, sender=GalleryImage)
+@receiver(post_save, sender=PopupImage)
+def build_image_variants(sender, instance, **kwargs):
+    """Resize a new or replaced upload for srcset, then purge public pages"""
+    try:
+        update_image_variants(instance)
+    except Exception as e:
+        # The page falls back to the original until a backfill succeeds
+        print(f"Error building variants for {instance.image.name}: {e}")
+    # After the variants, so a re-render picks up their srcset
+    invalidate_public_pages()
+
+
+@receiver(post_delete, sender=CarouselImage)
+@receiver(post_delete, sender=GalleryImage)
+@receiver(post_delete, sender=PopupImage)
+def remove_image_variants(sender, instance, **kwargs):
+    delete_variants(sender._meta.get_field("image").storage, instance.variants)
+    invalidate_public_pages()
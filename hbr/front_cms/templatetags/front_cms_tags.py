@@ -0,0 +1,34 @@
+from django import template
+from django.forms.utils import flatatt
+from django.utils.html import format_html
+from front_cms.image_utils import get_image_sources
+
+register = template.Library()
+
+
+@register.simple_tag
+def responsive_image(image, sizes="100vw", **attrs):
+    """A CMS image as a <picture> offering its WebP and JPEG variants.
+
+    Usage: {% responsive_image image sizes="(max-width: 768px) 100vw, 380px" alt=image.title loading="lazy" %}
+
+    Images without variants yet render as a plain <img> of the original.
+    """
+    sources = get_image_sources(image)
+    if not sources["srcset"]:
+        return format_html("<img{}>", flatatt({"src": sources["src"], **attrs}))
+
+    img_attrs = {
+        "src": sources["src"],
+        "srcset": sources["srcset"],
+        "sizes": sizes,
+        "width": sources["width"],
+        "height": sources["height"],
+        **attrs,
+    }
+    return format_html(
+        '<picture><source type="image/webp" srcset="{}" sizes="{}"><img{}></picture>',
+        sources["webp_srcset"],
+        sizes,
+        flatatt(img_attrs),
+    )
@@ -5,8 +5,10 @@ from django.contrib.auth.models import Group, User
 from django.contrib.auth import login, authenticate, logout
 from django.contrib.auth.decorators import login_required
 from django.core.paginator import Paginator
+from django.conf import settings
 from .models import CarouselImage, GalleryImage, PopupImage
 from .forms import CarouselImageForm, GalleryImageForm, PopupImageForm
+from .import_utils import import_images
 
 
 def get_user_role(user):
@@ -61,6 +63,7 @@ def manage_carousel(request: HttpRequest):
         "role": role,
         "page_obj": page_obj,
         "form": CarouselImageForm(),
+        "max_import_files": settings.DATA_UPLOAD_MAX_NUMBER_FILES,
     }
     return render(request, "front_cms/manage_carousel.html", context)
 
@@ -93,6 +96,7 @@ def manage_gallery(request: HttpRequest):
         "page_obj": page_obj,
         "form": GalleryImageForm(),
         "categories": categories,
+        "max_import_files": settings.DATA_UPLOAD_MAX_NUMBER_FILES,
     }
     return render(request, "front_cms/manage_gallery.html", context)
 
@@ -383,44 +387,27 @@ def bulk_import_carousel(request: HttpRequest):
                 {"success": False, "error": "No images provided"}, status=400
             )
 
-        imported_count = 0
-        errors = []
-
-        for image_file in images:
-            # Validate file type
-            if not image_file.content_type.startswith("image/"):
-                errors.append(f"{image_file.name}: Invalid file type")
-                continue
-
-            # Validate file size (5MB max)
-            if image_file.size > 5 * 1024 * 1024:
-                errors.append(f"{image_file.name}: File too large (max 5MB)")
-                continue
-
-            # Create title from filename (remove extension)
-            title = (
-                image_file.name.rsplit(".", 1)[0]
-                if "." in image_file.name
-                else image_file.name
-            )
-
-            try:
-                CarouselImage.objects.create(
-                    title=title, image=image_file, is_active=True
-                )
-                imported_count += 1
-            except Exception as e:
-                errors.append(f"{image_file.name}: {str(e)}")
+        imported, skipped, errors = import_images(CarouselImage, images, is_active=True)
+        imported_count = len(imported)
 
         if imported_count > 0:
             messages.success(
                 request, f"Successfully imported {imported_count} carousel images."
             )
+        if skipped:
+            messages.info(
+                request, f"Skipped {len(skipped)} images already in the library."
+            )
         if errors:
             messages.warning(request, f"Errors during import: {', '.join(errors)}")
 
         return JsonResponse(
-            {"success": True, "imported": imported_count, "errors": errors}
+            {
+                "success": True,
+                "imported": imported_count,
+                "skipped": len(skipped),
+                "errors": errors,
+            }
         )
 
     return JsonResponse({"error": "Method not allowed"}, status=405)
@@ -449,44 +436,29 @@ def bulk_import_gallery(request: HttpRequest):
                 {"success": False, "error": "Invalid category"}, status=400
             )
 
-        imported_count = 0
-        errors = []
-
-        for image_file in images:
-            # Validate file type
-            if not image_file.content_type.startswith("image/"):
-                errors.append(f"{image_file.name}: Invalid file type")
-                continue
-
-            # Validate file size (5MB max)
-            if image_file.size > 5 * 1024 * 1024:
-                errors.append(f"{image_file.name}: File too large (max 5MB)")
-                continue
-
-            # Create title from filename (remove extension)
-            title = (
-                image_file.name.rsplit(".", 1)[0]
-                if "." in image_file.name
-                else image_file.name
-            )
-
-            try:
-                GalleryImage.objects.create(
-                    title=title, image=image_file, category=category, is_active=True
-                )
-                imported_count += 1
-            except Exception as e:
-                errors.append(f"{image_file.name}: {str(e)}")
+        imported, skipped, errors = import_images(
+            GalleryImage, images, category=category, is_active=True
+        )
+        imported_count = len(imported)
 
         if imported_count > 0:
             messages.success(
                 request, f"Successfully imported {imported_count} gallery images."
             )
+        if skipped:
+            messages.info(
+                request, f"Skipped {len(skipped)} images already in the library."
+            )
         if errors:
             messages.warning(request, f"Errors during import: {', '.join(errors)}")
 
         return JsonResponse(
-            {"success": True, "imported": imported_count, "errors": errors}
+            {
+                "success": True,
+                "imported": imported_count,
+                "skipped": len(skipped),
+                "errors": errors,
+            }
         )
 
     return JsonResponse({"error": "Method not allowed"}, status=405)
@@ -111,6 +111,23 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Dashboard widgets and notification inboxes are cached per user. Point this at
+# a shared backend (e.g. Redis or memcached) when running several workers, so
+# invalidations reach every process.
+
+CACHES = {
+    "default": {
+        "BACKEND": config(
+            "CACHE_BACKEND",
+            default="django.core.cache.backends.locmem.LocMemCache",
+        ),
+        "LOCATION": config("CACHE_LOCATION", default=""),
+    }
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -155,6 +172,60 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'    # where collectstatic puts files
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# Uploads are stored once per distinct content under MEDIA_ROOT/blobs and
+# hard linked to their usual paths, so repeated logos, photos and PDFs take
+# the space of one copy (back up with hard links preserved, e.g. rsync -H).
+# Run "manage.py dedupe_media" once for files uploaded before. Set
+# MEDIA_DEDUP=False for plain FileSystemStorage, e.g. when MEDIA_ROOT spans
+# filesystems.
+MEDIA_DEDUP = config("MEDIA_DEDUP", default=True, cast=bool)
+STORAGES = {
+    "default": {
+        "BACKEND": (
+            "base.storage.DedupFileSystemStorage"
+            if MEDIA_DEDUP
+            else "django.core.files.storage.FileSystemStorage"
+        ),
+    },
+    "staticfiles": {
+        "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
+    },
+}
+
+# Protected media (notice attachments, documents, certificates, timetables)
+# is served by views after permission checks. Set to "nginx" or "apache" to
+# hand the transfer to the front server via X-Accel-Redirect / X-Sendfile;
+# for nginx, PROTECTED_FILE_PREFIX must be an internal location aliasing
+# MEDIA_ROOT.
+PROTECTED_FILE_SERVER = config("PROTECTED_FILE_SERVER", default="")
+PROTECTED_FILE_PREFIX = config("PROTECTED_FILE_PREFIX", default="/protected/")
+
+# HTML to PDF rendering (marksheets, result sheets, certificates). Renders go
+# through a bounded pool of wkhtmltopdf workers with a per-job timeout in
+# seconds; set PDF_RENDER_POOL=False to call pdfkit directly instead.
+WKHTMLTOPDF_PATH = config("WKHTMLTOPDF_PATH", default="")
+PDF_RENDER_POOL = config("PDF_RENDER_POOL", default=True, cast=bool)
+PDF_RENDER_WORKERS = config("PDF_RENDER_WORKERS", default=2, cast=int)
+PDF_RENDER_TIMEOUT = config("PDF_RENDER_TIMEOUT", default=60, cast=int)
+
+# Public pages (homepage, gallery, news, ...) are cached for anonymous
+# visitors for up to this many seconds, and purged when CMS images or public
+# notices change; 0 disables the cache.
+PUBLIC_PAGE_CACHE_TIMEOUT = config("PUBLIC_PAGE_CACHE_TIMEOUT", default=600, cast=int)
+
+# Bulk carousel and gallery imports hash, verify and resize uploads on a
+# pool of this many threads. An import may carry up to
+# DATA_UPLOAD_MAX_NUMBER_FILES files (Django's default is 100).
+IMAGE_IMPORT_WORKERS = config("IMAGE_IMPORT_WORKERS", default=4, cast=int)
+DATA_UPLOAD_MAX_NUMBER_FILES = config(
+    "DATA_UPLOAD_MAX_NUMBER_FILES", default=200, cast=int
+)
+
+# Generated PDFs (profiles, admit cards, exam timetables, receipts) are cached
+# under MEDIA_ROOT/pdf_cache, keyed by a hash of their inputs. Least recently
+# used entries are evicted past this many bytes; 0 disables the cache.
+PDF_CACHE_MAX_SIZE = config("PDF_CACHE_MAX_SIZE", default=500 * 1024 * 1024, cast=int)
+
 # Cloudinary storage for demo mode
 if DEMO_MODE:
     DEFAULT_FILE_STORAGE = "cloudinary_storage.storage.MediaCloudinaryStorage"
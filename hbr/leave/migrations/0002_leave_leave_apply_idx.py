@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("leave", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="leave",
+            index=models.Index(fields=["apply_date", "id"], name="leave_apply_idx"),
+        ),
+    ]
@@ -48,3 +48,5 @@ class Leave(models.Model):
                 name="either_student_or_teacher",
             )
         ]
+        # Keyset pagination of the leave lists seeks on (apply_date, id)
+        indexes = [models.Index(fields=["apply_date", "id"], name="leave_apply_idx")]
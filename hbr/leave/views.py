@@ -4,17 +4,44 @@ from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.contrib.contenttypes.models import ContentType
 from django.utils import timezone
-from django.core.paginator import Paginator
 import csv
 import io
 import json
 import pandas as pd
 from datetime import date
+from base.pagination_utils import keyset_json_response, paginate_keyset
 from base.views import get_user_role
 from .models import Leave
 from students.models import Student
 from teachers.models import Teacher
 from notices.models import Notice
+from dashboard.models import ActivityEvent
+from dashboard.activity_utils import record_activity
+
+
+def record_leave_decision(leave, admin_user):
+    """Log an approved/rejected leave to the applicant's activity feed"""
+    applicant = leave.student or leave.teacher
+    record_activity(
+        ActivityEvent.EventType.LEAVE,
+        f"Leave {leave.status.lower()} for {applicant.user.get_full_name()}",
+        actor=admin_user,
+        audience=applicant.user,
+        status=leave.status.lower(),
+    )
+
+
+def serialize_leave(leave):
+    applicant = leave.teacher if leave.teacher_id else leave.student
+    return {
+        "id": leave.id,
+        "applicant": applicant.user.get_full_name(),
+        "reason": leave.reason,
+        "from_date": leave.from_date.isoformat(),
+        "to_date": leave.to_date.isoformat(),
+        "status": leave.status,
+        "apply_date": leave.apply_date.isoformat(),
+    }
 
 
 @login_required
@@ -47,6 +74,12 @@ def leave(request: HttpRequest):
                         from_date=from_date,
                         to_date=to_date,
                     )
+                    record_activity(
+                        ActivityEvent.EventType.LEAVE,
+                        f"{request.user.get_full_name()} applied for leave",
+                        actor=request.user,
+                        status="pending",
+                    )
                     return JsonResponse({"success": True})
                 except Exception as e:
                     return JsonResponse(
@@ -131,6 +164,12 @@ def leave(request: HttpRequest):
                         notice_type=Notice.NoticeType.SYSTEM_ALERT,
                         created_by=request.user,
                     )
+                    record_activity(
+                        ActivityEvent.EventType.LEAVE,
+                        f"{teacher.user.get_full_name()} applied for leave",
+                        actor=request.user,
+                        status="pending",
+                    )
                     return JsonResponse({"success": True})
                 except Exception as e:
                     return JsonResponse(
@@ -198,6 +237,7 @@ def leave(request: HttpRequest):
                     leave.approved_on = timezone.now()
                     leave.approved_by = request.user
                     leave.save()
+                    record_leave_decision(leave, request.user)
                     return JsonResponse({"success": True})
                 except Leave.DoesNotExist:
                     return JsonResponse({"success": False, "error": "Leave not found"})
@@ -217,6 +257,7 @@ def leave(request: HttpRequest):
                     leave.approved_on = timezone.now()
                     leave.approved_by = request.user
                     leave.save()
+                    record_leave_decision(leave, request.user)
                     return JsonResponse({"success": True})
                 except Leave.DoesNotExist:
                     return JsonResponse({"success": False, "error": "Leave not found"})
@@ -300,24 +341,18 @@ def leave(request: HttpRequest):
             context["error"] = "Teacher profile not found"
 
     elif role == "Admin":
-        # Get page numbers and filters from request
-        teacher_page = request.GET.get("teacher_page", 1)
-        student_page = request.GET.get("student_page", 1)
+        # Get filters from request
         teacher_search = request.GET.get("teacher_search", "").strip()
         student_search = request.GET.get("student_search", "").strip()
         teacher_status = request.GET.get("teacher_status", "")
         student_status = request.GET.get("student_status", "")
 
         # Base querysets
-        all_teacher_leaves = (
-            Leave.objects.filter(teacher__isnull=False)
-            .select_related("teacher", "approved_by")
-            .order_by("-apply_date")
+        all_teacher_leaves = Leave.objects.filter(teacher__isnull=False).select_related(
+            "teacher__user", "approved_by"
         )
-        all_student_leaves = (
-            Leave.objects.filter(student__isnull=False)
-            .select_related("student", "approved_by")
-            .order_by("-apply_date")
+        all_student_leaves = Leave.objects.filter(student__isnull=False).select_related(
+            "student__user", "approved_by"
         )
 
         # Apply teacher filters
@@ -340,24 +375,34 @@ def leave(request: HttpRequest):
         if student_status:
             all_student_leaves = all_student_leaves.filter(status=student_status)
 
-        # Paginate teacher leaves
-        teacher_paginator = Paginator(all_teacher_leaves, 10)  # 10 items per page
-        try:
-            teacher_leaves_page = teacher_paginator.page(teacher_page)
-        except:
-            teacher_leaves_page = teacher_paginator.page(1)
+        # Keyset pagination, 10 items per page, newest first
+        teacher_leaves_page = paginate_keyset(
+            all_teacher_leaves,
+            ["-apply_date", "-id"],
+            request.GET.get("teacher_cursor"),
+            10,
+        )
+        student_leaves_page = paginate_keyset(
+            all_student_leaves,
+            ["-apply_date", "-id"],
+            request.GET.get("student_cursor"),
+            10,
+        )
 
-        # Paginate student leaves
-        student_paginator = Paginator(all_student_leaves, 10)  # 10 items per page
-        try:
-            student_leaves_page = student_paginator.page(student_page)
-        except:
-            student_leaves_page = student_paginator.page(1)
+        if request.GET.get("format") == "json":
+            leave_list = request.GET.get("list", "student")
+            return keyset_json_response(
+                (
+                    teacher_leaves_page
+                    if leave_list == "teacher"
+                    else student_leaves_page
+                ),
+                "leaves",
+                serialize_leave,
+            )
 
         context["all_teacher_leaves"] = teacher_leaves_page
         context["all_student_leaves"] = student_leaves_page
-        context["teacher_paginator"] = teacher_paginator
-        context["student_paginator"] = student_paginator
 
     # Render appropriate template based on role
     if role == "Admin":
@@ -0,0 +1,224 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models import Q
+from students.models import Student
+from teachers.models import Teacher
+from .models import Notice, NoticeDelivery
+
+STUDENT_NOTICE_TYPES = [
+    Notice.NoticeType.PUBLIC,
+    Notice.NoticeType.ALL_STUDENTS,
+    Notice.NoticeType.CLASS_STUDENTS,
+    Notice.NoticeType.INDIVIDUAL_STUDENT,
+]
+
+TEACHER_NOTICE_TYPES = [
+    Notice.NoticeType.PUBLIC,
+    Notice.NoticeType.ALL_TEACHERS,
+    Notice.NoticeType.INDIVIDUAL_TEACHER,
+]
+
+# Personal notices, the only ones the header dropdown lists; broadcasts stay
+# on the notice board
+DROPDOWN_NOTICE_TYPES = [
+    Notice.NoticeType.INDIVIDUAL_STUDENT,
+    Notice.NoticeType.INDIVIDUAL_TEACHER,
+    Notice.NoticeType.SYSTEM_ALERT,
+]
+
+# Upper bound on how stale a cached inbox summary can get if an invalidation
+# is missed (e.g. with a per-process cache backend)
+INBOX_CACHE_TIMEOUT = 300
+
+
+def get_notice_recipient_ids(notice):
+    """Get the ids of every user a notice should be delivered to"""
+    notice_type = notice.notice_type
+    student_users = Student.objects.values_list("user_id", flat=True)
+    teacher_users = Teacher.objects.values_list("user_id", flat=True)
+
+    if notice_type == Notice.NoticeType.PUBLIC:
+        return set(student_users) | set(teacher_users)
+    if notice_type == Notice.NoticeType.ALL_STUDENTS:
+        return set(student_users)
+    if notice_type == Notice.NoticeType.CLASS_STUDENTS:
+        if not notice.target_class_id:
+            return set()
+        return set(student_users.filter(classroom_id=notice.target_class_id))
+    if notice_type == Notice.NoticeType.INDIVIDUAL_STUDENT:
+        return set(notice.target_students.values_list("user_id", flat=True))
+    if notice_type == Notice.NoticeType.ALL_TEACHERS:
+        return set(teacher_users)
+    if notice_type == Notice.NoticeType.INDIVIDUAL_TEACHER:
+        return set(notice.target_teachers.values_list("user_id", flat=True))
+    if notice_type == Notice.NoticeType.SYSTEM_ALERT:
+        return set(
+            User.objects.filter(groups__name="Admin").values_list("id", flat=True)
+        )
+    return set()
+
+
+def sync_notice_deliveries(notice):
+    """Fan a notice out to its current audience.
+
+    Creates deliveries for new recipients, removes those no longer targeted and
+    keeps the read/dismissed flags of everyone else.
+    """
+    recipient_ids = get_notice_recipient_ids(notice)
+    deliveries = NoticeDelivery.objects.filter(notice=notice)
+    existing_ids = set(deliveries.values_list("user_id", flat=True))
+
+    removed_ids = existing_ids - recipient_ids
+    if removed_ids:
+        deliveries.filter(user_id__in=removed_ids).delete()
+
+    NoticeDelivery.objects.bulk_create(
+        [
+            NoticeDelivery(
+                notice=notice,
+                user_id=user_id,
+                created_at=notice.created_at,
+                is_active=notice.is_active,
+            )
+            for user_id in recipient_ids - existing_ids
+        ],
+        batch_size=1000,
+    )
+    deliveries.exclude(is_active=notice.is_active).update(is_active=notice.is_active)
+    invalidate_inbox_cache(recipient_ids | existing_ids)
+
+
+def sync_user_deliveries(user, notice_types, audience):
+    """Deliver every notice targeting a (new or moved) student/teacher.
+
+    ``notice_types`` are the notice types that can reach this kind of user and
+    ``audience`` is a Q on Notice matching the ones that reach this user.
+    """
+    notices = Notice.objects.filter(notice_type__in=notice_types)
+    targeted = dict(notices.filter(audience).distinct().values_list("id", "created_at"))
+    deliveries = NoticeDelivery.objects.filter(
+        user=user, notice__notice_type__in=notice_types
+    )
+    existing_ids = set(deliveries.values_list("notice_id", flat=True))
+
+    deliveries.exclude(notice_id__in=targeted).delete()
+    active_ids = set(
+        notices.filter(id__in=targeted, is_active=True).values_list("id", flat=True)
+    )
+    NoticeDelivery.objects.bulk_create(
+        [
+            NoticeDelivery(
+                notice_id=notice_id,
+                user=user,
+                created_at=created_at,
+                is_active=notice_id in active_ids,
+            )
+            for notice_id, created_at in targeted.items()
+            if notice_id not in existing_ids
+        ],
+        batch_size=1000,
+    )
+    invalidate_inbox_cache([user.id])
+
+
+def sync_student_deliveries(student):
+    """Deliver every notice targeting a student"""
+    sync_user_deliveries(
+        student.user,
+        STUDENT_NOTICE_TYPES,
+        Q(notice_type=Notice.NoticeType.PUBLIC)
+        | Q(notice_type=Notice.NoticeType.ALL_STUDENTS)
+        | Q(
+            notice_type=Notice.NoticeType.CLASS_STUDENTS,
+            target_class_id=student.classroom_id,
+        )
+        | Q(
+            notice_type=Notice.NoticeType.INDIVIDUAL_STUDENT,
+            target_students=student,
+        ),
+    )
+
+
+def sync_teacher_deliveries(teacher):
+    """Deliver every notice targeting a teacher"""
+    sync_user_deliveries(
+        teacher.user,
+        TEACHER_NOTICE_TYPES,
+        Q(notice_type=Notice.NoticeType.PUBLIC)
+        | Q(notice_type=Notice.NoticeType.ALL_TEACHERS)
+        | Q(
+            notice_type=Notice.NoticeType.INDIVIDUAL_TEACHER,
+            target_teachers=teacher,
+        ),
+    )
+
+
+def sync_admin_deliveries(user):
+    """Deliver system alerts to a user who joined the Admin group, and
+    withdraw them from one who left it"""
+    is_admin = user.groups.filter(name="Admin").exists()
+    sync_user_deliveries(
+        user,
+        [Notice.NoticeType.SYSTEM_ALERT],
+        Q(notice_type=Notice.NoticeType.SYSTEM_ALERT) if is_admin else Q(pk__in=[]),
+    )
+
+
+def get_inbox(user):
+    """Active, undismissed deliveries for a user, newest first"""
+    return NoticeDelivery.objects.filter(
+        user=user, is_active=True, is_dismissed=False
+    ).order_by("-created_at")
+
+
+def inbox_cache_key(user_id):
+    return f"notices:inbox:{user_id}"
+
+
+def invalidate_inbox_cache(user_ids):
+    """Drop the cached inbox summaries of the given users"""
+    cache.delete_many([inbox_cache_key(user_id) for user_id in user_ids])
+
+
+def invalidate_notice_inboxes(notice_ids):
+    """Drop the cached inbox summaries of everyone the given notices reached"""
+    invalidate_inbox_cache(
+        NoticeDelivery.objects.filter(notice_id__in=notice_ids)
+        .values_list("user_id", flat=True)
+        .distinct()
+    )
+
+
+def get_inbox_summary(user):
+    """Unread count and latest five unread personal notices for the header
+    dropdown.
+
+    Cached per user as plain values, so a cache hit costs no queries.
+    """
+    key = inbox_cache_key(user.id)
+    summary = cache.get(key)
+    if summary is None:
+        unread = get_inbox(user).filter(
+            is_read=False, notice__notice_type__in=DROPDOWN_NOTICE_TYPES
+        )
+        summary = {
+            "unread_count": unread.count(),
+            "notifications": [
+                {
+                    "id": row["notice_id"],
+                    "title": row["notice__title"],
+                    "content": row["notice__content"],
+                    "created_at": row["created_at"],
+                    "attachment": bool(row["notice__attachment"]),
+                }
+                for row in unread.values(
+                    "notice_id",
+                    "notice__title",
+                    "notice__content",
+                    "notice__attachment",
+                    "created_at",
+                )[:5]
+            ],
+        }
+        cache.set(key, summary, INBOX_CACHE_TIMEOUT)
+    return summary
@@ -0,0 +1,69 @@
+from django.db import migrations
+
+
+def backfill_notice_deliveries(apps, schema_editor):
+    """Materialise deliveries for notices created before the inbox table"""
+    Notice = apps.get_model("notices", "Notice")
+    NoticeDelivery = apps.get_model("notices", "NoticeDelivery")
+    Student = apps.get_model("students", "Student")
+    Teacher = apps.get_model("teachers", "Teacher")
+    User = apps.get_model("auth", "User")
+
+    student_users = set(Student.objects.values_list("user_id", flat=True))
+    teacher_users = set(Teacher.objects.values_list("user_id", flat=True))
+    admin_users = set(
+        User.objects.filter(groups__name="Admin").values_list("id", flat=True)
+    )
+
+    for notice in Notice.objects.all().iterator():
+        notice_type = notice.notice_type
+        if notice_type == "PUBLIC":
+            recipients = student_users | teacher_users
+        elif notice_type == "ALL_STUDENTS":
+            recipients = student_users
+        elif notice_type == "CLASS_STUDENTS":
+            recipients = set(
+                Student.objects.filter(classroom_id=notice.target_class_id).values_list(
+                    "user_id", flat=True
+                )
+            )
+        elif notice_type == "INDIVIDUAL_STUDENT":
+            recipients = set(notice.target_students.values_list("user_id", flat=True))
+        elif notice_type == "ALL_TEACHERS":
+            recipients = teacher_users
+        elif notice_type == "INDIVIDUAL_TEACHER":
+            recipients = set(notice.target_teachers.values_list("user_id", flat=True))
+        elif notice_type == "SYSTEM_ALERT":
+            recipients = admin_users
+        else:
+            recipients = set()
+
+        dismissed = set(notice.dismissed_by.values_list("id", flat=True))
+        NoticeDelivery.objects.bulk_create(
+            [
+                NoticeDelivery(
+                    notice_id=notice.id,
+                    user_id=user_id,
+                    created_at=notice.created_at,
+                    is_active=notice.is_active,
+                    is_read=user_id in dismissed,
+                    is_dismissed=user_id in dismissed,
+                )
+                for user_id in recipients
+            ],
+            batch_size=1000,
+            ignore_conflicts=True,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notices", "0005_noticedelivery"),
+        ("students", "0008_alter_student_mobile_no"),
+        ("teachers", "0003_teacher_plain_text_password"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_notice_deliveries, migrations.RunPython.noop),
+    ]
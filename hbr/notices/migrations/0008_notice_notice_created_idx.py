@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notices", "0007_notice_search_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="notice",
+            index=models.Index(fields=["created_at", "id"], name="notice_created_idx"),
+        ),
+    ]
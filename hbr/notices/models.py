@@ -62,3 +62,41 @@ class Notice(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        # Keyset pagination of the notice board seeks on (created_at, id)
+        indexes = [models.Index(fields=["created_at", "id"], name="notice_created_idx")]
+
+
+class NoticeDelivery(models.Model):
+    """A notice delivered to one recipient's inbox.
+
+    Rows are materialised from the notice's audience when it is created or
+    edited (see notices.delivery_utils), so inbox queries never have to
+    evaluate the audience rules.
+    """
+
+    notice = models.ForeignKey(
+        Notice, on_delete=models.CASCADE, related_name="deliveries"
+    )
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="notice_deliveries"
+    )
+    # Copies of the notice fields used to filter and order the inbox
+    created_at = models.DateTimeField()
+    is_active = models.BooleanField(default=True)
+
+    is_read = models.BooleanField(default=False)
+    is_dismissed = models.BooleanField(default=False)
+
+    def __str__(self):
+        return f"{self.notice.title} -> {self.user}"
+
+    class Meta:
+        ordering = ["-created_at"]
+        unique_together = ("notice", "user")
+        indexes = [
+            models.Index(
+                fields=["user", "is_dismissed", "-created_at"],
+                name="delivery_inbox_idx",
+            ),
+            models.Index(fields=["user", "is_read"], name="delivery_unread_idx"),
+        ]
@@ -0,0 +1,178 @@
+import re
+from functools import lru_cache
+from django.db import connection, connections
+from django.db.models import Q
+from django.utils.html import escape
+from .models import Notice, NoticeDelivery
+
+FTS_TABLE = "notices_notice_fts"
+
+# External-content FTS5 index over notices_notice, kept in sync by triggers.
+# Every statement is idempotent: SQLite drops a table's triggers when Django
+# rebuilds it during a migration, so they are re-created after each migrate.
+FTS_SETUP_SQL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, content,
+        content='notices_notice', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON notices_notice
+    BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, content)
+        VALUES (new.id, new.title, new.content);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON notices_notice
+    BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, content)
+        VALUES ('delete', old.id, old.title, old.content);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au
+    AFTER UPDATE OF title, content ON notices_notice
+    BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, content)
+        VALUES ('delete', old.id, old.title, old.content);
+        INSERT INTO {FTS_TABLE}(rowid, title, content)
+        VALUES (new.id, new.title, new.content);
+    END
+    """,
+]
+
+# Control characters never typed into a notice; swapped for <mark> after escaping
+MARK_START = "\x02"
+MARK_END = "\x03"
+
+
+def ensure_search_index(using="default"):
+    """Create the FTS5 table and its sync triggers if they are missing"""
+    conn = connections[using]
+    if (
+        conn.vendor != "sqlite"
+        or Notice._meta.db_table not in conn.introspection.table_names()
+    ):
+        return
+    with conn.cursor() as cursor:
+        for statement in FTS_SETUP_SQL:
+            cursor.execute(statement)
+    _has_search_index.cache_clear()
+
+
+@lru_cache
+def _has_search_index(database_name):
+    return FTS_TABLE in connection.introspection.table_names()
+
+
+def has_search_index():
+    """Check whether the FTS5 notice index is available on this database"""
+    return connection.vendor == "sqlite" and _has_search_index(
+        str(connection.settings_dict["NAME"])
+    )
+
+
+def get_search_terms(query):
+    """Split a search box query into plain word tokens"""
+    return re.findall(r"\w+", query.lower())
+
+
+def build_match_query(terms):
+    """Build an FTS5 MATCH expression requiring every term as a prefix"""
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def get_audience_notices(user, role):
+    """Notices a user may find through search"""
+    if role == "Admin":
+        return Notice.objects.exclude(notice_type=Notice.NoticeType.SYSTEM_ALERT)
+    return Notice.objects.filter(
+        id__in=NoticeDelivery.objects.filter(user=user, is_active=True).values(
+            "notice_id"
+        )
+    )
+
+
+def render_highlight(text):
+    """Escape text and turn highlight markers into <mark> tags"""
+    return escape(text).replace(MARK_START, "<mark>").replace(MARK_END, "</mark>")
+
+
+def highlight_terms(text, terms, length=None):
+    """Highlight term prefixes in text (fallback for non-FTS backends)"""
+    if length and len(text) > length:
+        text = text[:length] + "…"
+    pattern = re.compile(
+        r"\b(" + "|".join(re.escape(term) for term in terms) + r")", re.IGNORECASE
+    )
+    return render_highlight(pattern.sub(rf"{MARK_START}\1{MARK_END}", text))
+
+
+def search_notices(user, role, query, limit=20):
+    """Full-text search over the notices a user can see, best matches first.
+
+    Returns dicts with HTML-safe ``title`` and ``snippet`` where the matched
+    terms are wrapped in <mark>.
+    """
+    terms = get_search_terms(query)
+    if not terms:
+        return []
+
+    notices = get_audience_notices(user, role)
+    if has_search_index():
+        # The unary + keeps SQLite from driving the scan off the audience
+        # subquery, which would re-run the MATCH once per candidate row
+        audience_sql, audience_params = (
+            notices.order_by().values("id").query.sql_with_params()
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                SELECT rowid,
+                       highlight({FTS_TABLE}, 0, %s, %s),
+                       snippet({FTS_TABLE}, 1, %s, %s, '…', 24)
+                FROM {FTS_TABLE}
+                WHERE {FTS_TABLE} MATCH %s AND +rowid IN ({audience_sql})
+                ORDER BY rank
+                LIMIT %s
+                """,
+                [
+                    MARK_START,
+                    MARK_END,
+                    MARK_START,
+                    MARK_END,
+                    build_match_query(terms),
+                    *audience_params,
+                    limit,
+                ],
+            )
+            matches = cursor.fetchall()
+        details = Notice.objects.in_bulk([row[0] for row in matches])
+        return [
+            {
+                "id": notice_id,
+                "title": render_highlight(title),
+                "snippet": render_highlight(snippet),
+                "notice_type": details[notice_id].get_notice_type_display(),
+                "created_at": details[notice_id].created_at.isoformat(),
+            }
+            for notice_id, title, snippet in matches
+            if notice_id in details
+        ]
+
+    # Fallback for other databases: every term must appear in title or content
+    for term in terms:
+        notices = notices.filter(Q(title__icontains=term) | Q(content__icontains=term))
+    return [
+        {
+            "id": notice.id,
+            "title": highlight_terms(notice.title, terms),
+            "snippet": highlight_terms(notice.content, terms, length=200),
+            "notice_type": notice.get_notice_type_display(),
+            "created_at": notice.created_at.isoformat(),
+        }
+        for notice in notices.order_by("-created_at")[:limit]
+    ]
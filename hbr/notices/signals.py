@@ -0,0 +1,133 @@
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.contrib.auth.models import Group, User
+from django.dispatch import receiver
+from base.page_cache_utils import invalidate_public_pages
+from students.models import Student
+from teachers.models import Teacher
+from .models import Notice
+from .delivery_utils import (
+    invalidate_notice_inboxes,
+    sync_admin_deliveries,
+    sync_notice_deliveries,
+    sync_student_deliveries,
+    sync_teacher_deliveries,
+)
+from .search_utils import ensure_search_index
+
+
+@receiver(post_save, sender=Notice)
+def deliver_notice(sender, instance, **kwargs):
+    """Fan a notice out to its audience whenever it is created or edited"""
+    sync_notice_deliveries(instance)
+
+
+@receiver(pre_delete, sender=Notice)
+def forget_deleted_notice(sender, instance, **kwargs):
+    """Drop cached inboxes that still list a notice about to be deleted"""
+    invalidate_notice_inboxes([instance.id])
+
+
+@receiver(m2m_changed, sender=Notice.target_students.through)
+@receiver(m2m_changed, sender=Notice.target_teachers.through)
+def redeliver_notice_targets(sender, instance, action, reverse, **kwargs):
+    """Keep deliveries in sync when individual notice targets change"""
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    if not reverse:
+        sync_notice_deliveries(instance)
+    elif isinstance(instance, Student):
+        sync_student_deliveries(instance)
+    elif isinstance(instance, Teacher):
+        sync_teacher_deliveries(instance)
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+def redeliver_system_alerts(sender, instance, action, reverse, pk_set, **kwargs):
+    """System alerts reach whoever is in the Admin group, including users
+    added to it after the alert was raised"""
+    if action == "pre_clear":
+        # post_clear doesn't say which rows went, so note them beforehand
+        if reverse and instance.name == "Admin":
+            instance._cleared_user_ids = list(
+                instance.user_set.values_list("id", flat=True)
+            )
+        elif not reverse:
+            instance._was_admin = instance.groups.filter(name="Admin").exists()
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    if reverse:
+        if instance.name != "Admin":
+            return
+        if action == "post_clear":
+            user_ids = instance.__dict__.pop("_cleared_user_ids", [])
+        else:
+            user_ids = pk_set
+        for user in User.objects.filter(id__in=user_ids):
+            sync_admin_deliveries(user)
+    elif action == "post_clear":
+        if instance.__dict__.pop("_was_admin", False):
+            sync_admin_deliveries(instance)
+    elif Group.objects.filter(id__in=pk_set, name="Admin").exists():
+        sync_admin_deliveries(instance)
+
+
+@receiver(pre_save, sender=Student)
+def note_student_class_change(sender, instance, update_fields=None, **kwargs):
+    """Remember whether a saved student is moving to another class"""
+    instance._class_changed = (
+        not instance._state.adding
+        and (update_fields is None or "classroom" in update_fields)
+        and not Student.objects.filter(
+            pk=instance.pk, classroom_id=instance.classroom_id
+        ).exists()
+    )
+
+
+@receiver(post_save, sender=Student)
+def deliver_student_notices(sender, instance, created, **kwargs):
+    """Deliver existing notices to new students and students changing class"""
+    class_changed = instance.__dict__.pop("_class_changed", False)
+    if created or class_changed:
+        sync_student_deliveries(instance)
+
+
+@receiver(post_save, sender=Teacher)
+def deliver_teacher_notices(sender, instance, created, **kwargs):
+    """Deliver existing notices to new teachers"""
+    if created:
+        sync_teacher_deliveries(instance)
+
+
+def ensure_notice_search_index(sender, using, **kwargs):
+    """Restore the notice search triggers after migrations rebuild the table"""
+    ensure_search_index(using)
+
+
+@receiver(pre_save, sender=Notice)
+def note_public_notice(sender, instance, **kwargs):
+    """Remember whether an edited notice was public before the edit"""
+    instance._was_public = (
+        instance.notice_type != Notice.NoticeType.PUBLIC
+        and not instance._state.adding
+        and Notice.objects.filter(
+            pk=instance.pk, notice_type=Notice.NoticeType.PUBLIC
+        ).exists()
+    )
+
+
+@receiver(post_save, sender=Notice)
+@receiver(post_delete, sender=Notice)
+def purge_public_pages(sender, instance, **kwargs):
+    """Public notices appear on the homepage and news page"""
+    was_public = instance.__dict__.pop("_was_public", False)
+    if was_public or instance.notice_type == Notice.NoticeType.PUBLIC:
+        invalidate_public_pages()
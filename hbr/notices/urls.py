@@ -6,6 +6,7 @@ app_name = "notices"
 urlpatterns = [
     path("board/", views.notice_board, name="notice_board"),
     path("create/", views.create_notice, name="create_notice"),
+    path("search/", views.search_notice_board, name="search_notices"),
     path("search-students/", views.search_students, name="search_students"),
     path("bulk-delete/", views.bulk_delete_notices, name="bulk_delete_notices"),
     path("bulk-disable/", views.bulk_disable_notices, name="bulk_disable_notices"),
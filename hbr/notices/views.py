@@ -1,13 +1,23 @@
-from django.http import HttpRequest, HttpResponse, FileResponse, JsonResponse
+from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.db.models import Q
+from django.utils.cache import patch_cache_control
+from base.file_utils import serve_protected_file
+from base.pagination_utils import KeysetPage, keyset_json_response, paginate_keyset
 from base.views import get_user_role
-from .models import Notice
+from .models import Notice, NoticeDelivery
 from .forms import NoticeForm
-from students.models import Student
-from teachers.models import Teacher
+from .search_utils import search_notices
+from .delivery_utils import (
+    get_inbox,
+    invalidate_inbox_cache,
+    invalidate_notice_inboxes,
+)
+from students.search_utils import SEARCH_CACHE_TIMEOUT
+from students.search_utils import search_students as search_student_index
+from dashboard.models import ActivityEvent
+from dashboard.activity_utils import record_activity
 
 
 @login_required
@@ -15,64 +25,47 @@ def notice_board(request: HttpRequest):
     role = get_user_role(request.user)
     context = {}
 
-    if role == "Student":
-        try:
-            student = Student.objects.get(user=request.user)
-            # Get all active notices that are targeted to this student
-            notices = (
-                Notice.objects.filter(is_active=True)
-                .filter(
-                    Q(notice_type=Notice.NoticeType.PUBLIC)
-                    | Q(notice_type=Notice.NoticeType.ALL_STUDENTS)
-                    | Q(
-                        notice_type=Notice.NoticeType.CLASS_STUDENTS,
-                        target_class=student.classroom,
-                    )
-                    | Q(
-                        notice_type=Notice.NoticeType.INDIVIDUAL_STUDENT,
-                        target_students=student,
-                    )
-                )
-                .exclude(dismissed_by=request.user)
-                .order_by("-created_at")
-                .distinct()
-            )
-            context["notices"] = notices  # type: ignore
-            context["student"] = student  # type: ignore
-        except Student.DoesNotExist:
-            context["error"] = "Student profile not found"
-
-    elif role == "Teacher":
-        try:
-            teacher = Teacher.objects.get(user=request.user)
-            # Teachers see notices targeted to them
-            notices = (
-                Notice.objects.filter(is_active=True)
-                .filter(
-                    Q(notice_type=Notice.NoticeType.PUBLIC)
-                    | Q(notice_type=Notice.NoticeType.ALL_TEACHERS)
-                    | Q(
-                        notice_type=Notice.NoticeType.INDIVIDUAL_TEACHER,
-                        target_teachers=teacher,
-                    )
-                )
-                .exclude(dismissed_by=request.user)
-                .order_by("-created_at")
-            )
-            context["notices"] = notices  # type: ignore
-            context["teacher"] = teacher  # type: ignore
-        except Teacher.DoesNotExist:
-            context["error"] = "Teacher profile not found"
+    cursor = request.GET.get("cursor")
+
+    if role in ["Student", "Teacher"]:
+        # Students and teachers read their materialised inbox
+        inbox = get_inbox(request.user)
+        page = paginate_keyset(
+            inbox.select_related("notice"), ["-created_at", "-id"], cursor
+        )
+        page.object_list = [delivery.notice for delivery in page]
+        if inbox.filter(is_read=False).update(is_read=True):
+            invalidate_inbox_cache([request.user.id])
 
     elif role == "Admin":
         # Admins see all notices except system alerts
-        notices = Notice.objects.exclude(
-            notice_type=Notice.NoticeType.SYSTEM_ALERT
-        ).order_by("-created_at")
-        context["notices"] = notices  # type: ignore
-        context["role"] = role  # type: ignore
+        notices = (
+            Notice.objects.exclude(notice_type=Notice.NoticeType.SYSTEM_ALERT)
+            .select_related("target_class")
+            .prefetch_related("target_students", "target_teachers")
+        )
+        page = paginate_keyset(notices, ["-created_at", "-id"], cursor)
         context["form"] = NoticeForm()  # type: ignore
 
+    else:
+        page = KeysetPage([])
+
+    if request.GET.get("format") == "json":
+        return keyset_json_response(
+            page,
+            "notices",
+            lambda notice: {
+                "id": notice.id,
+                "title": notice.title,
+                "content": notice.content,
+                "notice_type": notice.get_notice_type_display(),
+                "created_at": notice.created_at.isoformat(),
+                "is_active": notice.is_active,
+                "has_attachment": bool(notice.attachment),
+            },
+        )
+
+    context["notices"] = page  # type: ignore
     context["role"] = role  # type: ignore
     return render(request, "notices/notice_board.html", context)
 
@@ -88,14 +81,16 @@ def download_notice_attachment(request: HttpRequest, notice_id: int):
         if not notice.attachment:
             return HttpResponse("No attachment found", status=404)
 
-        # Return the file using FileResponse for proper file serving
-        response = FileResponse(
-            notice.attachment.open("rb"), content_type="application/octet-stream"
-        )
-        response["Content-Disposition"] = (
-            f'attachment; filename="{notice.attachment.name.split("/")[-1]}"'
-        )
-        return response
+        # Only the notice's audience may download its attachment
+        if (
+            role != "Admin"
+            and not NoticeDelivery.objects.filter(
+                notice=notice, user=request.user
+            ).exists()
+        ):
+            return HttpResponse("Access denied", status=403)
+
+        return serve_protected_file(request, notice.attachment, as_attachment=True)
     except Notice.DoesNotExist:
         return HttpResponse("Notice not found", status=404)
 
@@ -120,6 +115,12 @@ def create_notice(request: HttpRequest):
                         updated_notice.attachment = None
                     updated_notice.save()
                     form.save_m2m()
+                    record_activity(
+                        ActivityEvent.EventType.NOTICE,
+                        f"Notice updated: {updated_notice.title}",
+                        actor=request.user,
+                        status="updated",
+                    )
                     messages.success(request, "Notice updated successfully.")
                     return redirect("notices:notice_board")
             except Notice.DoesNotExist:
@@ -133,6 +134,12 @@ def create_notice(request: HttpRequest):
                 notice.created_by = request.user
                 notice.save()
                 form.save_m2m()
+                record_activity(
+                    ActivityEvent.EventType.NOTICE,
+                    f"Notice published: {notice.title}",
+                    actor=request.user,
+                    status="published",
+                )
                 messages.success(request, "Notice created successfully.")
                 return redirect("notices:notice_board")
     else:
@@ -168,30 +175,27 @@ def search_students(request: HttpRequest):
     if not query:
         return JsonResponse({"students": []})
 
-    # Search students by name, roll number, or class
-    students = Student.objects.select_related("classroom", "user").filter(
-        Q(user__first_name__icontains=query)
-        | Q(user__last_name__icontains=query)
-        | Q(roll_no__icontains=query)
-        | Q(classroom__grade__icontains=query)
-        | Q(classroom__section__icontains=query)
-    )[
-        :20
-    ]  # Limit results
-
-    students_data = []
-    for student in students:
-        students_data.append(
-            {
-                "id": student.id,
-                "name": student.user.get_full_name(),
-                "roll_no": student.roll_no,
-                "classroom": str(student.classroom),
-                "display": f"{student.user.get_full_name()} (Roll: {student.roll_no}, Class: {student.classroom})",
-            }
-        )
+    # Prefix search on the student token index, cached per normalised query
+    response = JsonResponse({"students": search_student_index(query)})
+    patch_cache_control(response, private=True, max_age=SEARCH_CACHE_TIMEOUT)
+    return response
+
+
+@login_required
+def search_notice_board(request: HttpRequest):
+    """API endpoint for full-text notice search, scoped to the caller's notices"""
+    if request.method != "GET":
+        return JsonResponse({"error": "Method not allowed"}, status=405)
 
-    return JsonResponse({"students": students_data})
+    query = request.GET.get("q", "").strip()
+    if not query:
+        return JsonResponse({"notices": []})
+
+    role = get_user_role(request.user)
+    if role not in ["Admin", "Teacher", "Student"]:
+        return JsonResponse({"error": "Access denied"}, status=403)
+
+    return JsonResponse({"notices": search_notices(request.user, role, query)})
 
 
 @login_required
@@ -204,6 +208,10 @@ def bulk_disable_notices(request: HttpRequest):
         notice_ids = request.POST.getlist("notice_ids")
         if notice_ids:
             Notice.objects.filter(id__in=notice_ids).update(is_active=False)
+            NoticeDelivery.objects.filter(notice_id__in=notice_ids).update(
+                is_active=False
+            )
+            invalidate_notice_inboxes(notice_ids)
             messages.success(request, f"Disabled {len(notice_ids)} notice(s).")
         return redirect("notices:notice_board")
 
@@ -220,6 +228,10 @@ def bulk_enable_notices(request: HttpRequest):
         notice_ids = request.POST.getlist("notice_ids")
         if notice_ids:
             Notice.objects.filter(id__in=notice_ids).update(is_active=True)
+            NoticeDelivery.objects.filter(notice_id__in=notice_ids).update(
+                is_active=True
+            )
+            invalidate_notice_inboxes(notice_ids)
             messages.success(request, f"Enabled {len(notice_ids)} notice(s).")
         return redirect("notices:notice_board")
 
@@ -234,26 +246,16 @@ def dismiss_notice(request: HttpRequest, notice_id: int):
 
     try:
         notice = Notice.objects.get(id=notice_id, is_active=True)
-        # Check if user can see this notice
-        role = get_user_role(request.user)
-        can_dismiss = False
-        if role == "Student":
-            student = Student.objects.get(user=request.user)
-            can_dismiss = notice.target_students.filter(id=student.id).exists()
-        elif role == "Teacher":
-            teacher = Teacher.objects.get(user=request.user)
-            can_dismiss = notice.target_teachers.filter(id=teacher.id).exists()
-        elif role == "Admin":
-            can_dismiss = True
-
-        if can_dismiss:
+        # Users can dismiss notices delivered to them; admins can dismiss any
+        dismissed = NoticeDelivery.objects.filter(
+            notice=notice, user=request.user
+        ).update(is_read=True, is_dismissed=True)
+
+        if dismissed or get_user_role(request.user) == "Admin":
             notice.dismissed_by.add(request.user)
+            invalidate_inbox_cache([request.user.id])
             return JsonResponse({"success": True})
         else:
             return JsonResponse({"error": "Cannot dismiss this notice"}, status=403)
     except Notice.DoesNotExist:
         return JsonResponse({"error": "Notice not found"}, status=404)
-    except Student.DoesNotExist:
-        return JsonResponse({"error": "Student profile not found"}, status=404)
-    except Teacher.DoesNotExist:
-        return JsonResponse({"error": "Teacher profile not found"}, status=404)
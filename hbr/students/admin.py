@@ -1,4 +1,4 @@
-from django.contrib import admin
+from django.contrib import admin, messages
 
 from .models import (
     Certificate,
@@ -20,21 +20,37 @@ class CertificateAdmin(admin.ModelAdmin):
     actions = ["approve_certificates", "reject_certificates"]
 
     def approve_certificates(self, request, queryset):
-        from .pdf_utils import generate_certificate_pdf
-        from django.core.files.base import ContentFile
+        from .certificate_utils import (
+            BACKGROUND_APPROVAL_THRESHOLD,
+            approve_certificates,
+            approve_certificates_in_background,
+            describe_failures,
+            get_pending_certificates,
+        )
 
-        for certificate in queryset.filter(status="PENDING"):
-            buffer = generate_certificate_pdf(
-                certificate.student, certificate.certificate_type
+        pending_ids = list(
+            queryset.filter(status="PENDING").values_list("id", flat=True)
+        )
+        if len(pending_ids) > BACKGROUND_APPROVAL_THRESHOLD:
+            approve_certificates_in_background(pending_ids, request.user)
+            self.message_user(
+                request,
+                f"Approving {len(pending_ids)} certificates in the background. "
+                "A system alert will report the result.",
             )
-            filename = f"{certificate.certificate_type.name.replace(' ', '_')}_{certificate.student.roll_no}.pdf"
-            certificate.file.save(filename, ContentFile(buffer.getvalue()))
-            certificate.status = "APPROVED"
-            certificate.save()
+            return
+
+        approved, failed = approve_certificates(get_pending_certificates(pending_ids))
         self.message_user(
             request,
-            f"{queryset.filter(status='PENDING').count()} certificates approved and generated.",
+            f"{len(approved)} certificates approved and generated.",
         )
+        if failed:
+            self.message_user(
+                request,
+                f"{len(failed)} certificates failed:\n{describe_failures(failed)}",
+                level=messages.ERROR,
+            )
 
     def reject_certificates(self, request, queryset):
         updated = queryset.filter(status="PENDING").update(status="REJECTED")
@@ -0,0 +1,120 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from django.core.files.base import ContentFile
+from django.db import close_old_connections, connections
+from base.pdf import generate_certificate_pdfs
+from notices.models import Notice
+from .models import Certificate
+
+# Larger approvals than this run after the request returns; the admin gets a
+# system alert with the outcome instead of waiting on the renders
+BACKGROUND_APPROVAL_THRESHOLD = 20
+
+# One approval job at a time: each already fans its renders out over the
+# renderer pool, so parallel jobs would only queue behind each other there
+_approval_executor = None
+_approval_executor_lock = threading.Lock()
+
+
+def get_certificate_filename(certificate):
+    return f"{certificate.certificate_type.name.replace(' ', '_')}_{certificate.student.roll_no}.pdf"
+
+
+def approve_certificates(certificates):
+    """Render, store and approve certificates, one render batch per type.
+
+    Statuses are written with a single bulk_update once every file is saved.
+    A certificate that fails to render or save stays pending.
+
+    Returns:
+        (approved certificates, [(certificate, error message), ...])
+    """
+    by_type = {}
+    for certificate in certificates:
+        by_type.setdefault(certificate.certificate_type, []).append(certificate)
+
+    approved = []
+    failed = []
+    for certificate_type, group in by_type.items():
+        try:
+            buffers = generate_certificate_pdfs(
+                [certificate.student for certificate in group],
+                certificate_type,
+                return_exceptions=True,
+            )
+        except Exception as e:
+            # The type's template itself is broken
+            failed.extend((certificate, str(e)) for certificate in group)
+            continue
+
+        for certificate, buffer in zip(group, buffers):
+            if isinstance(buffer, Exception):
+                failed.append((certificate, str(buffer)))
+                continue
+            try:
+                certificate.file.save(
+                    get_certificate_filename(certificate),
+                    ContentFile(buffer.getvalue()),
+                    save=False,
+                )
+            except Exception as e:
+                failed.append((certificate, str(e)))
+                continue
+            certificate.status = Certificate.Status.APPROVED
+            approved.append(certificate)
+
+    Certificate.objects.bulk_update(approved, ["file", "status"], batch_size=500)
+    return approved, failed
+
+
+def get_pending_certificates(certificate_ids):
+    return list(
+        Certificate.objects.filter(
+            id__in=certificate_ids, status=Certificate.Status.PENDING
+        )
+        .select_related("student__user", "student__classroom", "certificate_type")
+        .order_by("certificate_type_id", "id")
+    )
+
+
+def describe_failures(failed):
+    return "\n".join(
+        f"{certificate.student} - {certificate.certificate_type.name}: {error}"
+        for certificate, error in failed
+    )
+
+
+def run_background_approval(certificate_ids, user):
+    close_old_connections()
+    try:
+        approved, failed = approve_certificates(
+            get_pending_certificates(certificate_ids)
+        )
+        content = f"{len(approved)} certificates approved and generated."
+        if failed:
+            content += f"\n\n{len(failed)} failed:\n{describe_failures(failed)}"
+        Notice.objects.create(
+            title="Certificate approval finished",
+            content=content,
+            notice_type=Notice.NoticeType.SYSTEM_ALERT,
+            created_by=user,
+        )
+    except Exception as e:
+        print(f"Error approving certificates: {e}")
+    finally:
+        # The worker thread outlives the job; don't leave its connection open
+        connections.close_all()
+
+
+def approve_certificates_in_background(certificate_ids, user):
+    """Queue an approval job; its outcome arrives as a system alert"""
+    global _approval_executor
+    if _approval_executor is None:
+        with _approval_executor_lock:
+            if _approval_executor is None:
+                _approval_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="certificate-approval"
+                )
+    return _approval_executor.submit(
+        run_background_approval, list(certificate_ids), user
+    )
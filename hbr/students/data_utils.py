@@ -3,12 +3,15 @@ Data utilities for student-related operations.
 Contains helper functions for data processing, PDF generation, and business logic.
 """
 
+from datetime import date
 from django.http import HttpResponse
 from django.contrib import messages
-from .pdf_utils import (
-    generate_student_profile_pdf,
-    generate_payment_receipt_pdf,
+from base.pdf_cache_utils import (
+    get_or_render_pdf,
+    model_fingerprint,
+    user_fingerprint,
 )
+from base.pdf import generate_payment_receipt_pdf, generate_student_profile_pdf
 from .models import (
     Document,
     CertificateType,
@@ -129,19 +132,35 @@ def validate_payment_receipt_download(student, payment_id):
         return None
 
 
-def generate_profile_pdf_response(student_data, user_data, username):
+def generate_profile_pdf_response(student_data, user_data, username, student):
     """Generate and return PDF response for student profile."""
-    buffer = generate_student_profile_pdf(student_data, user_data)
+    pdf = get_or_render_pdf(
+        "profile",
+        [student_data, user_data],
+        [student],
+        lambda: generate_student_profile_pdf(student_data, user_data),
+    )
 
-    response = HttpResponse(buffer, content_type="application/pdf")
+    response = HttpResponse(pdf, content_type="application/pdf")
     response["Content-Disposition"] = f'attachment; filename="{username}_profile.pdf"'
     return response
 
 
 def generate_receipt_pdf_response(payment):
     """Generate and return PDF response for payment receipt."""
-    buffer = generate_payment_receipt_pdf(payment)
+    student = payment.student
+    pdf = get_or_render_pdf(
+        "receipt",
+        [
+            model_fingerprint(payment),
+            model_fingerprint(student),
+            user_fingerprint(student.user),
+            date.today(),  # printed as the receipt date
+        ],
+        [payment, student],
+        lambda: generate_payment_receipt_pdf(payment),
+    )
 
-    response = HttpResponse(buffer, content_type="application/pdf")
+    response = HttpResponse(pdf, content_type="application/pdf")
     response["Content-Disposition"] = f'attachment; filename="receipt_{payment.id}.pdf"'
     return response
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:04
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("students", "0008_alter_student_mobile_no"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StudentSearchToken",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("token", models.CharField(max_length=150)),
+                (
+                    "student",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="search_tokens",
+                        to="students.student",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("token", "student")},
+            },
+        ),
+    ]
@@ -0,0 +1,57 @@
+import re
+from django.db import migrations
+
+# Frozen copy of students.search_utils.get_student_tokens as of this
+# migration, so it replays the same way however the live tokenizer changes
+
+
+def get_search_terms(query):
+    return re.findall(r"\w+", str(query).lower())
+
+
+def get_student_tokens(
+    first_name, last_name, username, roll_no, admission_no, grade, section
+):
+    tokens = set()
+    for value in (first_name, last_name, username, roll_no, admission_no):
+        tokens.update(get_search_terms(value))
+    class_terms = get_search_terms(f"{grade} {section or ''}")
+    tokens.update(class_terms)
+    if len(class_terms) > 1:
+        tokens.add("".join(class_terms))
+    return {token[:150] for token in tokens}
+
+
+def backfill_student_search_tokens(apps, schema_editor):
+    """Index students created before the search token table"""
+    Student = apps.get_model("students", "Student")
+    StudentSearchToken = apps.get_model("students", "StudentSearchToken")
+
+    tokens = []
+    for student in Student.objects.select_related("user", "classroom").iterator():
+        tokens.extend(
+            StudentSearchToken(student_id=student.id, token=token)
+            for token in get_student_tokens(
+                student.user.first_name,
+                student.user.last_name,
+                student.user.username,
+                student.roll_no,
+                student.admission_no,
+                student.classroom.grade,
+                student.classroom.section,
+            )
+        )
+    StudentSearchToken.objects.bulk_create(
+        tokens, batch_size=1000, ignore_conflicts=True
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("students", "0009_studentsearchtoken"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_student_search_tokens, migrations.RunPython.noop),
+    ]
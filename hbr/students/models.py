@@ -95,10 +95,33 @@ class Student(models.Model):
         related_name="students",
     )
 
+    class Meta:
+        # Keyset pagination of student management sorted by roll number
+        indexes = [models.Index(fields=["roll_no", "id"], name="student_roll_idx")]
+
     def __str__(self):
         return self.user.get_full_name()
 
 
+class StudentSearchToken(models.Model):
+    """A lowercased word a student can be found by (name, roll no, class).
+
+    Maintained by students.search_utils so that search boxes can run indexed
+    prefix lookups instead of scanning the student and user tables.
+    """
+
+    student = models.ForeignKey(
+        Student, on_delete=models.CASCADE, related_name="search_tokens"
+    )
+    token = models.CharField(max_length=150)
+
+    class Meta:
+        unique_together = ("token", "student")
+
+    def __str__(self):
+        return f"{self.student} - {self.token}"
+
+
 def student_document_path(instance, filename):
     return f"students/{instance.student.roll_no}/documents/{filename}"
 
@@ -0,0 +1,107 @@
+import re
+from django.core.cache import cache
+from .models import Student, StudentSearchToken
+
+SEARCH_CACHE_TIMEOUT = 60
+SEARCH_VERSION_KEY = "students:search:version"
+
+
+def get_search_terms(query):
+    """Split a search box query into lowercased word tokens"""
+    return re.findall(r"\w+", str(query).lower())
+
+
+def get_student_tokens(
+    first_name, last_name, username, roll_no, admission_no, grade, section
+):
+    """Every token a student should be findable by"""
+    tokens = set()
+    for value in (first_name, last_name, username, roll_no, admission_no):
+        tokens.update(get_search_terms(value))
+    class_terms = get_search_terms(f"{grade} {section or ''}")
+    tokens.update(class_terms)
+    if len(class_terms) > 1:
+        # "10a" as well as "10" and "a"
+        tokens.add("".join(class_terms))
+    return {token[:150] for token in tokens}
+
+
+def index_students(students):
+    """Rebuild the search tokens of the given students"""
+    students = list(students.select_related("user", "classroom"))
+    StudentSearchToken.objects.filter(student__in=students).delete()
+    StudentSearchToken.objects.bulk_create(
+        [
+            StudentSearchToken(student=student, token=token)
+            for student in students
+            for token in get_student_tokens(
+                student.user.first_name,
+                student.user.last_name,
+                student.user.username,
+                student.roll_no,
+                student.admission_no,
+                student.classroom.grade if student.classroom_id else "",
+                student.classroom.section if student.classroom_id else "",
+            )
+        ],
+        batch_size=1000,
+    )
+    bump_search_version()
+
+
+def reindex_students(student_ids):
+    """Rebuild the search tokens of students after a bulk update"""
+    index_students(Student.objects.filter(id__in=student_ids))
+
+
+def filter_students(queryset, query):
+    """Narrow a Student queryset to those matching every word of ``query``.
+
+    Each word is matched as a prefix of a name, username, roll/admission
+    number or class token, using index range lookups on the token table.
+    """
+    for term in get_search_terms(query):
+        queryset = queryset.filter(
+            id__in=StudentSearchToken.objects.filter(
+                token__gte=term, token__lt=term + "\uffff"
+            ).values("student_id")
+        )
+    return queryset
+
+
+def get_search_version():
+    return cache.get_or_set(SEARCH_VERSION_KEY, 1, None)
+
+
+def bump_search_version():
+    """Invalidate every cached search response"""
+    try:
+        cache.incr(SEARCH_VERSION_KEY)
+    except ValueError:
+        cache.set(SEARCH_VERSION_KEY, 1, None)
+
+
+def search_students(query, limit=20):
+    """Autocomplete payload for a query, cached per normalised query"""
+    terms = get_search_terms(query)
+    if not terms:
+        return []
+
+    key = f"students:search:{get_search_version()}:{' '.join(terms)}:{limit}"
+    results = cache.get(key)
+    if results is None:
+        students = filter_students(
+            Student.objects.select_related("classroom", "user"), query
+        )[:limit]
+        results = [
+            {
+                "id": student.id,
+                "name": student.user.get_full_name(),
+                "roll_no": student.roll_no,
+                "classroom": str(student.classroom),
+                "display": f"{student.user.get_full_name()} (Roll: {student.roll_no}, Class: {student.classroom})",
+            }
+            for student in students
+        ]
+        cache.set(key, results, SEARCH_CACHE_TIMEOUT)
+    return results
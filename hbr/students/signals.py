@@ -0,0 +1,50 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from base.pdf import invalidate_certificate_template
+from base.pdf_cache_utils import invalidate_pdf_cache
+from .models import CertificateType, Classroom, Payment, Student
+from .search_utils import index_students
+
+NAME_FIELDS = {"first_name", "last_name", "username"}
+
+
+@receiver(post_save, sender=Student)
+def index_student(sender, instance, **kwargs):
+    """Keep a student's search tokens current"""
+    index_students(Student.objects.filter(id=instance.id))
+
+
+@receiver(post_save, sender=User)
+def index_student_user(sender, instance, created, update_fields=None, **kwargs):
+    """Re-index students whose name or username changed"""
+    if created or (update_fields is not None and not NAME_FIELDS & set(update_fields)):
+        return
+    students = Student.objects.filter(user=instance)
+    if students.exists():
+        index_students(students)
+
+
+@receiver(post_save, sender=Classroom)
+def index_classroom_students(sender, instance, created, **kwargs):
+    """Re-index a classroom's students when its grade or section changes"""
+    if not created:
+        index_students(instance.student.all())
+
+
+@receiver(post_delete, sender=Student)
+@receiver(post_delete, sender=Payment)
+def purge_cached_pdfs(sender, instance, **kwargs):
+    """Drop cached PDFs of a deleted student or payment.
+
+    Edits need no purge: cache keys fingerprint every printed field, so a
+    changed record renders under a new key and LRU eviction drops the old one.
+    """
+    invalidate_pdf_cache(sender, instance.pk)
+
+
+@receiver(post_save, sender=CertificateType)
+@receiver(post_delete, sender=CertificateType)
+def purge_certificate_template(sender, instance, **kwargs):
+    """Drop the compiled template of an edited or deleted certificate type"""
+    invalidate_certificate_template(instance.pk)
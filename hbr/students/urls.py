@@ -12,6 +12,21 @@ urlpatterns = [
         views.cancel_certificate,
         name="cancel_certificate",
     ),
+    path(
+        "documents/file/<int:document_id>/",
+        views.download_document,
+        name="download_document",
+    ),
+    path(
+        "certificates/file/<int:certificate_id>/",
+        views.download_certificate,
+        name="download_certificate",
+    ),
+    path(
+        "timetables/<str:kind>/<int:timetable_id>/file/",
+        views.download_timetable,
+        name="download_timetable",
+    ),
     path("payments/", views.payments, name="payments"),
     path(
         "download-receipt/<int:payment_id>/",
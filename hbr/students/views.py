@@ -12,7 +12,10 @@ import openpyxl
 import pdfkit
 from academics.models import Exam, ExamResult
 from academics.views import get_current_session
+from base.file_utils import serve_protected_file
+from base.pagination_utils import keyset_json_response, paginate_keyset
 from base.views import get_user_role
+from .search_utils import filter_students, reindex_students
 from .forms import (
     StudentProfileForm,
     StudentUserCreationForm,
@@ -44,12 +47,12 @@ from .data_utils import (
     get_student_documents,
     get_student_certificates,
     get_student_payments,
-)
-from .generation_utils import (
     prepare_student_profile_data,
     generate_profile_pdf_response,
     validate_payment_receipt_download,
     generate_receipt_pdf_response,
+)
+from .generation_utils import (
     process_certificate_actions,
 )
 
@@ -99,23 +102,13 @@ def profile(request: HttpRequest):
                 )
 
             if "profile_photo" in request.FILES:
-                # Delete old image if it exists
-                if student.profile_photo:
-                    import os
-                    from django.conf import settings
-
-                    old_image_path = os.path.join(
-                        settings.MEDIA_ROOT, str(student.profile_photo)
-                    )
-                    if os.path.exists(old_image_path):
-                        try:
-                            os.remove(old_image_path)
-                        except OSError:
-                            pass  # Ignore if file doesn't exist or can't be deleted
-
+                old_photo = student.profile_photo.name
                 form = StudentProfileForm(request.POST, request.FILES, instance=student)
                 if form.is_valid():
                     form.save()
+                    # Through the storage, so a deduplicated blob is released
+                    if old_photo and old_photo != student.profile_photo.name:
+                        student.profile_photo.storage.delete(old_photo)
                     return JsonResponse(
                         {
                             "success": True,
@@ -179,6 +172,58 @@ def certificates(request: HttpRequest):
     return render(request, "students/certificates.html", context)
 
 
+def can_access_student_file(user, student):
+    """Staff can open any student's files; students only their own"""
+    return get_user_role(user) in ["Admin", "Teacher"] or student.user_id == user.id
+
+
+@login_required
+def download_document(request: HttpRequest, document_id: int):
+    document = get_object_or_404(
+        Document.objects.select_related("student"), id=document_id
+    )
+    if not can_access_student_file(request.user, document.student):
+        return HttpResponse("Access denied", status=403)
+    return serve_protected_file(
+        request, document.file, as_attachment="download" in request.GET
+    )
+
+
+@login_required
+def download_certificate(request: HttpRequest, certificate_id: int):
+    certificate = get_object_or_404(
+        Certificate.objects.select_related("student"), id=certificate_id
+    )
+    if not can_access_student_file(request.user, certificate.student):
+        return HttpResponse("Access denied", status=403)
+    if not certificate.file:
+        return HttpResponse("Certificate file not found", status=404)
+    return serve_protected_file(
+        request, certificate.file, as_attachment="download" in request.GET
+    )
+
+
+@login_required
+def download_timetable(request: HttpRequest, kind: str, timetable_id: int):
+    timetable_models = {"daily": DailyTimetable, "exam": ExamTimetable}
+    if kind not in timetable_models:
+        return HttpResponse("Timetable not found", status=404)
+    timetable = get_object_or_404(timetable_models[kind], id=timetable_id)
+
+    if (
+        get_user_role(request.user) == "Student"
+        and not Student.objects.filter(
+            user=request.user, classroom_id=timetable.classroom_id
+        ).exists()
+    ):
+        return HttpResponse("Access denied", status=403)
+    if not timetable.timetable_file:
+        return HttpResponse("Timetable file not found", status=404)
+    return serve_protected_file(
+        request, timetable.timetable_file, as_attachment="download" in request.GET
+    )
+
+
 @login_required
 def payments(request: HttpRequest):
     role = get_user_role(request.user)
@@ -258,7 +303,9 @@ def download_profile_pdf(request: HttpRequest):
         return HttpResponse("Student profile not found", status=404)
 
     student_data, user_data = prepare_student_profile_data(student, request.user)
-    return generate_profile_pdf_response(student_data, user_data, request.user.username)
+    return generate_profile_pdf_response(
+        student_data, user_data, request.user.username, student
+    )
 
 
 @login_required
@@ -303,10 +350,12 @@ def manage_class_students(request: HttpRequest, classroom_id: int):
         if action == "assign":
             # Assign selected students to this classroom
             Student.objects.filter(id__in=student_ids).update(classroom=classroom)
+            reindex_students(student_ids)
         elif action == "remove":
             # Remove selected students from this classroom (assign to a default or None)
             # For now, we'll just remove them - they can be reassigned later
             Student.objects.filter(id__in=student_ids).update(classroom=None)
+            reindex_students(student_ids)
 
     # Get all students and current classroom students
     all_students = Student.objects.select_related("user", "classroom").order_by(
@@ -446,6 +495,19 @@ def manage_teacher_notifications(request: HttpRequest, classroom_id: int):
     return render(request, "students/manage_teacher_notifications.html", context)
 
 
+# Sort options offered on the student management page, each ending in a
+# unique key for keyset pagination. The roll number orders seek on
+# student_roll_idx, so every page costs the same; the name orders sort the
+# student/user join on each page, which is why they aren't the default.
+STUDENT_ORDERINGS = {
+    "roll_no": ["roll_no", "id"],
+    "-roll_no": ["-roll_no", "-id"],
+    "user__first_name": ["user__first_name", "id"],
+    "-user__first_name": ["-user__first_name", "-id"],
+}
+DEFAULT_STUDENT_ORDERING = "roll_no"
+
+
 @login_required
 def student_management(request: HttpRequest):
     """Admin view for managing students"""
@@ -454,14 +516,12 @@ def student_management(request: HttpRequest):
     if role != "Admin":
         return HttpResponse("Access denied", status=403)
 
-    from django.core.paginator import Paginator
-    from django.db.models import Q
-
     # Get filter parameters
     selected_classes = request.GET.getlist("classroom")
     search_query = request.GET.get("search", "").strip()
-    order_by = request.GET.get("order", "user__first_name")
-    page_number = request.GET.get("page", 1)
+    order_by = request.GET.get("order", DEFAULT_STUDENT_ORDERING)
+    if order_by not in STUDENT_ORDERINGS:
+        order_by = DEFAULT_STUDENT_ORDERING
 
     # Base queryset
     students = Student.objects.select_related("user", "classroom")
@@ -472,21 +532,26 @@ def student_management(request: HttpRequest):
 
     # Apply search filter
     if search_query:
-        students = students.filter(
-            Q(user__first_name__icontains=search_query)
-            | Q(user__last_name__icontains=search_query)
-            | Q(user__username__icontains=search_query)
-        )
-
-    # Apply ordering
-    if order_by.startswith("-"):
-        students = students.order_by(order_by, "user__first_name")
-    else:
-        students = students.order_by(order_by, "user__first_name")
+        students = filter_students(students, search_query)
 
-    # Pagination
-    paginator = Paginator(students, 15)  # 15 students per page
-    page_obj = paginator.get_page(page_number)
+    # Keyset pagination: 15 students per page, no COUNT(*) or OFFSET
+    page_obj = paginate_keyset(
+        students, STUDENT_ORDERINGS[order_by], request.GET.get("cursor"), 15
+    )
+    if request.GET.get("format") == "json":
+        return keyset_json_response(
+            page_obj,
+            "students",
+            lambda student: {
+                "id": student.id,
+                "name": student.user.get_full_name(),
+                "username": student.user.username,
+                "roll_no": student.roll_no,
+                "father_name": student.father_name,
+                "gender": student.gender,
+                "classroom": str(student.classroom),
+            },
+        )
 
     # Get all classrooms for filter dropdown
     def get_grade_number(grade):
@@ -925,13 +990,7 @@ def export_students(request: HttpRequest):
 
     # Apply search filter
     if search_query:
-        from django.db.models import Q
-
-        students = students.filter(
-            Q(user__first_name__icontains=search_query)
-            | Q(user__last_name__icontains=search_query)
-            | Q(user__username__icontains=search_query)
-        )
+        students = filter_students(students, search_query)
 
     students = students.order_by("user__first_name")
 
@@ -1454,7 +1513,9 @@ def promote_students(request: HttpRequest):
                     )
 
             # Promote students
+            promoted_ids = list(students_to_promote.values_list("id", flat=True))
             promoted_count = students_to_promote.update(classroom=to_classroom)
+            reindex_students(promoted_ids)
 
             messages.success(
                 request,
@@ -56,23 +56,13 @@ def profile(request: HttpRequest):
                 )
 
             if "profile_photo" in request.FILES:
-                # Delete old image if it exists
-                if teacher.profile_photo:
-                    import os
-                    from django.conf import settings
-
-                    old_image_path = os.path.join(
-                        settings.MEDIA_ROOT, str(teacher.profile_photo)
-                    )
-                    if os.path.exists(old_image_path):
-                        try:
-                            os.remove(old_image_path)
-                        except OSError:
-                            pass  # Ignore if file doesn't exist or can't be deleted
-
+                old_photo = teacher.profile_photo.name
                 # Simple file handling for teacher profile photo
                 teacher.profile_photo = request.FILES["profile_photo"]
                 teacher.save()
+                # Through the storage, so a deduplicated blob is released
+                if old_photo and old_photo != teacher.profile_photo.name:
+                    teacher.profile_photo.storage.delete(old_photo)
                 return JsonResponse(
                     {
                         "success": True,